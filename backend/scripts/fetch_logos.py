@@ -6,6 +6,17 @@ import logging
 import httpx
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Add project root to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), "../"))
 
@@ -18,8 +29,9 @@ logger = logging.getLogger(__name__)
 
 DATA_FILE = os.path.join(os.path.dirname(__file__), "../data/team_logos.json")
 BASE_URL = "http://site.api.espn.com/apis/site/v2/sports/soccer"
+MAX_CONCURRENT_REQUESTS = 10  # Cap in-flight requests to avoid ESPN rate limiting
 
-async def fetch_league_teams(client, league_code, slug):
+async def fetch_league_teams(client, league_code, slug, semaphore):
     """Fetch all teams for a given league slug."""
     url = f"{BASE_URL}/{slug}/teams"
     logger.info(f"Fetching teams for {league_code} ({slug})...")
@@ -27,7 +39,8 @@ async def fetch_league_teams(client, league_code, slug):
     try:
         # ESPN API usually restricts result size, but for teams it often returns all for a league
         # If pagination is needed, we might need 'limit=1000'
-        response = await client.get(url, params={"limit": 1000})
+        async with semaphore:
+            response = await client.get(url, params={"limit": 1000})
         response.raise_for_status()
         data = response.json()
         
@@ -60,8 +73,11 @@ async def fetch_league_teams(client, league_code, slug):
             
             teams_data[normalized_name] = logo_url
             
-            # Also save raw name just in case
-            teams_data[name.lower()] = logo_url
+            # Also save raw lowercased name, but only when lookups could not
+            # already reach it through the normalized key
+            lower = name.lower()
+            if lower != normalized_name:
+                teams_data[lower] = logo_url
             
         return teams_data
 
@@ -78,21 +94,34 @@ async def main():
     # For now, let's overwrite to ensure freshness, or merge?
     # Overwrite is cleaner to remove stale data.
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        tasks = []
-        for code, slug in ESPN_LEAGUE_MAPPING.items():
-            tasks.append(fetch_league_teams(client, code, slug))
-            
-        results = await asyncio.gather(*tasks)
+    # Single pooled client: keep-alive (and HTTP/2 multiplexing when h2 is installed)
+    # reuses one TLS handshake across all league requests.
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENT_REQUESTS,
+        max_keepalive_connections=MAX_CONCURRENT_REQUESTS
+    )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async with httpx.AsyncClient(timeout=30.0, limits=limits, http2=HTTP2_AVAILABLE) as client:
+        tasks = [
+            asyncio.create_task(fetch_league_teams(client, code, slug, semaphore))
+            for code, slug in ESPN_LEAGUE_MAPPING.items()
+        ]
         
-        for res in results:
-            all_logos.update(res)
+        # Merge each league as soon as it arrives instead of holding every
+        # per-league dict until the slowest league finishes
+        for next_done in asyncio.as_completed(tasks):
+            all_logos.update(await next_done)
             
     logger.info(f"Total logos fetched: {len(all_logos)}")
     
-    # Save to JSON
-    with open(DATA_FILE, "w") as f:
-        json.dump(all_logos, f, indent=2)
+    # Save to JSON (orjson writes UTF-8 bytes directly, stdlib json as fallback)
+    if orjson is not None:
+        with open(DATA_FILE, "wb") as f:
+            f.write(orjson.dumps(all_logos, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(DATA_FILE, "w") as f:
+            json.dump(all_logos, f, indent=2, sort_keys=True)
         
     logger.info(f"Saved logo mappings to {DATA_FILE}")
 
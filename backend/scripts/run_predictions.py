@@ -8,24 +8,33 @@ import sys
 import os
 import asyncio
 import logging
+import logging.handlers
+import queue
 from datetime import datetime, timedelta
+from typing import Optional
 
 # Add parent directory to path to import from src
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scripts.worker_config import (
-    DATABASE_URL, LEAGUES_TO_PROCESS, LOG_LEVEL, LOG_FORMAT,
-    DAYS_BACK, PREDICTION_LIMIT
+    DATABASE_URL, LEAGUES_TO_PROCESS, LEAGUE_ENTRIES, LOG_LEVEL, LOG_FORMAT,
+    DAYS_BACK, PREDICTION_LIMIT, MAX_WORKERS,
+    MAX_CONCURRENT_PICKS, ENABLE_WORKER_CACHE, CACHE_TTL_SECONDS
 )
 
 # Configure logging
+# Records are formatted on the event loop thread and written by a background listener,
+# so stdout/file I/O never blocks the worker's coroutines
+log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
     format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('worker.log')
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
+)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('worker.log')
 )
 logger = logging.getLogger(__name__)
 
@@ -50,7 +59,12 @@ async def main():
             get_cache_service,
             get_learning_service
         )
-        from src.application.use_cases.use_cases import GetPredictionsUseCase
+        from src.application.use_cases.use_cases import (
+            GetPredictionsUseCase,
+            GetSuggestedPicksUseCase,
+            GetTopMLPicksUseCase
+        )
+        from src.domain.entities.entities import Match, Team, League
         
         # Initialize services
         logger.info("📦 Initializing services...")
@@ -64,7 +78,7 @@ async def main():
         
         # Ensure database tables exist
         logger.info("🗄️  Creating/verifying database tables...")
-        persistence_repo.create_tables()
+        await asyncio.to_thread(persistence_repo.create_tables)
         
         # Step 1: Run ML Training Pipeline
         logger.info("\n" + "=" * 80)
@@ -85,8 +99,8 @@ async def main():
         
         # Save training results to database
         logger.info("💾 Saving training results to database...")
-        training_data = training_result.model_dump() if hasattr(training_result, 'model_dump') else training_result.dict()
-        persistence_repo.save_training_result("latest_daily", training_data)
+        training_data = training_result.model_dump()
+        await asyncio.to_thread(persistence_repo.save_training_result, "latest_daily", training_data)
         
         # Step 2: Generate Predictions for All Leagues
         logger.info("\n" + "=" * 80)
@@ -100,76 +114,95 @@ async def main():
             persistence_repository=persistence_repo
         )
         
-        predictions_saved = 0
-        total_picks_saved = 0
-        for idx, league_id in enumerate(LEAGUES_TO_PROCESS, 1):
+        # Constructor args are loop-invariant, so one instance serves every league
+        picks_use_case = GetSuggestedPicksUseCase(
+            data_sources=data_sources,
+            prediction_service=prediction_service,
+            statistics_service=statistics_service,
+            learning_service=learning_service,
+            cache_service=cache_service
+        )
+        
+        # Shared across leagues so total in-flight pick generations stay bounded
+        picks_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PICKS)
+        
+        async def process_league(idx: int, league_id: str, meta: dict) -> tuple[int, int]:
+            """Generate and persist predictions and picks for one league. Returns (predictions, picks) saved."""
+            logger.info(f"\n[{idx}/{len(LEAGUE_ENTRIES)}] Processing {league_id} ({meta['name']}, {meta['country']})...")
+            
+            # OPTIMIZATION: Bulk fetch history for this league to avoid N+1 calls in picks generation
+            league_history_map = {}
             try:
-                logger.info(f"\n[{idx}/{len(LEAGUES_TO_PROCESS)}] Processing {league_id}...")
-                
-                # OPTIMIZATION: Bulk fetch history for this league to avoid N+1 calls in picks generation
-                league_history_map = {}
-                try:
-                    if data_sources.football_data_org.is_configured:
-                        date_to = datetime.now().strftime("%Y-%m-%d")
-                        date_from = (datetime.now() - timedelta(days=60)).strftime("%Y-%m-%d")
-                        
-                        logger.info(f"   📥 Bulk fetching history for {league_id} ({date_from} to {date_to})...")
-                        bulk_matches = await data_sources.football_data_org.get_league_matches(
-                            league_id, date_from, date_to, status="FINISHED"
-                        )
-                        
-                        if bulk_matches:
-                            for m in bulk_matches:
-                                h_norm = statistics_service._normalize_name(m.home_team.name)
-                                a_norm = statistics_service._normalize_name(m.away_team.name)
-                                
-                                if h_norm not in league_history_map: league_history_map[h_norm] = []
-                                if a_norm not in league_history_map: league_history_map[a_norm] = []
-                                
-                                league_history_map[h_norm].append(m)
-                                league_history_map[a_norm].append(m)
-                            logger.info(f"   ✓ Pre-loaded history for {len(league_history_map)} teams")
-                except Exception as bulk_error:
-                    logger.warning(f"   ⚠️ Bulk fetch failed, will use fallback: {bulk_error}")
-
-                # Generate predictions
-                predictions_dto = await use_case.execute(league_id, limit=PREDICTION_LIMIT)
-                
-                # Save to database
-                league_cache_key = f"forecasts:league_{league_id}"
-                persistence_repo.save_training_result(
-                    league_cache_key,
-                    predictions_dto.model_dump() if hasattr(predictions_dto, 'model_dump') else predictions_dto.dict()
-                )
-                
-                # Save individual match predictions
-                for match_pred in predictions_dto.predictions:
-                    match_data = match_pred.model_dump() if hasattr(match_pred, 'model_dump') else match_pred.dict()
-                    persistence_repo.save_match_prediction(
-                        match_id=match_pred.match.id,
-                        league_id=league_id,
-                        data=match_data,
-                        ttl_seconds=7 * 24 * 3600  # 7 days
+                if data_sources.football_data_org.is_configured:
+                    date_to = datetime.now().strftime("%Y-%m-%d")
+                    date_from = (datetime.now() - timedelta(days=60)).strftime("%Y-%m-%d")
+                    
+                    logger.info(f"   📥 Bulk fetching history for {league_id} ({date_from} to {date_to})...")
+                    bulk_matches = await data_sources.football_data_org.get_league_matches(
+                        league_id, date_from, date_to, status="FINISHED"
                     )
-                    predictions_saved += 1
-                
-                logger.info(f"   ✅ Saved {len(predictions_dto.predictions)} predictions for {league_id}")
-                
-                # Generate and save picks for each match
-                logger.info(f"   💰 Generating picks for {len(predictions_dto.predictions)} matches...")
-                from src.application.use_cases.use_cases import GetSuggestedPicksUseCase
-                
-                picks_use_case = GetSuggestedPicksUseCase(
-                    data_sources=data_sources,
-                    prediction_service=prediction_service,
-                    statistics_service=statistics_service,
-                    learning_service=learning_service,
-                    cache_service=cache_service
+                    
+                    if bulk_matches:
+                        for m in bulk_matches:
+                            h_norm = statistics_service._normalize_name(m.home_team.name)
+                            a_norm = statistics_service._normalize_name(m.away_team.name)
+                            
+                            if h_norm not in league_history_map: league_history_map[h_norm] = []
+                            if a_norm not in league_history_map: league_history_map[a_norm] = []
+                            
+                            league_history_map[h_norm].append(m)
+                            league_history_map[a_norm].append(m)
+                        logger.info(f"   ✓ Pre-loaded history for {len(league_history_map)} teams")
+            except Exception as bulk_error:
+                logger.warning(f"   ⚠️ Bulk fetch failed, will use fallback: {bulk_error}")
+
+            # Generate predictions
+            predictions_dto = await use_case.execute(league_id, limit=PREDICTION_LIMIT)
+            
+            # Save to database (sync repository calls run off the event loop so leagues keep overlapping)
+            # Dump the league once; per-match rows reuse its already-serialized predictions
+            league_data = predictions_dto.model_dump()
+            
+            # Save individual match predictions (one batched write per league)
+            prediction_batch = [
+                {
+                    "match_id": match_pred.match.id,
+                    "league_id": league_id,
+                    "data": match_data,
+                    "ttl_seconds": 7 * 24 * 3600  # 7 days
+                }
+                for match_pred, match_data in zip(predictions_dto.predictions, league_data["predictions"])
+            ]
+            bulk_saved = await asyncio.to_thread(persistence_repo.bulk_save_predictions, prediction_batch)
+            predictions_saved = len(prediction_batch) if bulk_saved else 0
+            
+            logger.info(f"   ✅ Saved {len(predictions_dto.predictions)} predictions for {league_id}")
+            
+            # Generate and save picks for each match
+            logger.info(f"   💰 Generating picks for {len(predictions_dto.predictions)} matches...")
+            # Picks only change when the league forecast does, so key them on its generation time
+            forecast_version = predictions_dto.generated_at.isoformat()
+            
+            def picks_cache_key(match_pred) -> str:
+                return f"worker_picks:{match_pred.match.id}:{forecast_version}"
+            
+            # Read the league's cached picks in one batch, off the event loop
+            cached_picks_map = {}
+            if ENABLE_WORKER_CACHE:
+                cached_picks_map = await asyncio.to_thread(
+                    cache_service.get_many,
+                    [picks_cache_key(match_pred) for match_pred in predictions_dto.predictions],
                 )
-                
-                picks_saved = 0
-                for match_pred in predictions_dto.predictions:
+            
+            async def generate_match_picks(match_pred) -> Optional[dict]:
+                """Generate (or reuse cached) picks for one match. Returns the dumped DTO, or None."""
+                worker_cache_key = picks_cache_key(match_pred)
+                async with picks_semaphore:
                     try:
+                        cached_picks = cached_picks_map.get(worker_cache_key)
+                        if cached_picks:
+                            return cached_picks
+                        
                         # Generate picks for this match
                         # Build context from bulk history
                         match_history_context = []
@@ -192,7 +225,6 @@ async def main():
 
                         # Reconstruct Minimal Match Object to avoid re-fetching details
                         # We use the DTO data to support the use case
-                        from src.domain.entities.entities import Match, Team, League
                         match_obj = Match(
                             id=match_pred.match.id,
                             home_team=Team(
@@ -223,28 +255,64 @@ async def main():
                             pre_fetched_history=match_history_context if match_history_context else None
                         )
                         
-                        if picks_dto and picks_dto.picks:
-                            # Save picks to database
-                            picks_cache_key = f"picks:match_{match_pred.match.id}"
-                            picks_data = picks_dto.model_dump() if hasattr(picks_dto, 'model_dump') else picks_dto.dict()
-                            persistence_repo.save_training_result(
-                                picks_cache_key,
-                                picks_data
+                        if not (picks_dto and picks_dto.suggested_picks):
+                            return None
+                        
+                        picks_data = picks_dto.model_dump()
+                        if ENABLE_WORKER_CACHE:
+                            await asyncio.to_thread(
+                                cache_service.set, worker_cache_key, picks_data, ttl_seconds=CACHE_TTL_SECONDS
                             )
-                            picks_saved += len(picks_dto.picks)
+                        return picks_data
                     except Exception as pick_error:
                         logger.debug(f"      ⚠️  Could not generate picks for {match_pred.match.id}: {pick_error}")
-                        continue
-                
-                total_picks_saved += picks_saved
-                logger.info(f"   💰 Saved {picks_saved} picks for {league_id}")
-                
-                # Small delay to avoid overwhelming the database
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"   ❌ Error processing {league_id}: {e}", exc_info=True)
-                continue
+                        return None
+            
+            # Matches are independent, so generate their picks concurrently
+            match_picks = await asyncio.gather(*(
+                generate_match_picks(match_pred) for match_pred in predictions_dto.predictions
+            ))
+            
+            # Queue the league forecast and its picks for one batched upsert
+            picks_saved = 0
+            picks_batch = {f"forecasts:league_{league_id}": league_data}
+            for match_pred, picks_data in zip(predictions_dto.predictions, match_picks):
+                if picks_data:
+                    picks_batch[f"picks:match_{match_pred.match.id}"] = picks_data
+                    picks_saved += len(picks_data["suggested_picks"])
+            
+            # Save the forecast and all picks for this league in one transaction
+            if not await asyncio.to_thread(persistence_repo.bulk_save_training_results, picks_batch):
+                picks_saved = 0
+            
+            logger.info(f"   💰 Saved {picks_saved} picks for {league_id}")
+            
+            return predictions_saved, picks_saved
+        
+        # Leagues are independent and I/O-bound, so overlap them (bounded to MAX_WORKERS at a time)
+        league_semaphore = asyncio.Semaphore(MAX_WORKERS)
+        
+        async def process_league_bounded(idx: int, league_id: str, meta: dict) -> tuple[int, int]:
+            async with league_semaphore:
+                try:
+                    return await process_league(idx, league_id, meta)
+                except Exception as e:
+                    logger.error(f"   ❌ Error processing {league_id}: {e}", exc_info=True)
+                    return 0, 0
+        
+        # Each league writes its own rows as soon as its predictions are ready, so DB work
+        # overlaps the fetches of leagues still running; totals are folded in as they finish
+        league_tasks = [
+            asyncio.create_task(process_league_bounded(idx, league_id, meta))
+            for idx, (league_id, meta) in enumerate(LEAGUE_ENTRIES, 1)
+        ]
+        predictions_saved = 0
+        total_picks_saved = 0
+        for finished, league_task in enumerate(asyncio.as_completed(league_tasks), 1):
+            league_predictions, league_picks = await league_task
+            predictions_saved += league_predictions
+            total_picks_saved += league_picks
+            logger.info(f"   📈 Leagues finished: {finished}/{len(league_tasks)}")
         
         logger.info(f"\n✅ Total predictions saved: {predictions_saved}")
         
@@ -254,8 +322,6 @@ async def main():
         logger.info("=" * 80)
         
         try:
-            from src.application.use_cases.use_cases import GetTopMLPicksUseCase
-            
             top_picks_use_case = GetTopMLPicksUseCase(
                 persistence_repository=persistence_repo
             )
@@ -267,8 +333,9 @@ async def main():
             if top_picks_dto and top_picks_dto.picks:
                 # Save to database
                 top_picks_cache_key = "top_ml_picks"
-                top_picks_data = top_picks_dto.model_dump() if hasattr(top_picks_dto, 'model_dump') else top_picks_dto.dict()
-                persistence_repo.save_training_result(
+                top_picks_data = top_picks_dto.model_dump()
+                await asyncio.to_thread(
+                    persistence_repo.save_training_result,
                     top_picks_cache_key,
                     top_picks_data
                 )
@@ -319,5 +386,16 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    try:
+        # libuv-based loop: cheaper syscalls for this I/O-bound run
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    log_listener.start()
+    try:
+        exit_code = asyncio.run(main())
+    finally:
+        # Flush any queued records before exiting
+        log_listener.stop()
     sys.exit(exit_code)
@@ -9,7 +9,6 @@ import logging
 sys.path.append(os.getcwd())
 
 from src.api.dependencies import get_ml_training_orchestrator
-from src.infrastructure.cache.cache_service import get_cache_service
 
 # Configure logging
 logging.basicConfig(
@@ -26,14 +25,14 @@ async def main():
     
     args = parser.parse_args()
     
-    logger.info("Initializing ML Training Orchestrator...")
-    orchestrator = get_ml_training_orchestrator()
-    
-    # Check if disabled by env var (as in the workflow)
+    # Check if disabled by env var (as in the workflow) before building any services
     if os.getenv("DISABLE_ML_TRAINING", "false").lower() == "true":
         logger.info("ML training is disabled via environment variable. Skipping.")
         return
 
+    logger.info("Initializing ML Training Orchestrator...")
+    orchestrator = get_ml_training_orchestrator()
+
     logger.info(f"Starting training pipeline (days_back={args.days_back}, leagues={args.leagues}, force_refresh={args.force_refresh})")
     
     try:
@@ -54,4 +53,10 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    try:
+        # libuv-based loop: cheaper syscalls for this I/O-bound run
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
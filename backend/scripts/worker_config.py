@@ -3,7 +3,7 @@ Worker Configuration
 Configuration settings for the prediction worker script.
 """
 import os
-from typing import List
+from typing import List, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -22,9 +22,12 @@ WORKER_MODE = True  # Always True for worker script
 DAYS_BACK = 365  # Historical data window
 PREDICTION_LIMIT = 50  # Max predictions per league
 
-# Leagues to process (from constants)
+# Leagues to process (from constants), skipping any without metadata
 from src.core.constants import DEFAULT_LEAGUES
-LEAGUES_TO_PROCESS: List[str] = DEFAULT_LEAGUES
+from src.domain.constants import LEAGUES_METADATA
+LEAGUES_TO_PROCESS: List[str] = [league_id for league_id in DEFAULT_LEAGUES if league_id in LEAGUES_METADATA]
+# (league_id, metadata) pairs resolved once for the per-league loop
+LEAGUE_ENTRIES: List[Tuple[str, dict]] = [(league_id, LEAGUES_METADATA[league_id]) for league_id in LEAGUES_TO_PROCESS]
 
 # Logging Configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -33,6 +36,7 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # Performance Settings
 BATCH_SIZE = 100  # Batch size for database inserts
 MAX_WORKERS = 4  # Parallel processing workers
+MAX_CONCURRENT_PICKS = 8  # In-flight pick generations across all leagues
 MEMORY_LIMIT_MB = 2048  # Memory limit for worker (GitHub Actions has more RAM)
 
 # Cache Settings (for worker)
@@ -46,8 +46,9 @@ def get_thesportsdb() -> TheSportsDBClient:
     return TheSportsDBClient()
 
 
+@lru_cache()
 def get_data_sources() -> DataSources:
-    """Get all data sources container."""
+    """Get all data sources container (cached)."""
     return DataSources(
         football_data_uk=get_football_data_uk(),
         football_data_org=get_football_data_org(),
@@ -56,9 +57,6 @@ def get_data_sources() -> DataSources:
     )
 
 
-from src.domain.services.statistics_service import StatisticsService
-
-
 @lru_cache()
 def get_prediction_service() -> PredictionService:
     """Get prediction service (cached)."""
@@ -147,3 +145,21 @@ from src.infrastructure.services.background_processor import BackgroundProcessor
 def get_background_processor() -> BackgroundProcessor:
     """Get background processor (cached singleton)."""
     return BackgroundProcessor()
+
+
+def warm_up_dependencies() -> None:
+    """
+    Build the singletons used by request handlers ahead of the first request.
+    
+    Called once from the app lifespan so the first hit on each route does not
+    pay for constructing data sources and services. The factories stay cached,
+    so scripts and the scheduler keep sharing the same instances.
+    """
+    get_data_sources()
+    get_prediction_service()
+    get_statistics_service()
+    get_learning_service()
+    get_parley_service()
+    get_picks_service()
+    get_persistence_repository()
+    get_cache_service()
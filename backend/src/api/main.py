@@ -6,20 +6,36 @@ This module configures the FastAPI app, middleware, and routes.
 """
 
 import os
+import copy
+import queue
+import atexit
+import asyncio
 import logging
-import warnings
+import logging.handlers
+import orjson
 from contextlib import asynccontextmanager
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-# Suppress DeprecationWarnings from utcnow() used in external libraries or old code
-warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*utcnow.*")
-
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from src.api.routes import leagues, predictions, matches, suggested_picks, parleys, learning
-from src.application.dtos.dtos import HealthResponseDTO, ErrorResponseDTO
+from src.application.dtos.dtos import HealthResponseDTO
+from src.api.dependencies import (
+    get_data_sources, get_prediction_service,
+    get_statistics_service, get_persistence_repository,
+    get_background_processor, warm_up_dependencies
+)
+from src.infrastructure.cache.cache_service import get_cache_service
+from src.domain.services.cache_warmup_service import CacheWarmupService
+
+try:
+    from src.scheduler import get_scheduler
+except ImportError:
+    # APScheduler is not installed in API-only deployments
+    get_scheduler = None
 
 from dotenv import load_dotenv
 
@@ -28,25 +44,59 @@ load_dotenv()
 
 
 from src.utils.time_utils import get_current_time
+from src.utils.memory_utils import maybe_collect_garbage
 import time
 
+# Our log format never prints thread or process info, so skip collecting it per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Custom logging implementation to use Colombia time
 class ColombiaTimeFormatter(logging.Formatter):
+    # zoneinfo converts timestamps roughly 10x faster than the pytz zone used elsewhere
+    TZ = ZoneInfo("America/Bogota")
+    
+    # (epoch second, "YYYY-mm-dd HH:MM:SS") for the last second formatted; one tuple so it swaps atomically
+    _second_prefix = (None, "")
+    
     def formatTime(self, record, datefmt=None):
-        ct = get_current_time()
+        # Stamp with the record's own creation time instead of reading the clock again
         if datefmt:
-            s = ct.strftime(datefmt)
-        else:
-            t = ct.strftime("%Y-%m-%d %H:%M:%S")
-            s = "%s,%03d" % (t, record.msecs)
-        return s
+            return datetime.fromtimestamp(record.created, self.TZ).strftime(datefmt)
+        # Lines logged within the same second share the date/time prefix; only msecs changes
+        second = int(record.created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = f"{datetime.fromtimestamp(second, self.TZ):%Y-%m-%d %H:%M:%S}"
+            self._second_prefix = (second, prefix)
+        return f"{prefix},{int(record.msecs):03d}"
+
+
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for an in-process listener.
+    Resolves the message arguments eagerly but leaves exc_info in place, so
+    traceback formatting happens on the listener thread, not in the request.
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 formatter = ColombiaTimeFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 handler = logging.StreamHandler()
 handler.setFormatter(formatter)
+# Request coroutines only enqueue records; formatting and stderr writes run on the listener thread
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
-root_logger.handlers = [handler]
+root_logger.handlers = [DeferredFormatQueueHandler(log_queue)]
 logger = logging.getLogger(__name__)
 
 
@@ -84,6 +134,23 @@ statistical analysis, and machine learning models.
 APP_VERSION = "1.0.0"
 
 
+def spawn_background_task(app: FastAPI, coro) -> asyncio.Task:
+    """
+    Start a background task and keep a strong reference to it on app.state,
+    so it is not garbage collected mid-run and can be stopped on shutdown.
+    """
+    task = asyncio.create_task(coro)
+    app.state.bg_tasks.add(task)
+    
+    def on_done(finished: asyncio.Task):
+        app.state.bg_tasks.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.error(f"Background task failed: {finished.exception()}")
+    
+    task.add_done_callback(on_done)
+    return task
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -92,6 +159,13 @@ async def lifespan(app: FastAPI):
     # Check if running in API-only mode (production)
     api_only_mode = os.getenv("API_ONLY_MODE", "false").lower() == "true"
     
+    # Readiness (/health/ready): API-only mode serves from the DB right away,
+    # full mode becomes ready once the background training/warmup cycle settles
+    app.state.ready = api_only_mode
+    # Bound once below in full mode; shutdown reads it instead of calling the provider again
+    app.state.scheduler = None
+    app.state.bg_tasks = set()
+    
     if api_only_mode:
         logger.info("🚀 Starting in API-ONLY MODE (Lightweight)")
         logger.info("   - ML computations: DISABLED")
@@ -106,12 +180,11 @@ async def lifespan(app: FastAPI):
     
     # 1. Startup Logic wrapped in try-except for resilience
     try:
-        from src.infrastructure.cache.cache_service import get_cache_service
-        from src.utils.time_utils import get_today_str, get_current_time
-        import asyncio
-        
         cache = get_cache_service()
         
+        # Build request-path services now instead of on each route's first hit
+        warm_up_dependencies()
+        
         # 1.1 Local Cache Refresh (Requested by User)
         # Allows refreshing the local cache automatically on every server restart (e.g. during development)
         if os.getenv("CLEAR_CACHE_ON_START", "false").lower() == "true":
@@ -137,19 +210,17 @@ async def lifespan(app: FastAPI):
 
         # Skip heavy initialization in API-only mode
         if not api_only_mode:
-            # Initialize CacheWarmupService
-            from src.domain.services.cache_warmup_service import CacheWarmupService
-            from src.api.dependencies import (
-                get_data_sources, get_prediction_service,
-                get_statistics_service, get_persistence_repository,
-                get_background_processor
-            )
+            # Resolve the shared providers once for warmup, the orchestrator and shutdown
+            persistence = get_persistence_repository()
+            scheduler = get_scheduler() if get_scheduler is not None else None
+            app.state.scheduler = scheduler
             
+            # Initialize CacheWarmupService
             warmup_service = CacheWarmupService(
                 data_sources=get_data_sources(),
                 prediction_service=get_prediction_service(),
                 statistics_service=get_statistics_service(),
-                persistence_repository=get_persistence_repository(),
+                persistence_repository=persistence,
                 background_processor=get_background_processor()
             )
             
@@ -157,15 +228,13 @@ async def lifespan(app: FastAPI):
             # Consolidate background tasks to run SEQUENTIALLY to save RAM
             async def background_tasks_orchestrator():
                 try:
-                    import gc
                     logger.info("⏳ Waiting 15s before heavy background task cycle...")
                     await asyncio.sleep(15)
                     
                     # 0. Initialize Persistence AFTER server is up
-                    persistence_repo = get_persistence_repository()
                     try:
                         logger.info("📡 Initializing database persistence in background...")
-                        persistence_repo.create_tables()
+                        await asyncio.to_thread(persistence.create_tables)
                         logger.info("✓ Database tables verified/created.")
                     except Exception as db_e:
                         logger.error(f"Failed to initialize DB: {db_e}")
@@ -173,13 +242,13 @@ async def lifespan(app: FastAPI):
                     # Check forecasts (Unified key)
                     sample_key = "forecasts:league_E0"
                     
-                    # Check ephemeral cache first
-                    has_cached_forecasts = cache.get(sample_key) is not None
+                    # Check ephemeral cache first (DiskCache and the sync DB session block,
+                    # so these probes run in a worker thread to keep probes/requests served)
+                    has_cached_forecasts = (await asyncio.to_thread(cache.get, sample_key)) is not None
                     
                     # If not in ephemeral, check persistent DB (Standard for Render)
                     if not has_cached_forecasts:
-                        persistence = get_persistence_repository()
-                        if persistence.get_training_result(sample_key):
+                        if await asyncio.to_thread(persistence.get_training_result, sample_key):
                             has_cached_forecasts = True
                             logger.info("✓ Persistent forecasts found in DB. Skipping heavy startup tasks.")
                     
@@ -192,14 +261,13 @@ async def lifespan(app: FastAPI):
                     if not has_cached_forecasts and (not disable_training_env and not is_render and not low_memory):
                         logger.info("🚀 Starting Daily Orchestrated Job (Sequenced)...")
                         try:
-                            from src.scheduler import get_scheduler
-                            scheduler = get_scheduler()
-                            await scheduler.run_daily_orchestrated_job()
-                            logger.info("✓ Daily Orchestrated Job complete. Cleaning memory...")
-                            gc.collect()
-                            await asyncio.sleep(5)
-                        except ImportError:
-                            logger.error("⚠ Scheduler not available (APScheduler missing). Skipping orchestrated job.")
+                            if scheduler is None:
+                                logger.error("⚠ Scheduler not available (APScheduler missing). Skipping orchestrated job.")
+                            else:
+                                await scheduler.run_daily_orchestrated_job()
+                                logger.info("✓ Daily Orchestrated Job complete. Cleaning memory...")
+                                maybe_collect_garbage()
+                                await asyncio.sleep(5)
                         except Exception as e:
                             logger.error(f"⚠ Failed to run orchestrated job: {e}")
                             
@@ -209,52 +277,63 @@ async def lifespan(app: FastAPI):
                     
                     # 2. Cache Warmup (Lookahead) - Sequentially
                     logger.info("🚀 Starting Cache Warmup (Sequenced)...")
-                    # We prioritize the top 3 leagues first to give faster UI feedback without spiking RAM
+                    # We prioritize the top 3 leagues first to give faster UI feedback without spiking RAM.
+                    # They run together, so each one is served as soon as it is cached.
                     priority_leagues = ['E0', 'SP1', 'D1']
-                    await warmup_service.warm_up_predictions(league_ids=priority_leagues)
+                    await warmup_service.warm_up_priority_leagues(priority_leagues)
                     
                     # If we are NOT in render or low memory, we can do the full warmup
                     if not is_render and not low_memory:
-                        asyncio.create_task(warmup_service.warm_up_predictions())
+                        spawn_background_task(app, warmup_service.warm_up_predictions())
                     else:
                         logger.info("ℹ️ Full background warmup skipped to conserve RAM on Render.")
                     
                     logger.info("✓ Initial Cache Warmup complete. System ready.")
-                    gc.collect()
+                    maybe_collect_garbage()
                     
                 except Exception as e:
                     logger.error(f"Background orchestrator failure: {e}")
+                finally:
+                    # Requests are served either way; stop holding traffic back
+                    app.state.ready = True
 
             # Trigger the sequential orchestration
-            asyncio.create_task(background_tasks_orchestrator())
+            spawn_background_task(app, background_tasks_orchestrator())
             
             # Scheduler just for the CRON, no immediate run here (orchestrator handles first run)
-            try:
-                from src.scheduler import get_scheduler
-                scheduler = get_scheduler()
+            if scheduler is None:
+                logger.warning("⚠ Scheduler not available (APScheduler missing). CRON tasks disabled.")
+            else:
                 scheduler.start(run_immediate=False)
                 logger.info("✓ Daily training scheduler configured (06:00 AM Colombia time)")
-            except ImportError:
-                logger.warning("⚠ Scheduler not available (APScheduler missing). CRON tasks disabled.")
         else:
             logger.info("⏭️  Skipping background tasks (API-ONLY mode)")
             logger.info("💡 Predictions will be read from database (populated by GitHub Actions)")
 
+        # Build the OpenAPI schema once now so the first /docs hit does not pay for it
+        app.openapi()
+
     except Exception as e:
         logger.error(f"FAILURE: Lifespan startup error: {e}", exc_info=True)
+        app.state.ready = True
 
     yield
     
     # 2. Shutdown Logic wrapped in try-except
     try:
         logger.info("Shutting down...")
-        if not api_only_mode:
-            from src.scheduler import get_scheduler
-            scheduler_to_stop = get_scheduler()
-            scheduler_to_stop.shutdown()
+        # Warmups can run for minutes, so cancel rather than wait, then let them unwind
+        bg_tasks = list(app.state.bg_tasks)
+        for task in bg_tasks:
+            task.cancel()
+        if bg_tasks:
+            await asyncio.gather(*bg_tasks, return_exceptions=True)
+            logger.info(f"✓ Stopped {len(bg_tasks)} background task(s)")
+        if app.state.scheduler is not None:
+            app.state.scheduler.shutdown()
             logger.info("✓ Scheduler shutdown complete")
         else:
-            logger.info("✓ API-only mode shutdown (no scheduler to stop)")
+            logger.info("✓ No scheduler to stop (API-only mode or APScheduler missing)")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
@@ -265,6 +344,7 @@ app = FastAPI(
     description=APP_DESCRIPTION,
     version=APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -281,36 +361,57 @@ base_origins = [
     "https://football-prediction-frontend-nz9r.onrender.com"
 ]
 env_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()]
-# Combine, remove duplicates, and ensure NO trailing slashes
-all_origins = list(set([o.rstrip("/") for o in base_origins + env_origins if o]))
-
-# Added allow_origin_regex for flexibility in Render subdomains
+# Combine, remove duplicates, and ensure NO trailing slashes.
+# Starlette only tests membership on allow_origins, so a frozenset makes each check O(1)
+all_origins = frozenset(o.rstrip("/") for o in base_origins + env_origins if o)
+
+# Added allow_origin_regex for flexibility in Render subdomains.
+# DEBUG accepts any origin through the regex rather than a "*" entry, so the
+# origin is echoed back as credentialed requests require
+cors_origin_regex = r".*" if os.getenv("DEBUG") == "true" else r"https://.*\.onrender\.com"
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=all_origins + ["*"] if os.getenv("DEBUG") == "true" else all_origins,
+    allow_origins=all_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    allow_origin_regex=r"https://.*\.onrender\.com", 
+    allow_origin_regex=cors_origin_regex, 
 )
 
 
 # Exception handlers
+# Static part of the 500 body (ErrorResponseDTO shape); only details varies per request
+INTERNAL_ERROR_BODY = {
+    "error": "internal_server_error",
+    "message": "An unexpected error occurred",
+}
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled errors."""
     logger.error(f"Unhandled error: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponseDTO(
-            error="internal_server_error",
-            message="An unexpected error occurred",
-            details={"path": str(request.url)},
-        ).model_dump(),
+        content={**INTERNAL_ERROR_BODY, "details": {"path": str(request.url)}},
     )
 
 
 # Health check endpoint
+HEALTHY_RESPONSE_BASE = {"status": "healthy", "version": APP_VERSION}
+# [monotonic time of last refresh, serialized body]; probes within a second share one payload
+_health_body_cache = [float("-inf"), b""]
+
+
+def _health_body() -> bytes:
+    """Serialized /health payload with a Colombia-time timestamp, rebuilt at most once per second."""
+    now = time.monotonic()
+    if now - _health_body_cache[0] >= 1.0:
+        body = orjson.dumps({**HEALTHY_RESPONSE_BASE, "timestamp": get_current_time()})
+        _health_body_cache[:] = [now, body]
+    return _health_body_cache[1]
+
+
 @app.get(
     "/health",
     response_model=HealthResponseDTO,
@@ -318,14 +419,23 @@ async def global_exception_handler(request: Request, exc: Exception):
     summary="Health check",
     description="Check if the API is running and healthy.",
 )
-async def health_check() -> HealthResponseDTO:
+async def health_check() -> Response:
     """Health check endpoint."""
-    from src.utils.time_utils import get_current_time
-    return HealthResponseDTO(
-        status="healthy",
-        version=APP_VERSION,
-        timestamp=get_current_time(),
-    )
+    # The payload is reused for a second and skips model validation on this hot probe path
+    return Response(content=_health_body(), media_type="application/json")
+
+
+@app.get(
+    "/health/ready",
+    tags=["Health"],
+    summary="Readiness check",
+    description="Returns 503 while the startup training/warmup cycle is still running, 200 once traffic can be routed here.",
+)
+async def readiness_check(request: Request) -> ORJSONResponse:
+    """Readiness endpoint for load balancers; /health remains the liveness probe."""
+    if getattr(request.app.state, "ready", True):
+        return ORJSONResponse({"status": "ready"})
+    return ORJSONResponse({"status": "warming_up"}, status_code=503)
 
 
 # Cache status endpoint
@@ -335,62 +445,71 @@ async def health_check() -> HealthResponseDTO:
     summary="Cache status",
     description="Check ephemeral cache status and sampled keys.",
 )
-async def cache_status():
+async def cache_status() -> ORJSONResponse:
     """Get cache status for debugging."""
-    from src.infrastructure.cache.cache_service import get_cache_service
-    
     cache = get_cache_service()
     
-    # Get forecast keys (Best effort)
-    forecast_keys = []
-    # Note: DiskCache doesn't have a direct 'keys' method like Redis, 
-    # but we can check the length of memory cache for a sample.
-    memory_sample = list(cache._memory_cache.keys())[:10]
+    # Note: DiskCache doesn't have a direct 'keys' method like Redis,
+    # so report the memory layer: its size plus a bounded key sample.
+    memory_count, memory_sample = cache.memory_snapshot(sample_size=10)
     
-    return {
+    # Returning the response directly skips FastAPI's jsonable_encoder walk
+    return ORJSONResponse({
         "persistence_layer": "PostgreSQL",
         "ephemeral_layer": "Memory + DiskCache",
+        "cached_items_count": memory_count,
         "cached_items_sample": memory_sample,
         "cache_hits": getattr(cache, '_hits', 0),
         "cache_misses": getattr(cache, '_misses', 0),
-    }
+    })
 
 
 # Root endpoint
+# The payload never changes, so it is serialized once at import
+ROOT_RESPONSE_BYTES = orjson.dumps({
+    "name": APP_TITLE,
+    "version": APP_VERSION,
+    "documentation": "/docs",
+    "health": "/health",
+    "endpoints": {
+        "leagues": "/api/v1/leagues",
+        "predictions": "/api/v1/predictions/league/{league_id}",
+    },
+})
+
+
 @app.get(
     "/",
     tags=["Root"],
     summary="API Information",
     description="Get basic API information and links.",
 )
-async def root():
+async def root() -> Response:
     """Root endpoint with API info."""
-    return {
-        "name": APP_TITLE,
-        "version": APP_VERSION,
-        "documentation": "/docs",
-        "health": "/health",
-        "endpoints": {
-            "leagues": "/api/v1/leagues",
-            "predictions": "/api/v1/predictions/league/{league_id}",
-        },
-    }
-
-
-# Include routers
-app.include_router(leagues.router, prefix="/api/v1")
-app.include_router(predictions.router, prefix="/api/v1")
-app.include_router(matches.router, prefix="/api/v1")
-app.include_router(suggested_picks.router, prefix="/api/v1")
-app.include_router(parleys.router, prefix="/api/v1")
-app.include_router(learning.router, prefix="/api/v1")
+    return Response(content=ROOT_RESPONSE_BYTES, media_type="application/json")
+
+
+# Include routers: aggregate under one versioned parent so the prefix is applied in one place
+api_v1 = APIRouter(prefix="/api/v1")
+for api_router in (
+    leagues.router,
+    predictions.router,
+    matches.router,
+    suggested_picks.router,
+    parleys.router,
+    learning.router,
+):
+    api_v1.include_router(api_router)
+app.include_router(api_v1)
 
 
 if __name__ == "__main__":
     import uvicorn
+    # Auto-reload is for local development; set RELOAD=false to run this entry point like production.
+    # loop/http stay on "auto", which picks uvloop and httptools (installed via uvicorn[standard]).
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8000")),
-        reload=True,
+        reload=os.getenv("RELOAD", "true").lower() == "true",
     )
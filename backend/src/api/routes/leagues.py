@@ -5,13 +5,23 @@ API endpoints for managing leagues and countries.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from src.application.dtos.dtos import LeaguesResponseDTO, ErrorResponseDTO
+from src.application.dtos.dtos import LeaguesResponseDTO, LeagueDTO, ErrorResponseDTO
+from src.application.use_cases.use_cases import GetLeaguesUseCase
 from src.api.dependencies import get_data_sources
+from src.infrastructure.cache.cache_service import get_cache_service
+from src.domain.constants import LEAGUES_METADATA
 
 
 router = APIRouter(prefix="/leagues", tags=["Leagues"])
 
+# League metadata is static, so each league's DTO is built once at import
+LEAGUE_DTOS: dict[str, LeagueDTO] = {
+    league_id: LeagueDTO(id=league_id, name=meta["name"], country=meta["country"])
+    for league_id, meta in LEAGUES_METADATA.items()
+}
+
 
 @router.get(
     "",
@@ -24,9 +34,6 @@ router = APIRouter(prefix="/leagues", tags=["Leagues"])
 )
 async def get_leagues() -> LeaguesResponseDTO:
     """Get all available leagues (cached for 24 hours)."""
-    from src.application.use_cases.use_cases import GetLeaguesUseCase, DataSources
-    from src.infrastructure.cache.cache_service import get_cache_service
-    
     cache = get_cache_service()
     cache_key = "leagues:all"
     
@@ -59,15 +66,9 @@ async def get_leagues() -> LeaguesResponseDTO:
 )
 async def get_league(league_id: str):
     """Get details for a specific league."""
-    from src.infrastructure.data_sources.football_data_uk import LEAGUES_METADATA
-    from src.application.dtos.dtos import LeagueDTO
-    
-    if league_id not in LEAGUES_METADATA:
-        raise HTTPException(status_code=404, detail=f"League not found: {league_id}")
+    league = LEAGUE_DTOS.get(league_id)
+    if league is None:
+        # Same body HTTPException would produce, without the raise/handler round trip
+        return ORJSONResponse({"detail": f"League not found: {league_id}"}, status_code=404)
     
-    meta = LEAGUES_METADATA[league_id]
-    return LeagueDTO(
-        id=league_id,
-        name=meta["name"],
-        country=meta["country"],
-    )
+    return league
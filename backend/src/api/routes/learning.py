@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from uuid import uuid4
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 import math
 import re
+import asyncio
 import logging
 import os
+import socket
 import zlib
 import gc
 
@@ -36,7 +40,7 @@ from src.application.use_cases.use_cases import DataSources
 from src.domain.entities.entities import TeamStatistics
 from src.utils.time_utils import get_current_time
 from src.infrastructure.cache.cache_service import CacheService
-from src.core.constants import DEFAULT_LEAGUES
+from src.core.constants import DEFAULT_LEAGUES, TRAINING_LOCK_NAME, TRAINING_LOCK_TTL_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +126,120 @@ class TrainingProgressStatus(BaseModel):
     result: Optional[TrainingStatus] = None
 
 
-@router.post("/train", response_model=TrainingStatus)
+class TrainingJobStatus(BaseModel):
+    """State of a training session submitted through POST /train."""
+    job_id: str
+    status: str  # "QUEUED", "IN_PROGRESS", "COMPLETED", "ERROR"
+    message: str = ""
+    submitted_at: str
+    finished_at: Optional[str] = None
+
+
+class TrainingJobAccepted(BaseModel):
+    """Response for a training session accepted for background execution."""
+    job_id: str
+    status: str
+    status_url: str
+
+
+# Training is memory-bound, so sessions run one at a time and only a few may wait
+_TRAINING_SEMAPHORE = asyncio.Semaphore(1)
+MAX_PENDING_TRAINING_JOBS = 2
+MAX_TRACKED_TRAINING_JOBS = 20
+# How often a queued session re-checks the training lease held by the scheduler
+TRAINING_LOCK_POLL_SECONDS = 30
+# Progress message the orchestrator updates at each pipeline stage
+TRAINING_PROGRESS_KEY = "ml_training_message"
+_TRAINING_JOBS: "OrderedDict[str, TrainingJobStatus]" = OrderedDict()
+
+
+def _register_training_job() -> TrainingJobStatus:
+    """Record a new queued job, forgetting the oldest finished ones past the cap."""
+    job = TrainingJobStatus(
+        job_id=uuid4().hex,
+        status="QUEUED",
+        message="Entrenamiento en cola",
+        submitted_at=get_current_time().isoformat(),
+    )
+    _TRAINING_JOBS[job.job_id] = job
+    
+    for job_id in list(_TRAINING_JOBS):
+        if len(_TRAINING_JOBS) <= MAX_TRACKED_TRAINING_JOBS:
+            break
+        if _TRAINING_JOBS[job_id].status in ("COMPLETED", "ERROR"):
+            del _TRAINING_JOBS[job_id]
+    return job
+
+
+async def _run_training_job(
+    job: TrainingJobStatus,
+    request: BacktestRequest,
+    learning_service: LearningService,
+    orchestrator: MLTrainingOrchestrator,
+) -> None:
+    """Run one training session; waits for the previous session or scheduled run to finish first."""
+    async with _TRAINING_SEMAPHORE:
+        # The scheduler's daily run shares the orchestrator and its progress keys
+        cache = get_cache_service()
+        lock_owner = f"{socket.gethostname()}:{os.getpid()}:{job.job_id}"
+        while not cache.acquire_lock(TRAINING_LOCK_NAME, lock_owner, TRAINING_LOCK_TTL_SECONDS):
+            job.message = "Esperando a que termine el entrenamiento programado"
+            await asyncio.sleep(TRAINING_LOCK_POLL_SECONDS)
+        
+        job.status = "IN_PROGRESS"
+        job.message = "Entrenamiento en curso"
+        try:
+            if request.reset_weights:
+                learning_service.reset_weights()
+
+            # Run the full training pipeline via centralized orchestrator
+            leagues = request.league_ids if request.league_ids else DEFAULT_LEAGUES
+            
+            result: TrainingResult = await orchestrator.run_training_pipeline(
+                league_ids=leagues,
+                days_back=request.days_back,
+                start_date=request.start_date,
+                force_refresh=request.force_refresh
+            )
+            
+            # Force garbage collection to free up memory after training
+            gc.collect()
+
+            # Convert Result to Response DTO (Payload optimization)
+            # The UI only needs the most recent match history to avoid 50MB responses
+            history_limit = 500
+            display_history = result.match_history[-history_limit:] if len(result.match_history) > history_limit else result.match_history
+            
+            response = TrainingStatus(
+                matches_processed=result.matches_processed,
+                correct_predictions=result.correct_predictions,
+                accuracy=result.accuracy,
+                total_bets=result.total_bets,
+                roi=result.roi,
+                profit_units=result.profit_units,
+                market_stats=result.market_stats,
+                match_history=display_history,
+                roi_evolution=result.roi_evolution,
+                pick_efficiency=result.pick_efficiency,
+                team_stats=result.team_stats,
+                global_averages=result.global_averages
+            )
+            
+            # Cache the result for the dashboard (/train/cached and /train/status read it)
+            cache.set(orchestrator.CACHE_KEY_RESULT, response.model_dump(), ttl_seconds=cache.TTL_TRAINING)
+            
+            job.status = "COMPLETED"
+            job.message = "Entrenamiento completado"
+        except Exception as e:
+            logger.error(f"Training job {job.job_id} failed: {e}", exc_info=True)
+            job.status = "ERROR"
+            job.message = f"Error en el entrenamiento: {e}"
+        finally:
+            job.finished_at = get_current_time().isoformat()
+            cache.release_lock(TRAINING_LOCK_NAME, lock_owner)
+
+
+@router.post("/train", response_model=TrainingJobAccepted, status_code=202)
 async def run_training_session(
     request: BacktestRequest,
     background_tasks: BackgroundTasks,
@@ -130,57 +247,41 @@ async def run_training_session(
     orchestrator: MLTrainingOrchestrator = Depends(get_ml_training_orchestrator)
 ):
     """
-    Executes a full backtest/training session.
-    """
-    # Lazy Load ML Libraries
-    import joblib
-    try:
-        from sklearn.ensemble import RandomForestClassifier
-    except ImportError:
-        RandomForestClassifier = None
-        
-    if request.reset_weights:
-        learning_service.reset_weights()
-
-    # Run the full training pipeline via centralized orchestrator
-    leagues = request.league_ids if request.league_ids else DEFAULT_LEAGUES
+    Queues a full backtest/training session and returns immediately.
     
-    result: TrainingResult = await orchestrator.run_training_pipeline(
-        league_ids=leagues,
-        days_back=request.days_back,
-        start_date=request.start_date,
-        force_refresh=request.force_refresh
-    )
+    Poll the returned status_url for progress; the result is cached for
+    GET /train/cached once the job completes.
+    """
+    pending = sum(1 for job in _TRAINING_JOBS.values() if job.status in ("QUEUED", "IN_PROGRESS"))
+    if pending >= MAX_PENDING_TRAINING_JOBS:
+        raise HTTPException(status_code=429, detail="Training queue is full, try again once the current session finishes.")
     
-    # Force garbage collection to free up memory after training
-    gc.collect()
-
-    # Convert Result to Response DTO (Payload optimization)
-    # The UI only needs the most recent match history to avoid 50MB responses
-    history_limit = 500
-    display_history = result.match_history[-history_limit:] if len(result.match_history) > history_limit else result.match_history
+    job = _register_training_job()
+    background_tasks.add_task(_run_training_job, job, request, learning_service, orchestrator)
     
-    response = TrainingStatus(
-        matches_processed=result.matches_processed,
-        correct_predictions=result.correct_predictions,
-        accuracy=result.accuracy,
-        total_bets=result.total_bets,
-        roi=result.roi,
-        profit_units=result.profit_units,
-        market_stats=result.market_stats,
-        match_history=display_history,
-        roi_evolution=result.roi_evolution,
-        pick_efficiency=result.pick_efficiency,
-        team_stats=result.team_stats,
-        global_averages=result.global_averages
+    return TrainingJobAccepted(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=f"/api/v1/train/jobs/{job.job_id}",
     )
+
+
+@router.get("/train/jobs/{job_id}", response_model=TrainingJobStatus)
+async def get_training_job(
+    job_id: str,
+    cache_service: CacheService = Depends(get_cache_service),
+):
+    """Get the state of a training session submitted through POST /train."""
+    job = _TRAINING_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Training job not found: {job_id}")
     
-    # Cache the result for the dashboard
-    import joblib # Ensure joblib is available for any underlying serialization if needed
-    cache = get_cache_service()
-    cache.set(orchestrator.CACHE_KEY_RESULT, response.model_dump(), ttl_seconds=cache.TTL_TRAINING)
-    
-    return response
+    # While running, surface the orchestrator's latest progress step
+    if job.status == "IN_PROGRESS":
+        progress = cache_service.get(TRAINING_PROGRESS_KEY)
+        if progress:
+            job.message = progress
+    return job
 
 
 class CachedTrainingResponse(BaseModel):
@@ -238,7 +339,7 @@ async def get_cached_training_data(
         )
 
 
-@router.post("/train/run-now")
+@router.post("/train/run-now", status_code=202)
 async def trigger_training_now(
     background_tasks: BackgroundTasks,
 ):
@@ -256,6 +357,12 @@ async def trigger_training_now(
             status_code=400,
             detail="Serverless Mode Active: Training must be triggered via GitHub Actions (update_predictions workflow)."
         )
+    
+    # The scheduled job silently skips while another run (any process) holds the lease
+    if get_cache_service().is_locked(TRAINING_LOCK_NAME) or any(
+        job.status in ("QUEUED", "IN_PROGRESS") for job in _TRAINING_JOBS.values()
+    ):
+        raise HTTPException(status_code=409, detail="A training session is already queued or running.")
 
     try:
         from src.scheduler import get_scheduler
@@ -294,8 +401,10 @@ async def get_training_status(
     CACHE_KEY_RESULT = "ml_training_result_data"
     DB_KEY_RESULT = "latest_daily"
     
-    status = cache_service.get(CACHE_KEY_STATUS) or "IDLE"
-    message = cache_service.get(CACHE_KEY_MESSAGE)
+    # One batched lookup for all three training keys
+    cached = cache_service.get_many([CACHE_KEY_STATUS, CACHE_KEY_MESSAGE, CACHE_KEY_RESULT])
+    status = cached.get(CACHE_KEY_STATUS) or "IDLE"
+    message = cached.get(CACHE_KEY_MESSAGE)
     result_data = None
     last_update_ts = None
     
@@ -322,7 +431,7 @@ async def get_training_status(
         else: message = f"Estado: {status}"
 
     # Always try to get result data if available
-    result_data = cache_service.get(CACHE_KEY_RESULT)
+    result_data = cached.get(CACHE_KEY_RESULT)
     
     # If cache miss, try DB result
     if not result_data:
@@ -11,7 +11,12 @@ from typing import List, Any
 import logging
 from fastapi import APIRouter, HTTPException, Depends, Query, Path
 from src.application.dtos.dtos import MatchDTO, TeamDTO, LeagueDTO, ErrorResponseDTO, MatchPredictionDTO, MatchEventDTO
-from src.application.use_cases.use_cases import DataSources, GetTeamPredictionsUseCase
+from src.application.use_cases.use_cases import (
+    DataSources,
+    GetTeamPredictionsUseCase,
+    GetGlobalLiveMatchesUseCase,
+    GetGlobalDailyMatchesUseCase,
+)
 from src.application.use_cases.live_predictions_use_case import GetLivePredictionsUseCase
 from src.api.dependencies import (
     get_data_sources,
@@ -21,15 +26,14 @@ from src.api.dependencies import (
     get_picks_service,
     get_persistence_repository,
 )
-from src.utils.time_utils import to_colombia_time
+from src.domain.services.team_service import TeamService
+from src.utils.time_utils import to_colombia_time, get_today_str
 
 router = APIRouter(prefix="/matches", tags=["Matches"])
 logger = logging.getLogger(__name__)
 
 def _map_match_to_dto(match: Any) -> MatchDTO:
     """Helper function to convert domain Match object to MatchDTO."""
-    from src.domain.services.team_service import TeamService
-    
     return MatchDTO(
         id=match.id,
         home_team=TeamDTO(
@@ -110,7 +114,6 @@ async def get_live_matches(
             # logger.info("Using cached global live matches")
             return [MatchDTO(**m) if isinstance(m, dict) else m for m in cached_data]
 
-        from src.application.use_cases.use_cases import GetGlobalLiveMatchesUseCase
         use_case = GetGlobalLiveMatchesUseCase(data_sources, persistence_repository=persistence_repository)
         result = await use_case.execute()
         
@@ -144,7 +147,6 @@ async def get_daily_matches(
 ) -> List[MatchDTO]:
     """Get all daily matches using aggregated sources (NO MOCK DATA)."""
     try:
-        from src.utils.time_utils import get_today_str
         target_date = date_str if date_str else get_today_str()
         
         # Check Cache First
@@ -156,7 +158,6 @@ async def get_daily_matches(
             # logger.info(f"Using cached daily matches for {target_date}")
             return [MatchDTO(**m) if isinstance(m, dict) else m for m in cached_data]
 
-        from src.application.use_cases.use_cases import GetGlobalDailyMatchesUseCase
         use_case = GetGlobalDailyMatchesUseCase(data_sources, persistence_repository=persistence_repository)
         result = await use_case.execute(date_str)
         
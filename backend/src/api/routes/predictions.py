@@ -13,7 +13,16 @@ from src.application.dtos.dtos import (
     ErrorResponseDTO,
     SortBy,
 )
-from src.api.dependencies import get_data_sources, get_prediction_service
+from src.application.use_cases.use_cases import GetPredictionsUseCase
+from src.api.dependencies import (
+    get_data_sources,
+    get_prediction_service,
+    get_background_processor,
+    get_statistics_service,
+    get_persistence_repository,
+)
+from src.domain.services.team_service import TeamService
+from src.infrastructure.cache.cache_service import get_cache_service
 
 import logging
 logger = logging.getLogger(__name__)
@@ -38,14 +47,6 @@ async def get_league_predictions(
     league_id: str,
 ) -> PredictionsResponseDTO:
     """Get predictions for a league with multi-layer fallback."""
-    from src.api.dependencies import (
-        get_data_sources, get_prediction_service, 
-        get_background_processor, get_statistics_service,
-        get_persistence_repository
-    )
-    from src.application.use_cases.use_cases import GetPredictionsUseCase
-    from src.domain.services.team_service import TeamService
-    
     try:
         # GetPredictionsUseCase now handles Cache -> DB logic internally
         use_case = GetPredictionsUseCase(
@@ -96,8 +97,6 @@ async def get_league_predictions(
 )
 async def get_match_prediction(match_id: str) -> MatchPredictionDTO:
     """Get pre-calculated prediction for a specific match from local cache."""
-    from src.infrastructure.cache.cache_service import get_cache_service
-    
     cache = get_cache_service()
     # Key format: forecasts:match_{match_id}
     cache_key = f"forecasts:match_{match_id}"
@@ -192,6 +192,8 @@ class HealthResponseDTO(BaseModel):
     status: str = "healthy"
     version: str = "1.0.0"
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ErrorResponseDTO(BaseModel):
@@ -199,6 +201,8 @@ class ErrorResponseDTO(BaseModel):
     error: str
     message: str
     details: Optional[dict] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # ============================================================
@@ -1,14 +1,13 @@
 import asyncio
 import logging
 import os
-import warnings
+from array import array
+from collections import Counter, deque
+from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel
 
-# Suppress DeprecationWarnings from utcnow() used in ML libraries
-warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*utcnow.*")
-
 # ML Imports will be lazy-loaded in the methods that need them
 # to prevent memory spikes on startup (Render Free Tier Optimization)
 ML_AVAILABLE = True # Assumed true, checked at runtime
@@ -43,6 +42,19 @@ class TrainingResult(BaseModel):
     team_stats: dict = {}
     global_averages: dict = {} # Calculated from the entire 10-year dataset
 
+@dataclass
+class BacktestState:
+    """Accumulators produced by the day-by-day backtest."""
+    matches_processed: int
+    total_bets: int
+    total_staked: float
+    total_return: float
+    daily_stats: dict
+    match_history: deque
+    ml_features: array  # flat float32 rows, one per target
+    ml_targets: array
+    team_stats_cache: dict
+
 class MLTrainingOrchestrator:
     """
     Application service that orchestrates the entire ML training pipeline.
@@ -55,6 +67,9 @@ class MLTrainingOrchestrator:
     # Go up from application/services -> src -> backend
     MODEL_FILE_PATH = os.path.join(_current_dir, "..", "..", "..", "ml_picks_classifier.joblib")
 
+    # Max backtest entries kept in the cached training result
+    MAX_MATCH_HISTORY = 500
+
     def __init__(
         self,
         training_data_service: TrainingDataService,
@@ -111,21 +126,6 @@ class MLTrainingOrchestrator:
         # 1. Initialize logic-dependant services
         picks_service_instance = AIPicksService(learning_weights=self.learning_service.get_learning_weights())
         
-        matches_processed = 0
-        correct_predictions = 0
-        total_bets = 0
-        total_staked = 0.0
-        total_return = 0.0
-        daily_stats = {}
-        match_history = []
-        
-        # ML Training Data accumulation
-        ml_features = []
-        ml_targets = []
-        
-        # Team stats cache for rolling historical stats
-        team_stats_cache = {}
-
         try:
             # 2. Fetch & Unify matches (Centralized Orchestration)
             self.cache_service.set(self.CACHE_KEY_MESSAGE, "Recuperando datos históricos de múltiples ligas...", ttl_seconds=3600)
@@ -137,20 +137,16 @@ class MLTrainingOrchestrator:
                 force_refresh=force_refresh
             )
             
-            # Detailed Logging for visibility
-            source_stats = {}
-            league_stats = {}
-            for m in all_matches:
-                src = m.id.split('_')[0] if '_' in m.id else "unknown"
-                source_stats[src] = source_stats.get(src, 0) + 1
-                league_stats[m.league.id] = league_stats.get(m.league.id, 0) + 1
+            # Detailed Logging for visibility (Counter tallies generators in C)
+            source_stats = Counter(m.id.partition('_')[0] if '_' in m.id else "unknown" for m in all_matches)
+            league_stats = Counter(m.league.id for m in all_matches)
             
-            logger.info(f"Fetched {len(all_matches)} total matches. Sources: {source_stats}. Leagues: {league_stats}")
+            logger.info(f"Fetched {len(all_matches)} total matches. Sources: {dict(source_stats)}. Leagues: {dict(league_stats)}")
             
         except Exception as e:
-            logger.error(f"Failed to fetch training data: {e}")
+            logger.exception(f"Failed to fetch training data: {e}")
             self.cache_service.set(self.CACHE_KEY_STATUS, "ERROR", ttl_seconds=3600)
-            raise e
+            raise
 
         # 3. Pre-calculate REAL league averages
         league_matches_map = {}
@@ -203,227 +199,27 @@ class MLTrainingOrchestrator:
         MIN_TRAIN_SAMPLES = 50 
         
         try:
-            for daily_matches in matches_by_day:
-            
-                # A. Rolling Training DISABLED for performance on 512MB RAM / 0.1 CPU
-                # Retraining inside the loop is too heavy. We rely on Heuristics for the backtest,
-                # and train the ML model ONLY once at the end.
-                # if ML_AVAILABLE and RandomForestClassifier and len(ml_features) >= MIN_TRAIN_SAMPLES:
-                #      # Retrain periodically (e.g. every 50 new samples) or every day if fast enough
-                #      # For now, let's retrain every ~200 samples to simulate periodic model updates
-                #          if len(ml_features) % 200 < len(daily_matches) or len(ml_features) == MIN_TRAIN_SAMPLES:
-                #              try:
-                #                 # Run CPU-bound training in thread to avoid blocking event loop
-                #                 def _train_step(features, targets):
-                #                     c = RandomForestClassifier(
-                #                         n_estimators=150, 
-                #                         max_depth=8, 
-                #                         random_state=42, 
-                #                         n_jobs=-1,
-                #                         class_weight='balanced'
-                #                     )
-                #                     c.fit(features, targets)
-                #                     return c
-                #                 
-                #                 loop = asyncio.get_running_loop()
-                #                 clf = await loop.run_in_executor(None, _train_step, ml_features, ml_targets)
-                #                 
-                #                 picks_service_instance.ml_model = clf
-                #              except Exception as e:
-                #                 logger.warning(f"Rolling Window Training Limit: {e}")
-    
-                # B. Generate Candidates for TODAY
-                daily_candidates = [] # List of {'pick': SuggestedPick, 'match': Match}
-                
-                for match in daily_matches:
-                    if match.home_goals is None or match.away_goals is None: continue
-    
-                    # Get/Create stats (Centralized)
-                    if match.home_team.name not in team_stats_cache: 
-                        team_stats_cache[match.home_team.name] = self.statistics_service.create_empty_stats_dict()
-                    if match.away_team.name not in team_stats_cache: 
-                        team_stats_cache[match.away_team.name] = self.statistics_service.create_empty_stats_dict()
-                        
-                    raw_home = team_stats_cache[match.home_team.name]
-                    raw_away = team_stats_cache[match.away_team.name]
-                    
-                    home_stats = self.statistics_service.convert_to_domain_stats(match.home_team.name, raw_home)
-                    away_stats = self.statistics_service.convert_to_domain_stats(match.away_team.name, raw_away)
-                    league_averages = league_averages_map.get(match.league.id) 
-    
-                    try:
-                        # PREDICT using current knowledge
-                        prediction = self.prediction_service.generate_prediction(
-                            match=match, 
-                            home_stats=home_stats, 
-                            away_stats=away_stats, 
-                            league_averages=league_averages,
-                            global_averages=global_averages_obj,
-                            min_matches=0
-                        )
-                        
-                        matches_processed += 1
-                        
-                        # GENERATE PICKS
-                        suggested_picks_container = picks_service_instance.generate_suggested_picks(
-                            match=match, home_stats=home_stats, away_stats=away_stats, league_averages=league_averages,
-                            predicted_home_goals=prediction.predicted_home_goals, predicted_away_goals=prediction.predicted_away_goals,
-                            home_win_prob=prediction.home_win_probability, draw_prob=prediction.draw_probability, away_win_prob=prediction.away_win_probability
-                        )
-                        
-                        if suggested_picks_container and suggested_picks_container.suggested_picks:
-                            for p in suggested_picks_container.suggested_picks:
-                                daily_candidates.append({'pick': p, 'match': match, 'prediction': prediction})
-                                
-                    except Exception as e:
-                        logger.error(f"Error processing match {match.id}: {e}")
-                        continue
-    
-                # C. Apply Portfolio Constraints (Risk Manager)
-                # This filters the day's candidates to select the best portfolio respecting risk limits
-                approved_items = self.risk_manager.apply_portfolio_constraints(daily_candidates)
-                
-                # Mapping to easily find approved picks per match for history
-                approved_picks_map = {} # match_id -> list of picks
-                for item in approved_items:
-                    mid = item['match'].id
-                    if mid not in approved_picks_map: approved_picks_map[mid] = []
-                    approved_picks_map[mid].append(item['pick'])
-    
-                # D. Resolve & Record Results
-                for match in daily_matches:
-                     # Skip if no stats/prediction made (error case)
-                     if match.home_goals is None: continue
-                     
-                     # Retrieve approved picks for this match (if any)
-                     my_picks = approved_picks_map.get(match.id, [])
-                     
-                     picks_list = []
-                     suggested_pick_label = None
-                     pick_was_correct = False
-                     max_ev_value = -100.0
-    
-                     for pick in my_picks:
-                        result_str, payout = self.resolution_service.resolve_pick(pick, match)
-                        is_won = (result_str == "WIN")
-                        
-                        p_detail = {
-                            "market_type": pick.market_type.value if hasattr(pick.market_type, "value") else str(pick.market_type),
-                            "market_label": pick.market_label,
-                            "was_correct": is_won,
-                            "probability": float(pick.probability),
-                            "expected_value": float(pick.expected_value),
-                            "confidence": float(pick.priority_score or pick.probability),
-                            "reasoning": pick.reasoning,
-                            "result": result_str,
-                            "suggested_stake": getattr(pick, "suggested_stake", 0.0),
-                            "kelly_percentage": getattr(pick, "kelly_percentage", 0.0),
-                            "is_ml_confirmed": getattr(pick, "is_ml_confirmed", False),
-                            "is_contrarian": float(pick.expected_value) > 0.05 # Flag as Value Bet if EV > 5%
-                        }
-                        
-                        # Store Features for FUTURE training
-                        # Re-constitute stats for feature extraction
-                        raw_home_feat = team_stats_cache.get(match.home_team.name, {})
-                        raw_away_feat = team_stats_cache.get(match.away_team.name, {})
-                        feat_home_stats = self.statistics_service.convert_to_domain_stats(match.home_team.name, raw_home_feat)
-                        feat_away_stats = self.statistics_service.convert_to_domain_stats(match.away_team.name, raw_away_feat)
-                        
-                        ml_features.append(self.feature_extractor.extract_features(pick, match, feat_home_stats, feat_away_stats))
-                        ml_targets.append(1 if is_won else 0)
-                        
-                        # Track ROI
-                        if p_detail["market_type"] in ["winner", "draw", "result_1x2"]:
-                             total_bets += 1
-                             total_staked += p_detail["suggested_stake"] # Use calculated unit stake
-                             total_return += (p_detail["suggested_stake"] * payout) if payout > 0 else 0
-                             if float(pick.expected_value) > max_ev_value:
-                                  suggested_pick_label = pick.market_label
-                                  pick_was_correct = is_won
-                                  max_ev_value = float(pick.expected_value)
-    
-                        # CLV
-                        closing_odds = 0.0
-                        if pick.market_type == "winner":
-                             if match.home_goals > match.away_goals: closing_odds = match.home_odds or 0.0
-                             elif match.away_goals > match.home_goals: closing_odds = match.away_odds or 0.0
-                             else: closing_odds = match.draw_odds or 0.0
-                        elif pick.market_type == "draw":
-                             closing_odds = match.draw_odds or 0.0
-                        
-                        p_detail["opening_odds"] = pick.odds
-                        p_detail["closing_odds"] = closing_odds
-                        p_detail["clv_beat"] = pick.odds > closing_odds if closing_odds > 1.0 else False
-                        
-                        picks_list.append(p_detail)
-                        
-                        # Daily stats update
-                        date_key = match.match_date.strftime("%Y-%m-%d")
-                        if date_key not in daily_stats: 
-                            daily_stats[date_key] = {'staked': 0.0, 'return': 0.0, 'count': 0}
-                        daily_stats[date_key]['staked'] += p_detail["suggested_stake"]
-                        daily_stats[date_key]['return'] += (p_detail["suggested_stake"] * payout) if payout > 0 else 0
-                        daily_stats[date_key]['count'] += 1
-    
-                     # Get prediction from candidates (hacky lookup)
-                     # Better: re-run prediction or store it. We stored it in 'daily_candidates'.
-                     # Let's just create a basic history entry even if no picks were approved
-                     # But we need the prediction object.
-                     # Let's find the prediction in daily_candidates or regenerate simple one.
-                     # Optimization: Store prediction in a temp map above.
-                     
-                     # Simple approach: Re-generate prediction just for logging? No, waste.
-                     # Let's map match_id -> prediction in the B loop.
-                     pass # We handle this by populating history ONLY if we processed it.
-                     
-                     # Actually, we want history for ALL matches to show "No Bet" ones too?
-                     # Yes, usually. But for now let's focus on Active Betting History.
-                     
-                     if picks_list:
-                         # Re-find prediction (optimization: store in map)
-                         pred_obj = next((x['prediction'] for x in daily_candidates if x['match'].id == match.id), None)
-                         if pred_obj:
-                            # Limit match_history to prevent huge cache objects (OOM risk)
-                            if len(match_history) > 500:
-                                match_history.pop(0)
-                                
-                            match_history.append({
-                                "match_id": match.id,
-                                "home_team": match.home_team.name,
-                                "away_team": match.away_team.name,
-                                "match_date": match.match_date.isoformat(),
-                                "predicted_winner": self._get_predicted_winner(pred_obj),
-                                "actual_winner": self._get_actual_winner(match),
-                                "predicted_home_goals": round(pred_obj.predicted_home_goals, 2),
-                                "predicted_away_goals": round(pred_obj.predicted_away_goals, 2),
-                                "actual_home_goals": match.home_goals,
-                                "actual_away_goals": match.away_goals,
-                                "was_correct": self._get_predicted_winner(pred_obj) == self._get_actual_winner(match),
-                                "confidence": round(pred_obj.confidence, 3),
-                                "picks": picks_list,
-                                "suggested_pick": suggested_pick_label,
-                                "pick_was_correct": pick_was_correct,
-                                "expected_value": max_ev_value
-                            })
-    
-                # E. Update Stats (After Day is Done) - The "Nightly Update"
-                # Crucial: We update stats using ALL matches of the day, even those we didn't bet on.
-                # E. Update Stats (After Day is Done) - The "Nightly Update"
-                # Crucial: We update stats using ALL matches of the day, even those we didn't bet on.
-                for match in daily_matches:
-                    if match.home_team.name in team_stats_cache:
-                        self.statistics_service.update_team_stats_dict(team_stats_cache[match.home_team.name], match, is_home=True)
-                    if match.away_team.name in team_stats_cache:
-                        self.statistics_service.update_team_stats_dict(team_stats_cache[match.away_team.name], match, is_home=False)
-                
-                # Yield control to event loop to allow other requests (health checks, polling) to be processed
-                await asyncio.sleep(0)
+            # The day-by-day simulation is pure CPU work: run it in a worker thread
+            # so health checks and status polling are still served meanwhile
+            loop = asyncio.get_running_loop()
+            backtest = await loop.run_in_executor(
+                None,
+                self._run_backtest,
+                matches_by_day,
+                league_averages_map,
+                global_averages_obj,
+                picks_service_instance,
+            )
+            del matches_by_day
+            match_history = backtest.match_history
+            ml_features, ml_targets = backtest.ml_features, backtest.ml_targets
+            team_stats_cache = backtest.team_stats_cache
         
             # --- TRAIN ML MODEL ---
             self.cache_service.set(self.CACHE_KEY_MESSAGE, "Entrenando modelo de Machine Learning (Random Forest)...", ttl_seconds=3600)
-            if ML_AVAILABLE and RandomForestClassifier and len(ml_features) > 100:
+            if ML_AVAILABLE and RandomForestClassifier and len(ml_targets) > 100:
                 try:
-                    logger.info(f"Training ML Model on {len(ml_features)} samples...")
+                    logger.info(f"Training ML Model on {len(ml_targets)} samples...")
                     
                     # Offload CPU-bound training to a thread
                     def _train_and_save():
@@ -438,35 +234,40 @@ class MLTrainingOrchestrator:
                             class_weight='balanced',
                             n_jobs=-1
                         )
-                        clf.fit(ml_features, ml_targets)
+                        # Zero-copy views; the forest trains on float32 features anyway
+                        import numpy as np
+                        X = np.frombuffer(ml_features, dtype=np.float32).reshape(len(ml_targets), -1)
+                        y = np.frombuffer(ml_targets, dtype=np.int8)
+                        clf.fit(X, y)
                         
-                        # Save to absolute path
-                        joblib.dump(clf, self.MODEL_FILE_PATH)
+                        # Save to absolute path via a temp file so readers never see a partial model
+                        tmp_path = f"{self.MODEL_FILE_PATH}.tmp"
+                        joblib.dump(clf, tmp_path)
+                        os.replace(tmp_path, self.MODEL_FILE_PATH)
                         return clf
     
-                    loop = asyncio.get_running_loop()
                     await loop.run_in_executor(None, _train_and_save)
                     
                     logger.info("ML Model trained and saved.")
                 except Exception as e:
-                    logger.error(f"Failed to train ML model: {e}")
+                    logger.exception(f"Failed to train ML model: {e}")
             
             # --- PREPARE RESULTS ---
             self.cache_service.set(self.CACHE_KEY_MESSAGE, "Consolidando métricas y evolución de ROI...", ttl_seconds=3600)
             accuracy = self._calculate_accuracy(match_history)
-            profit = total_return - total_staked
-            roi = (profit / total_staked * 100) if total_staked > 0 else 0.0
+            profit = backtest.total_return - backtest.total_staked
+            roi = (profit / backtest.total_staked * 100) if backtest.total_staked > 0 else 0.0
             
             final_result = TrainingResult(
-                matches_processed=matches_processed,
+                matches_processed=backtest.matches_processed,
                 correct_predictions=self._get_correct_count(match_history),
                 accuracy=round(accuracy, 4),
-                total_bets=total_bets,
+                total_bets=backtest.total_bets,
                 roi=round(roi, 2),
                 profit_units=round(profit, 2),
                 market_stats=self.learning_service.get_all_stats(),
-                match_history=match_history,
-                roi_evolution=self._calculate_roi_evolution(daily_stats),
+                match_history=list(match_history),
+                roi_evolution=self._calculate_roi_evolution(backtest.daily_stats),
                 pick_efficiency=self._calculate_pick_efficiency(match_history),
                 team_stats=team_stats_cache,
                 global_averages=global_averages
@@ -482,8 +283,8 @@ class MLTrainingOrchestrator:
             # Save result to cache and update status
             # This enables the "Bot Dashboard" button on the frontend
             # Use simple dict conversion that handles nested models if possible, else rely on Pydantic's dict()
-            # Note: TrainingResult is a Pydantic model, so .dict() or .model_dump() works
-            result_data = final_result.model_dump() if hasattr(final_result, 'model_dump') else final_result.dict()
+            # Note: TrainingResult is a Pydantic v2 model, so model_dump() is always available
+            result_data = final_result.model_dump()
             
             self.cache_service.set(self.CACHE_KEY_RESULT, result_data, ttl_seconds=self.cache_service.TTL_TRAINING)
             self.cache_service.set(self.CACHE_KEY_STATUS, "COMPLETED", ttl_seconds=self.cache_service.TTL_TRAINING)
@@ -503,10 +304,255 @@ class MLTrainingOrchestrator:
             return final_result
 
         except Exception as e:
-            logger.error(f"Critical error in training pipeline: {e}")
+            logger.exception(f"Critical error in training pipeline: {e}")
             self.cache_service.set(self.CACHE_KEY_STATUS, "ERROR", ttl_seconds=3600)
             self.cache_service.set(self.CACHE_KEY_MESSAGE, f"Error crítico: {str(e)}", ttl_seconds=3600)
-            raise e
+            raise
+
+    def _run_backtest(
+        self,
+        matches_by_day: List[List[Match]],
+        league_averages_map: Dict[str, Any],
+        global_averages_obj: Any,
+        picks_service_instance: AIPicksService,
+    ) -> "BacktestState":
+        """
+        Replay matches day by day: predict, pick, resolve and update rolling team stats.
+        Synchronous so it can run in an executor thread away from the event loop.
+        """
+        matches_processed = 0
+        total_bets = 0
+        total_staked = 0.0
+        total_return = 0.0
+        daily_stats = {}
+        # Bounded history to prevent huge cache objects (OOM risk); deque drops
+        # the oldest entry in O(1) instead of list.pop(0) shifting every item.
+        match_history = deque(maxlen=self.MAX_MATCH_HISTORY)
+        
+        # ML Training Data accumulation, packed as float32 / int8 instead of
+        # lists of Python floats (~4 bytes per value instead of ~32)
+        ml_features = array('f')
+        ml_targets = array('b')
+        
+        # Team stats cache for rolling historical stats
+        team_stats_cache = {}
+
+        for daily_matches in matches_by_day:
+        
+            # A. Rolling Training DISABLED for performance on 512MB RAM / 0.1 CPU
+            # Retraining inside the loop is too heavy. We rely on Heuristics for the backtest,
+            # and train the ML model ONLY once at the end.
+            # if ML_AVAILABLE and RandomForestClassifier and len(ml_features) >= MIN_TRAIN_SAMPLES:
+            #      # Retrain periodically (e.g. every 50 new samples) or every day if fast enough
+            #      # For now, let's retrain every ~200 samples to simulate periodic model updates
+            #          if len(ml_features) % 200 < len(daily_matches) or len(ml_features) == MIN_TRAIN_SAMPLES:
+            #              try:
+            #                 # Run CPU-bound training in thread to avoid blocking event loop
+            #                 def _train_step(features, targets):
+            #                     c = RandomForestClassifier(
+            #                         n_estimators=150, 
+            #                         max_depth=8, 
+            #                         random_state=42, 
+            #                         n_jobs=-1,
+            #                         class_weight='balanced'
+            #                     )
+            #                     c.fit(features, targets)
+            #                     return c
+            #                 
+            #                 loop = asyncio.get_running_loop()
+            #                 clf = await loop.run_in_executor(None, _train_step, ml_features, ml_targets)
+            #                 
+            #                 picks_service_instance.ml_model = clf
+            #              except Exception as e:
+            #                 logger.warning(f"Rolling Window Training Limit: {e}")
+
+            # B. Generate Candidates for TODAY
+            daily_candidates = [] # List of {'pick': SuggestedPick, 'match': Match}
+            daily_predictions = {} # match_id -> prediction, for the history lookup in D
+            daily_team_stats = {} # match_id -> (home_stats, away_stats), reused for ML features in D
+            
+            for match in daily_matches:
+                if match.home_goals is None or match.away_goals is None: continue
+
+                # Get/Create stats (Centralized)
+                if match.home_team.name not in team_stats_cache: 
+                    team_stats_cache[match.home_team.name] = self.statistics_service.create_empty_stats_dict()
+                if match.away_team.name not in team_stats_cache: 
+                    team_stats_cache[match.away_team.name] = self.statistics_service.create_empty_stats_dict()
+                    
+                raw_home = team_stats_cache[match.home_team.name]
+                raw_away = team_stats_cache[match.away_team.name]
+                
+                home_stats = self.statistics_service.convert_to_domain_stats(match.home_team.name, raw_home)
+                away_stats = self.statistics_service.convert_to_domain_stats(match.away_team.name, raw_away)
+                daily_team_stats[match.id] = (home_stats, away_stats)
+                league_averages = league_averages_map.get(match.league.id) 
+
+                try:
+                    # PREDICT using current knowledge
+                    prediction = self.prediction_service.generate_prediction(
+                        match=match, 
+                        home_stats=home_stats, 
+                        away_stats=away_stats, 
+                        league_averages=league_averages,
+                        global_averages=global_averages_obj,
+                        min_matches=0
+                    )
+                    
+                    matches_processed += 1
+                    daily_predictions[match.id] = prediction
+                    
+                    # GENERATE PICKS
+                    suggested_picks_container = picks_service_instance.generate_suggested_picks(
+                        match=match, home_stats=home_stats, away_stats=away_stats, league_averages=league_averages,
+                        predicted_home_goals=prediction.predicted_home_goals, predicted_away_goals=prediction.predicted_away_goals,
+                        home_win_prob=prediction.home_win_probability, draw_prob=prediction.draw_probability, away_win_prob=prediction.away_win_probability
+                    )
+                    
+                    if suggested_picks_container and suggested_picks_container.suggested_picks:
+                        for p in suggested_picks_container.suggested_picks:
+                            daily_candidates.append({'pick': p, 'match': match, 'prediction': prediction})
+                            
+                except Exception as e:
+                    logger.error(f"Error processing match {match.id}: {e}")
+                    continue
+
+            # C. Apply Portfolio Constraints (Risk Manager)
+            # This filters the day's candidates to select the best portfolio respecting risk limits
+            approved_items = self.risk_manager.apply_portfolio_constraints(daily_candidates)
+            
+            # Mapping to easily find approved picks per match for history
+            approved_picks_map = {} # match_id -> list of picks
+            for item in approved_items:
+                mid = item['match'].id
+                if mid not in approved_picks_map: approved_picks_map[mid] = []
+                approved_picks_map[mid].append(item['pick'])
+
+            # D. Resolve & Record Results
+            for match in daily_matches:
+                 # Skip if no stats/prediction made (error case)
+                 if match.home_goals is None: continue
+                 
+                 # Retrieve approved picks for this match (if any)
+                 my_picks = approved_picks_map.get(match.id, [])
+                 
+                 picks_list = []
+                 suggested_pick_label = None
+                 pick_was_correct = False
+                 max_ev_value = -100.0
+                 if my_picks:
+                     date_key = match.match_date.strftime("%Y-%m-%d")
+                     day_stats = daily_stats.setdefault(date_key, {'staked': 0.0, 'return': 0.0, 'count': 0})
+
+                 for pick in my_picks:
+                    result_str, payout = self.resolution_service.resolve_pick(pick, match)
+                    is_won = (result_str == "WIN")
+                    expected_value = float(pick.expected_value)
+                    
+                    p_detail = {
+                        "market_type": pick.market_type.value if hasattr(pick.market_type, "value") else str(pick.market_type),
+                        "market_label": pick.market_label,
+                        "was_correct": is_won,
+                        "probability": float(pick.probability),
+                        "expected_value": expected_value,
+                        "confidence": float(pick.priority_score or pick.probability),
+                        "reasoning": pick.reasoning,
+                        "result": result_str,
+                        "suggested_stake": getattr(pick, "suggested_stake", 0.0),
+                        "kelly_percentage": getattr(pick, "kelly_percentage", 0.0),
+                        "is_ml_confirmed": getattr(pick, "is_ml_confirmed", False),
+                        "is_contrarian": expected_value > 0.05 # Flag as Value Bet if EV > 5%
+                    }
+                    stake = p_detail["suggested_stake"]
+                    pick_return = stake * payout if payout > 0 else 0
+                    
+                    # Store Features for FUTURE training
+                    # Team stats only change in E, so the snapshot taken in B is still current
+                    feat_home_stats, feat_away_stats = daily_team_stats[match.id]
+                    
+                    ml_features.extend(self.feature_extractor.extract_features(pick, match, feat_home_stats, feat_away_stats))
+                    ml_targets.append(1 if is_won else 0)
+                    
+                    # Track ROI
+                    if p_detail["market_type"] in ["winner", "draw", "result_1x2"]:
+                         total_bets += 1
+                         total_staked += stake # Use calculated unit stake
+                         total_return += pick_return
+                         if expected_value > max_ev_value:
+                              suggested_pick_label = pick.market_label
+                              pick_was_correct = is_won
+                              max_ev_value = expected_value
+
+                    # CLV
+                    closing_odds = 0.0
+                    if pick.market_type == "winner":
+                         if match.home_goals > match.away_goals: closing_odds = match.home_odds or 0.0
+                         elif match.away_goals > match.home_goals: closing_odds = match.away_odds or 0.0
+                         else: closing_odds = match.draw_odds or 0.0
+                    elif pick.market_type == "draw":
+                         closing_odds = match.draw_odds or 0.0
+                    
+                    p_detail["opening_odds"] = pick.odds
+                    p_detail["closing_odds"] = closing_odds
+                    p_detail["clv_beat"] = pick.odds > closing_odds if closing_odds > 1.0 else False
+                    
+                    picks_list.append(p_detail)
+                    
+                    # Daily stats update
+                    day_stats['staked'] += stake
+                    day_stats['return'] += pick_return
+                    day_stats['count'] += 1
+
+                 # History covers Active Betting only (matches with approved picks).
+                 # Actually, we want history for ALL matches to show "No Bet" ones too?
+                 # Yes, usually. But for now let's focus on Active Betting History.
+                 
+                 if picks_list:
+                     # Prediction stored in B (O(1) instead of scanning the day's candidates)
+                     pred_obj = daily_predictions.get(match.id)
+                     if pred_obj:
+                        predicted_winner = self._get_predicted_winner(pred_obj)
+                        actual_winner = self._get_actual_winner(match)
+                        match_history.append({
+                            "match_id": match.id,
+                            "home_team": match.home_team.name,
+                            "away_team": match.away_team.name,
+                            "match_date": match.match_date.isoformat(),
+                            "predicted_winner": predicted_winner,
+                            "actual_winner": actual_winner,
+                            "predicted_home_goals": round(pred_obj.predicted_home_goals, 2),
+                            "predicted_away_goals": round(pred_obj.predicted_away_goals, 2),
+                            "actual_home_goals": match.home_goals,
+                            "actual_away_goals": match.away_goals,
+                            "was_correct": predicted_winner == actual_winner,
+                            "confidence": round(pred_obj.confidence, 3),
+                            "picks": picks_list,
+                            "suggested_pick": suggested_pick_label,
+                            "pick_was_correct": pick_was_correct,
+                            "expected_value": max_ev_value
+                        })
+
+            # E. Update Stats (After Day is Done) - The "Nightly Update"
+            # Crucial: We update stats using ALL matches of the day, even those we didn't bet on.
+            # E. Update Stats (After Day is Done) - The "Nightly Update"
+            # Crucial: We update stats using ALL matches of the day, even those we didn't bet on.
+            for match in daily_matches:
+                if match.home_team.name in team_stats_cache:
+                    self.statistics_service.update_team_stats_dict(team_stats_cache[match.home_team.name], match, is_home=True)
+                if match.away_team.name in team_stats_cache:
+                    self.statistics_service.update_team_stats_dict(team_stats_cache[match.away_team.name], match, is_home=False)
+
+        return BacktestState(
+            matches_processed=matches_processed,
+            total_bets=total_bets,
+            total_staked=total_staked,
+            total_return=total_return,
+            daily_stats=daily_stats,
+            match_history=match_history,
+            ml_features=ml_features,
+            ml_targets=ml_targets,
+            team_stats_cache=team_stats_cache,
+        )
 
     def _get_predicted_winner(self, prediction) -> str:
         if prediction.home_win_probability > prediction.away_win_probability and prediction.home_win_probability > prediction.draw_probability:
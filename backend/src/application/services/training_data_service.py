@@ -5,7 +5,10 @@ Orchestrates the fetching, merging, and enrichment of training data
 from multiple sources (GitHub, CSV, API-Football, ESPN, etc.).
 """
 
+import asyncio
 import logging
+from bisect import bisect_left
+from itertools import chain
 from datetime import datetime, timedelta
 from typing import List, Optional
 
@@ -20,6 +23,9 @@ class TrainingDataService:
     """
     Application service for orchestrating training data collection.
     """
+    
+    # Upper bound on leagues downloading CSV history at the same time
+    MAX_CONCURRENT_LEAGUE_FETCHES = 4
 
     def __init__(self, data_sources: DataSources, enrichment_service: MatchEnrichmentService):
         self.data_sources = data_sources
@@ -37,8 +43,16 @@ class TrainingDataService:
         """
         logger.info(f"Orchestrating comprehensive training data for leagues: {leagues}")
         
+        # Training window start, also used to skip CSV seasons that end before it
+        start_dt = None
+        if start_date:
+            try:
+                start_dt = COLOMBIA_TZ.localize(datetime.strptime(start_date, "%Y-%m-%d"))
+            except ValueError: pass
+        elif days_back:
+            start_dt = get_current_time().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days_back)
+        
         # Buckets for different sources
-        csv_matches = []
         api_fb_matches = []
         gh_matches = []
         espn_matches = []
@@ -57,41 +71,15 @@ class TrainingDataService:
         except Exception as e:
             logger.warning(f"GitHub Dataset fetch failed: {e}")
 
-        # 2. CSV source (Rich historical stats)
-        for league_id in leagues:
-            try:
-                # Use dynamic seasons logic inside get_historical_matches
-                matches = await self.data_sources.football_data_uk.get_historical_matches(
-                    league_id, 
-                    seasons=None, 
-                    force_refresh=force_refresh
-                )
-                
-                # --- BACKFILL STRATEGY ---
-                # Check if CSV data is stale (older than 3 days)
-                if matches:
-                    # Sort to find latest date
-                    matches.sort(key=lambda x: x.match_date)
-                    last_match_date = matches[-1].match_date
-                    
-                    # Ensure timezone awareness for comparison
-                    if last_match_date.tzinfo is None:
-                        last_match_date = COLOMBIA_TZ.localize(last_match_date)
-                        
-                    now = get_current_time()
-                    days_lag = (now - last_match_date).days
-                    
-                    if days_lag > 3:
-                        logger.warning(f"CSV data for {league_id} is stale ({days_lag} days lag). Triggering backfill...")
-                        start_backfill = last_match_date + timedelta(days=1)
-                        gap_matches = await self._backfill_gap(league_id, start_backfill, now)
-                        if gap_matches:
-                            logger.info(f"Backfilled {len(gap_matches)} matches for {league_id}")
-                            matches.extend(gap_matches)
-                
-                csv_matches.extend(matches)
-            except Exception as e:
-                logger.error(f"Error fetching CSV/Backfill for {league_id}: {e}")
+        # 2. CSV source (Rich historical stats), fetched for several leagues at once
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_LEAGUE_FETCHES)
+        
+        async def fetch_league(league_id: str) -> List[Match]:
+            async with semaphore:
+                return await self._fetch_csv_league(league_id, force_refresh, since=start_dt)
+        
+        league_results = await asyncio.gather(*(fetch_league(league_id) for league_id in leagues))
+        csv_matches = list(chain.from_iterable(league_results))
 
 
         # 4. ESPN (Detailed recent stats)
@@ -115,19 +103,56 @@ class TrainingDataService:
 
         all_matches.sort(key=get_sortable_date)
         
-        # Final filtering
-        if start_date:
-            try:
-                start_dt = COLOMBIA_TZ.localize(datetime.strptime(start_date, "%Y-%m-%d"))
-                all_matches = [m for m in all_matches if get_sortable_date(m) >= start_dt]
-            except ValueError: pass
-        elif days_back:
-            start_dt = get_current_time().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days_back)
-            all_matches = [m for m in all_matches if get_sortable_date(m) >= start_dt]
+        # Final filtering: the matches are sorted, so the window start is a
+        # bisection that localizes O(log n) dates instead of every match's
+        if start_dt:
+            all_matches = all_matches[bisect_left(all_matches, start_dt, key=get_sortable_date):]
 
         logger.info(f"Unification complete: {len(all_matches)} total training matches")
         return all_matches
 
+    async def _fetch_csv_league(
+        self, league_id: str, force_refresh: bool, since: Optional[datetime] = None
+    ) -> List[Match]:
+        """
+        Fetch one league's CSV history, backfilling if it is stale.
+        Errors are logged and yield an empty list so other leagues still load.
+        """
+        try:
+            # Use dynamic seasons logic inside get_historical_matches
+            matches = await self.data_sources.football_data_uk.get_historical_matches(
+                league_id, 
+                seasons=None, 
+                force_refresh=force_refresh,
+                since=since,
+            )
+            
+            # --- BACKFILL STRATEGY ---
+            # Check if CSV data is stale (older than 3 days)
+            if matches:
+                # Only the latest date is needed (a linear max, the unified list is sorted later)
+                last_match_date = max(m.match_date for m in matches)
+                
+                # Ensure timezone awareness for comparison
+                if last_match_date.tzinfo is None:
+                    last_match_date = COLOMBIA_TZ.localize(last_match_date)
+                    
+                now = get_current_time()
+                days_lag = (now - last_match_date).days
+                
+                if days_lag > 3:
+                    logger.warning(f"CSV data for {league_id} is stale ({days_lag} days lag). Triggering backfill...")
+                    start_backfill = last_match_date + timedelta(days=1)
+                    gap_matches = await self._backfill_gap(league_id, start_backfill, now)
+                    if gap_matches:
+                        logger.info(f"Backfilled {len(gap_matches)} matches for {league_id}")
+                        matches.extend(gap_matches)
+            
+            return matches or []
+        except Exception as e:
+            logger.error(f"Error fetching CSV/Backfill for {league_id}: {e}")
+            return []
+
     async def _backfill_gap(self, league_code: str, start_date: datetime, end_date: datetime) -> List[Match]:
         """
         Fetch matches from API-Football to fill gap between static CSVs and today.
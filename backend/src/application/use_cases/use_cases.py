@@ -303,28 +303,29 @@ class GetPredictionsUseCase:
         match_tasks = []
         matches_processing_data = [] # To keep context for post-processing
         
-        for match in upcoming_matches[:limit]:
-            # Get team statistics using the generic service
-            home_stats = self.statistics_service.calculate_team_statistics(
-                match.home_team.name,
-                historical_matches,
-            )
-            away_stats = self.statistics_service.calculate_team_statistics(
-                match.away_team.name,
-                historical_matches,
-            )
+        # Team statistics for every team in the batch, from one pass over the history
+        batch_matches = upcoming_matches[:limit]
+        team_stats = self.statistics_service.calculate_team_statistics_for_teams(
+            [name for match in batch_matches for name in (match.home_team.name, match.away_team.name)],
+            historical_matches,
+        )
+        
+        # Global averages for fallback (same for every match in the batch)
+        global_avg_data = cache_service.get("global_statistical_averages")
+        global_averages = None
+        if global_avg_data:
+            try:
+                global_averages = LeagueAverages(**global_avg_data)
+            except (TypeError, ValueError) as e:
+                # A stale or malformed cache entry must not sink the whole league
+                logger.warning(f"Ignoring cached global averages: {e}")
+        
+        for match in batch_matches:
+            home_stats = team_stats[match.home_team.name]
+            away_stats = team_stats[match.away_team.name]
             
             # Generate prediction
             try:
-                # Fetch global averages for fallback
-                from src.infrastructure.cache.cache_service import get_cache_service
-                cache = get_cache_service()
-                global_avg_data = cache.get("global_statistical_averages")
-                global_averages = None
-                if global_avg_data:
-                    from src.domain.value_objects.value_objects import LeagueAverages
-                    global_averages = LeagueAverages(**global_avg_data)
-
                 prediction = self.prediction_service.generate_prediction(
                     match=match,
                     home_stats=home_stats,
@@ -761,9 +762,12 @@ class GetMatchDetailsUseCase:
                 except Exception as e:
                     logger.warning(f"Failed to fetch OpenFootball history details: {e}")
         
-        # 4. Calculate stats using whatever history we found (or empty list)
-        home_stats = self.statistics_service.calculate_team_statistics(match.home_team.name, historical_matches)
-        away_stats = self.statistics_service.calculate_team_statistics(match.away_team.name, historical_matches)
+        # 4. Calculate stats using whatever history we found (or empty list), one pass for both teams
+        team_stats = self.statistics_service.calculate_team_statistics_for_teams(
+            [match.home_team.name, match.away_team.name], historical_matches
+        )
+        home_stats = team_stats[match.home_team.name]
+        away_stats = team_stats[match.away_team.name]
         
         # Calculate league averages from history to enable fallback picks (Corners/Cards)
         league_averages = self.statistics_service.calculate_league_averages(historical_matches)
@@ -938,38 +942,51 @@ class GetTeamPredictionsUseCase:
         from src.infrastructure.data_sources.api_football import LEAGUE_ID_MAPPING
         api_id_to_code = {v: k for k, v in LEAGUE_ID_MAPPING.items()}
         
+        def to_internal_code(match: Match) -> Optional[str]:
+            """Map an API league ID to its internal league code, if known."""
+            try:
+                if match.league.id and match.league.id.isdigit():
+                    return api_id_to_code.get(int(match.league.id))
+            except Exception:
+                pass
+            return None
+        
+        match_codes = [to_internal_code(match) for match in matches]
+        
+        # A team's recent matches span only a few leagues: fetch each league's
+        # history once, all leagues concurrently, and average it once
+        league_codes = list(dict.fromkeys(code for code in match_codes if code))
+        histories = await asyncio.gather(
+            *(
+                self.data_sources.football_data_uk.get_historical_matches(code, seasons=["2425", "2324"])
+                for code in league_codes
+            ),
+            return_exceptions=True,
+        )
+        
+        league_history: dict[str, tuple[list[Match], LeagueAverages]] = {}
+        for code, history in zip(league_codes, histories):
+            if isinstance(history, Exception):
+                logger.warning(f"Failed to fetch history for {code}: {history}")
+                history = []
+            league_history[code] = (history, self.statistics_service.calculate_league_averages(history))
+        
         # Process each match
-        for match in matches:
+        for match, internal_league_code in zip(matches, match_codes):
             try:
-                # 3. Try to get historical context
-                historical_matches = []
-                internal_league_code = None
-                
-                try:
-                    # Try to map league ID
-                    if match.league.id and match.league.id.isdigit():
-                        lid = int(match.league.id)
-                        if lid in api_id_to_code:
-                            internal_league_code = api_id_to_code[lid]
-                except Exception:
-                    pass
-                    
-                if internal_league_code:
-                    try:
-                        # Fetch history (cached by service potentially)
-                        historical_matches = await self.data_sources.football_data_uk.get_historical_matches(
-                            internal_league_code,
-                            seasons=["2425", "2324"], 
-                        )
-                    except Exception:
-                        pass
+                # 3. Historical context (prefetched above)
+                historical_matches, league_averages = league_history.get(internal_league_code, ([], None))
                 
-                # 4. Calculate stats
-                home_stats = self.statistics_service.calculate_team_statistics(match.home_team.name, historical_matches)
-                away_stats = self.statistics_service.calculate_team_statistics(match.away_team.name, historical_matches)
+                # No history means no team stats: generate_prediction would reject the match
+                if not historical_matches:
+                    continue
                 
-                # Calculate league averages
-                league_averages = self.statistics_service.calculate_league_averages(historical_matches)
+                # 4. Calculate stats (one pass over the history for both teams)
+                team_stats = self.statistics_service.calculate_team_statistics_for_teams(
+                    [match.home_team.name, match.away_team.name], historical_matches
+                )
+                home_stats = team_stats[match.home_team.name]
+                away_stats = team_stats[match.away_team.name]
                 
                 # 5. Generate prediction
                 try:
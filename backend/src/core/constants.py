@@ -4,3 +4,12 @@ Centralized constants for the BJJ-BetSports backend.
 
 # Default leagues used for training and predictions
 DEFAULT_LEAGUES = ["E0", "SP1", "D1", "I1", "F1", "B1", "P1"]
+
+# Membership view of DEFAULT_LEAGUES for hot-path `in` checks
+DEFAULT_LEAGUES_SET = frozenset(DEFAULT_LEAGUES)
+
+# Cross-process lease held by whichever training run (scheduled or POST /train) is active
+TRAINING_LOCK_NAME = "daily_orchestrated"
+# The lease is not renewed: a run that outlives it no longer excludes a second one,
+# so keep this above the longest expected training run
+TRAINING_LOCK_TTL_SECONDS = 3600
@@ -22,7 +22,7 @@ class MatchOutcome(Enum):
     AWAY_WIN = "away_win"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Team:
     """
     Represents a football team.
@@ -44,7 +44,7 @@ class Team:
             raise ValueError("Team name cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class League:
     """
     Represents a football league or competition.
@@ -65,7 +65,7 @@ class League:
             raise ValueError("League name and country are required")
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """
     Represents a football match between two teams.
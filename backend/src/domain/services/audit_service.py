@@ -3,12 +3,15 @@ import random
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from src.core.constants import DEFAULT_LEAGUES
+from src.core.constants import DEFAULT_LEAGUES, DEFAULT_LEAGUES_SET
 from src.infrastructure.cache import get_cache_service
 from src.application.services.ml_training_orchestrator import MLTrainingOrchestrator
 
 logger = logging.getLogger(__name__)
 
+# Fields every cached pick must carry to pass the integrity check
+REQUIRED_PICK_FIELDS = frozenset(('market_label', 'probability', 'confidence', 'result'))
+
 class AuditService:
     """
     Service responsible for auditing the integrity, coverage, and freshness 
@@ -48,30 +51,38 @@ class AuditService:
         match_history = results.get('match_history', [])
         
         # 2. Analyze League Coverage
-        league_stats = {l: {'total': 0, 'recent': 0} for l in DEFAULT_LEAGUES}
+        # league_id -> [total, recent]
+        league_stats = {l: [0, 0] for l in DEFAULT_LEAGUES}
         missing_leagues = []
         
         now = datetime.now()
-        cutoff_30d = now - timedelta(days=30)
+        # ISO 8601 strings compare lexicographically; slicing to 19 chars drops
+        # the offset/'Z' suffix so no per-match datetime parsing is needed.
+        cutoff_30d = (now - timedelta(days=30)).isoformat()[:19]
         
         for match in match_history:
-            try:
-                # Extract league ID from match ID (format: LEAGUE_DATE_HOME_AWAY)
-                league_id = match['match_id'].split('_')[0]
-                if league_id in league_stats:
-                    league_stats[league_id]['total'] += 1
-                    
-                    # Check date
-                    m_date = datetime.fromisoformat(match['match_date'].replace('Z', '+00:00')).replace(tzinfo=None)
-                    if m_date >= cutoff_30d:
-                        league_stats[league_id]['recent'] += 1
-            except Exception:
+            # Guard clauses instead of try/except: malformed entries are skipped
+            # without raising, and out-of-scope leagues exit before any date work
+            match_id = match.get('match_id')
+            if not match_id:
+                continue
+            
+            # Extract league ID from match ID (format: LEAGUE_DATE_HOME_AWAY)
+            league_id = match_id.partition('_')[0]
+            if league_id not in DEFAULT_LEAGUES_SET:
                 continue
+            
+            stats = league_stats[league_id]
+            stats[0] += 1
+            
+            # Check date
+            match_date = match.get('match_date')
+            if match_date and match_date[:19] >= cutoff_30d:
+                stats[1] += 1
 
         # 3. Detect Missing/Stale Leagues
         for league_code in DEFAULT_LEAGUES:
-            stats = league_stats[league_code]
-            if stats['recent'] == 0:
+            if league_stats[league_code][1] == 0:
                 logger.warning(f"AUDIT: League {league_code} is missing or stale (0 recent matches).")
                 missing_leagues.append(league_code)
 
@@ -80,7 +91,9 @@ class AuditService:
         # 4. Data Integrity Check (Sample)
         if match_history:
             sample_size = min(30, len(match_history))
-            sample = random.sample(match_history, sample_size)
+            # Sampling with replacement is fine for a smoke check and avoids
+            # random.sample's bookkeeping over the whole history
+            sample = random.choices(match_history, k=sample_size)
             integrity_issues = 0
             
             for m in sample:
@@ -88,7 +101,7 @@ class AuditService:
                     integrity_issues += 1
                     continue
                 p = m['picks'][0]
-                if not all(k in p for k in ['market_label', 'probability', 'confidence', 'result']):
+                if not REQUIRED_PICK_FIELDS <= p.keys():
                     integrity_issues += 1
             
             report["integrity_issues"] = integrity_issues
@@ -1,7 +1,7 @@
 
 import logging
 import asyncio
-from typing import List, Optional, Dict
+from typing import ClassVar, List, Optional, Dict
 from datetime import datetime
 from pytz import timezone
 from src.application.use_cases.use_cases import GetPredictionsUseCase, DataSources
@@ -9,6 +9,7 @@ from src.infrastructure.cache.cache_service import CacheService
 from src.domain.services.prediction_service import PredictionService
 from src.domain.services.statistics_service import StatisticsService
 from src.infrastructure.repositories.persistence_repository import PersistenceRepository
+from src.utils.time_utils import get_today_str
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,9 @@ class CacheWarmupService:
     Uses GetPredictionsUseCase to ensure consistency with the API.
     """
     
+    # League warmups running in this process, keyed by "<date>:<league_id>" (shared by all instances)
+    _inflight: ClassVar[Dict[str, asyncio.Future]] = {}
+    
     def __init__(
         self,
         data_sources: DataSources,
@@ -49,10 +53,52 @@ class CacheWarmupService:
             try:
                 logger.info(f"🔥 Warming up league: {league_id}")
                 # Execute handles Cache -> Persistence -> Real-time logic
-                await self.use_case.execute(league_id, limit=30)
+                await self._warm_up_league(league_id)
                 # Small sleep to yield to other tasks
                 await asyncio.sleep(1)
             except Exception as e:
                 logger.error(f"Failed to warm up league {league_id}: {e}")
                 
         logger.info("🔥 Cache Warmup Complete.")
+
+    async def warm_up_priority_leagues(self, league_ids: List[str]) -> None:
+        """
+        Warms up a small set of leagues concurrently.
+        Each league is cached as soon as it finishes, so the fastest one is
+        servable without waiting for the slowest. A failing league is logged
+        and does not stop the others.
+        """
+        logger.info(f"🔥 Warming up {len(league_ids)} priority leagues concurrently...")
+        
+        async def warm_up(league_id: str) -> str:
+            try:
+                await self._warm_up_league(league_id)
+            except Exception as e:
+                logger.error(f"Failed to warm up league {league_id}: {e}")
+            return league_id
+        
+        tasks = [asyncio.ensure_future(warm_up(league_id)) for league_id in league_ids]
+        for finished in asyncio.as_completed(tasks):
+            logger.info(f"🔥 League ready: {await finished}")
+        
+        logger.info("🔥 Priority Warmup Complete.")
+
+    async def _warm_up_league(self, league_id: str) -> None:
+        """
+        Warm up one league, joining an identical warmup already in flight
+        instead of starting a second one (single-flight).
+        """
+        key = f"{get_today_str()}:{league_id}"
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(f"🔥 Warmup for {league_id} already running, waiting for it")
+            # Shield so a cancelled waiter does not cancel the shared warmup
+            await asyncio.shield(inflight)
+            return
+            
+        task = asyncio.ensure_future(self.use_case.execute(league_id, limit=30))
+        self._inflight[key] = task
+        try:
+            await task
+        finally:
+            self._inflight.pop(key, None)
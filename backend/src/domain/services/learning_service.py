@@ -59,8 +59,8 @@ class LearningService:
             return LearningWeights()
         
         try:
-            with open(self.weights_path, 'r') as f:
-                data = json.load(f)
+            with open(self.weights_path, 'rb') as f:
+                data = json.loads(f.read())
             
             # Reconstruct MarketPerformance objects
             market_perfs = {}
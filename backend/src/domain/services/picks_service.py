@@ -36,6 +36,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of loaded ML models: path -> (file mtime, model).
+# Every PicksService instance shares one deserialized model until the file is retrained.
+_ML_MODEL_CACHE: dict[str, tuple[float, object]] = {}
+
 class PicksService:
     """
     Domain service for generating suggested picks.
@@ -150,12 +154,20 @@ class PicksService:
         if not ML_AVAILABLE:
             return None
             
-        if not os.path.exists(model_path):
+        model_path = os.path.abspath(model_path)
+        try:
+            model_mtime = os.path.getmtime(model_path)
+        except OSError:
             return None
             
+        cached = _ML_MODEL_CACHE.get(model_path)
+        if cached and cached[0] == model_mtime:
+            return cached[1]
+            
         try:
             # Note: We trust this local file as it is part of our internal training pipeline
             model = joblib.load(model_path)
+            _ML_MODEL_CACHE[model_path] = (model_mtime, model)
             logger.info(f"ML Model loaded successfully from {model_path}")
             return model
         except (FileNotFoundError, ImportError) as e:
@@ -10,6 +10,7 @@ This is a pure domain service with no external dependencies.
 
 import math
 import functools
+from itertools import accumulate
 from dataclasses import dataclass
 from typing import Optional
 
@@ -303,15 +304,18 @@ class PredictionService:
         return (math.pow(expected, actual) * math.exp(-expected)) / math.factorial(actual)
     
     @staticmethod
-    def _get_poisson_distribution(expected: float, max_goals: int) -> list[float]:
+    @functools.lru_cache(maxsize=256)
+    def _get_poisson_distribution(expected: float, max_goals: int) -> tuple[float, ...]:
         """
         Generate Poisson distribution up to max_goals.
         Optimized to avoid repeated factorial/pow calculations.
+        Cached (and immutable) because one prediction asks for the same two
+        distributions in the 1X2, over/under and handicap markets.
         """
         if expected <= 0:
             probs = [0.0] * (max_goals + 1)
             probs[0] = 1.0
-            return probs
+            return tuple(probs)
             
         probs = [0.0] * (max_goals + 1)
         # P(0) = e^-lambda
@@ -322,7 +326,7 @@ class PredictionService:
             current_prob *= expected / k
             probs[k] = current_prob
             
-        return probs
+        return tuple(probs)
 
     def calculate_expected_goals(
         self,
@@ -381,26 +385,18 @@ class PredictionService:
         Returns:
             Tuple of (home_win_prob, draw_prob, away_win_prob)
         """
-        home_win = 0.0
-        draw = 0.0
-        away_win = 0.0
-        
         # Optimization: Pre-calculate distributions
         home_probs = self._get_poisson_distribution(home_expected, max_goals)
         away_probs = self._get_poisson_distribution(away_expected, max_goals)
         
-        # Calculate probability for each possible score
-        for home_goals in range(max_goals + 1):
-            for away_goals in range(max_goals + 1):
-                # Use pre-calculated probabilities
-                prob = home_probs[home_goals] * away_probs[away_goals]
-                
-                if home_goals > away_goals:
-                    home_win += prob
-                elif home_goals == away_goals:
-                    draw += prob
-                else:
-                    away_win += prob
+        # Prefix sums give P(goals <= k), so each outcome is a single pass
+        # instead of walking the whole (max_goals + 1)^2 score grid
+        home_cdf = list(accumulate(home_probs))
+        away_cdf = list(accumulate(away_probs))
+        
+        home_win = sum(home_probs[g] * away_cdf[g - 1] for g in range(1, max_goals + 1))
+        away_win = sum(away_probs[g] * home_cdf[g - 1] for g in range(1, max_goals + 1))
+        draw = sum(h * a for h, a in zip(home_probs, away_probs))
         
         # Normalize to ensure sum equals 1
         total = home_win + draw + away_win
@@ -429,19 +425,18 @@ class PredictionService:
         Returns:
             Tuple of (over_probability, under_probability)
         """
-        under = 0.0
-        
         # Optimization: Pre-calculate distributions
         home_probs = self._get_poisson_distribution(home_expected, max_goals)
         away_probs = self._get_poisson_distribution(away_expected, max_goals)
-        
-        # Calculate probability of total goals <= threshold
-        for home_goals in range(max_goals + 1):
-            for away_goals in range(max_goals + 1):
-                total = home_goals + away_goals
-                if total <= threshold:
-                    prob = home_probs[home_goals] * away_probs[away_goals]
-                    under += prob
+        away_cdf = list(accumulate(away_probs))
+        
+        # Calculate probability of total goals <= threshold:
+        # for each home score, away may score up to (limit - home_goals)
+        limit = math.floor(threshold)
+        under = sum(
+            home_probs[home_goals] * away_cdf[min(limit - home_goals, max_goals)]
+            for home_goals in range(min(limit, max_goals) + 1)
+        )
         
         over = 1.0 - under
         return (over, under)
@@ -712,10 +707,13 @@ class PredictionService:
         home_probs = self._get_poisson_distribution(home_expected, max_goals)
         away_probs = self._get_poisson_distribution(away_expected, max_goals)
         
+        away_cdf = list(accumulate(away_probs))
+        
+        # Away must score strictly less than h + line, i.e. at most ceil(h + line) - 1
         for h in range(max_goals + 1):
-            for a in range(max_goals + 1):
-                if (h + line) > a:
-                    home_win_spread += home_probs[h] * away_probs[a]
+            top = min(math.ceil(h + line) - 1, max_goals)
+            if top >= 0:
+                home_win_spread += home_probs[h] * away_cdf[top]
                     
         return (line, round(home_win_spread, 4), round(1.0 - home_win_spread, 4))
 
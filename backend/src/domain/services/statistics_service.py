@@ -4,9 +4,10 @@ Statistics Domain Service
 Handles calculation of team statistics from match history.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 import unicodedata
 from src.domain.entities.entities import Match, TeamStatistics, TeamH2HStatistics
+from src.domain.value_objects.value_objects import LeagueAverages
 
 
 
@@ -23,357 +24,359 @@ class StatisticsService:
     - MODIFICATION OF CORE CALCULATION LOGIC IS FORBIDDEN to preserve data integrity.
     - New metrics must be implemented by EXTENDING the logic, not changing existing formulas.
     """
+    # Common team name aliases (built once at class creation, not per lookup)
+    _TEAM_ALIASES = {
+        # England (Premier League)
+        "man city": "manchester city",
+        "mancity": "manchester city",
+        "manchester city fc": "manchester city",
+        "manchester city": "manchester city",
+        "man utd": "manchester united",
+        "manutd": "manchester united",
+        "man united": "manchester united",
+        "manchester united fc": "manchester united",
+        "manchester united": "manchester united",
+        "spurs": "tottenham",
+        "tottenham hotspur fc": "tottenham",
+        "tottenham hotspur": "tottenham",
+        "tottenham": "tottenham",
+        "wolves": "wolverhampton",
+        "wolverhampton wanderers fc": "wolverhampton",
+        "wolverhampton wanderers": "wolverhampton",
+        "wolverhampton": "wolverhampton",
+        "nottm forest": "nottingham forest",
+        "nottingham forest fc": "nottingham forest",
+        "nottingham forest": "nottingham forest",
+        "nott'm forest": "nottingham forest",
+        "forest": "nottingham forest",
+        "sheff utd": "sheffield united",
+        "sheffield united": "sheffield united",
+        "sheffield utd": "sheffield united",
+        "newcastle": "newcastle united",
+        "newcastle united fc": "newcastle united",
+        "newcastle united": "newcastle united",
+        "brighton": "brighton",
+        "brighton & hove albion fc": "brighton",
+        "brighton & hove albion": "brighton",
+        "brighton and hove albion": "brighton",
+        "brighton & hove": "brighton",
+        "brighton hove albion": "brighton",
+        "brighton fc": "brighton",
+        "west ham": "west ham united",
+        "west ham united fc": "west ham united",
+        "west ham united": "west ham united",
+        "leicester": "leicester",
+        "leicester city": "leicester",
+        "leicester city fc": "leicester",
+        "leeds": "leeds united",
+        "leeds united fc": "leeds united",
+        "leeds united": "leeds united",
+        "norwich": "norwich",
+        "norwich city": "norwich",
+        "liverpool fc": "liverpool",
+        "liverpool": "liverpool",
+        "arsenal fc": "arsenal",
+        "arsenal": "arsenal",
+        "chelsea fc": "chelsea",
+        "chelsea": "chelsea",
+        "everton fc": "everton",
+        "everton": "everton",
+        "fulham fc": "fulham",
+        "fulham": "fulham",
+        "brentford fc": "brentford",
+        "brentford": "brentford",
+        "burnley fc": "burnley",
+        "burnley": "burnley",
+        "sunderland afc": "sunderland",
+        "sunderland": "sunderland",
+        "afc bournemouth": "bournemouth",
+        "bournemouth": "bournemouth",
+        "afc bournemouth fc": "bournemouth",
+        "crystal palace fc": "crystal palace",
+        "crystal palace": "crystal palace",
+        "aston villa fc": "aston villa",
+        "aston villa": "aston villa",
+        "ipswich town fc": "ipswich",
+        "ipswich town": "ipswich",
+        "ipswich": "ipswich",
+        "manchester city fc": "manchester city",
+        "manchester united fc": "manchester united",
+        "tottenham hotspur fc": "tottenham",
+        "wolverhampton wanderers fc": "wolverhampton",
+        # Spain (La Liga)
+        "alaves": "alaves",
+        "deportivo alaves": "alaves",
+        "ath bilbao": "ath bilbao",
+        "athletic club": "ath bilbao",
+        "athletic club de bilbao": "ath bilbao",
+        "athletic bilbao": "ath bilbao",
+        "atletico madrid": "atletico madrid",
+        "atletico de madrid": "atletico madrid",
+        "atl madrid": "atletico madrid",
+        "ath madrid": "atletico madrid",
+        "club atletico de madrid": "atletico madrid",
+        "club atlético de madrid": "atletico madrid", # UTF-8 catch
+        "barcelona": "barcelona",
+        "fc barcelona": "barcelona",
+        "betis": "betis",
+        "real betis balompié": "betis",
+        "real betis balompie": "betis", # No accent
+        "real betis": "betis",
+        "celta": "celta",
+        "rc celta de vigo": "celta",
+        "celta vigo": "celta",
+        "celta de vigo": "celta",
+        "elche": "elche",
+        "elche cf": "elche",
+        "espanol": "espanol",
+        "rcd espanyol de barcelona": "espanol",
+        "espanyol": "espanol",
+        "getafe": "getafe",
+        "getafe cf": "getafe",
+        "girona": "girona",
+        "girona fc": "girona",
+        "levante": "levante",
+        "levante ud": "levante",
+        "mallorca": "mallorca",
+        "rcd mallorca": "mallorca",
+        "osasuna": "osasuna",
+        "ca osasuna": "osasuna",
+        "club atletico osasuna": "osasuna",
+        "club atlético osasuna": "osasuna", # UTF-8 catch
+        "oviedo": "oviedo",
+        "real oviedo": "oviedo",
+        "real madrid": "real madrid",
+        "real madrid cf": "real madrid",
+        "r madrid": "real madrid",
+        "sevilla": "sevilla",
+        "sevilla fc": "sevilla",
+        "sociedad": "sociedad",
+        "real sociedad de fútbol": "sociedad",
+        "real sociedad de futbol": "sociedad", # No accent
+        "real sociedad": "sociedad",
+        "valencia": "valencia",
+        "valencia cf": "valencia",
+        "vallecano": "vallecano",
+        "rayo vallecano de madrid": "vallecano",
+        "rayo vallecano": "vallecano",
+        "villarreal": "villarreal",
+        "villarreal cf": "villarreal",
+        # Italy
+        "inter": "inter milan",
+        "internazionale": "inter milan",
+        "fc internazionale milano": "inter milan",
+        "milan": "milan",
+        "ac milan": "milan",
+        "cagliari calcio": "cagliari",
+        "como 1907": "como",
+        "udinese calcio": "udinese",
+        "genoa cfc": "genoa", 
+        "us sassuolo calcio": "sassuolo",
+        "parma calcio 1913": "parma",
+        "us lecce": "lecce",
+        "atalanta bc": "atalanta",
+        "ss lazio": "lazio",
+        "ssc napoli": "napoli",
+        "acf fiorentina": "fiorentina",
+        "hellas verona fc": "verona",
+        "hellas verona": "verona",
+        "bologna fc 1909": "bologna",
+        "bologna fc": "bologna",
+        "torino fc": "torino",
+        "us salernitana 1919": "salernitana",
+        "ac monza": "monza",
+        "empoli fc": "empoli",
+        "as roma": "roma",
+        "juventus fc": "juventus",
+        "us cremonese": "cremonese",
+        "ac pisa 1909": "pisa", # Added based on debug output (though Pisa is Serie B usually, might be cup or promotion)
+        # France
+        "racing club de lens": "lens",
+        "rc lens": "lens",
+        "psg": "paris sg",
+        "paris saint germain": "paris sg",
+        "paris saint-germain": "paris sg",
+        "st brestois": "brest",
+        "stade brestois 29": "brest",
+        "stade de reims": "reims",
+        "stade rennais fc": "rennes",
+        "stade rennais": "rennes",
+        "rennais": "rennes",
+        "ogc nice": "nice",
+        "olympique lyonnais": "lyon",
+        "ol": "lyon",
+        "olympique de marseille": "marseille",
+        "om": "marseille",
+        "as monaco": "monaco",
+        "lille osc": "lille",
+        "losc": "lille",
+        "losc lille": "lille",
+        "montpellier hsc": "montpellier",
+        "clermont foot": "clermont",
+        "clermont foot 63": "clermont",
+        "fc nantes": "nantes",
+        "toulouse fc": "toulouse",
+        "le havre ac": "le havre",
+        "fc metz": "metz",
+        "fc lorient": "lorient",
+        "rc strasbourg alsace": "strasbourg",
+
+        # Portugal (Primeira Liga)
+        "sl benfica": "benfica",
+        "sporting cp": "sp lisbon",
+        "sporting clube de portugal": "sp lisbon",
+        "fc porto": "porto",
+        "boavista fc": "boavista",
+        "rio ave fc": "rio ave",
+        "moreirense fc": "moreirense",
+        "sc farense": "farense",
+        "fc arouca": "arouca",
+        "gd estoril praia": "estoril",
+        "cf estrela da amadora": "estrela",
+        "sporting clube de braga": "braga",
+        "sc braga": "braga",
+        "cd santa clara": "santa clara",
+        "gil vicente fc": "gil vicente",
+        "fc famalicão": "famalicao",
+        "famalicao": "famalicao",
+        "casa pia ac": "casa pia",
+        "vitória sc": "guimaraes",
+        "vitoria sc": "guimaraes",
+        "vitoria guimaraes": "guimaraes",
+        "gd chaves": "chaves",
+        "portimonense sc": "portimonense",
+        "fc vizela": "vizela",
+        "avs futebol sad": "avs",
+        "fc alverca": "alverca",
+        "cd nacional": "nacional",
+        "cd tondela": "tondela",
+        "sport lisboa e benfica": "benfica",
+        "sl benfica": "benfica",
+        "sporting clube de braga": "sp braga", # CSV is Sp Braga
+        "sporting braga": "sp braga",
+        "sc braga": "sp braga",
+        "braga": "sp braga",
+        "sporting cp": "sp lisbon", # CSV is Sp Lisbon
+        "sporting clube de portugal": "sp lisbon",
+        "sporting lisboa": "sp lisbon",
+        "sporting lisbon": "sp lisbon",
+        "sporting": "sp lisbon",
+        "vitoria sc": "vitoriaguimaraes",
+        "vitoria guimaraes": "vitoriaguimaraes",
+        "vitória sc": "vitoriaguimaraes",
+        
+        # Belgium (Jupiler Pro League)
+        "club brugge kv": "club brugge",
+        "club brugge": "club brugge",
+        "brugge": "club brugge",
+        "rsc anderlecht": "anderlecht",
+        "anderlecht": "anderlecht",
+        "royal antwerp fc": "antwerp",
+        "antwerp": "antwerp",
+        "krc genk": "genk",
+        "genk": "genk",
+        "kaa gent": "gent",
+        "gent": "gent",
+        "standard de liège": "standard",
+        "standard liege": "standard",
+        "standard": "standard",
+        "union saint-gilloise": "union st.-gilloise",
+        "union sg": "union st.-gilloise",
+        "royale union saint-gilloise": "union st.-gilloise",
+        "rusg": "union st.-gilloise",
+        "st. gilloise": "union st.-gilloise",
+        "kv mechelen": "mechelen",
+        "mechelen": "mechelen",
+        "cercle brugge": "cercle brugge",
+        "cercle": "cercle brugge",
+        "ksv cercle brugge": "cercle brugge",
+        "oh leuven": "leuven",
+        "oud-heverlee leuven": "leuven",
+        "sint-truidense vv": "st truiden",
+        "stvv": "st truiden",
+        "rwd molenbeek": "molenbeek",
+        "rwdm": "molenbeek",
+        "royal charleroi sc": "charleroi",
+        "charleroi": "charleroi",
+        "kvc westerlo": "westerlo",
+        "westerlo": "westerlo",
+        "kas eupen": "eupen",
+        "eupen": "eupen",
+        "kv kortrijk": "kortrijk",
+        "kortrijk": "kortrijk",
+        "beerschot": "beerschot",
+        "kv oostende": "oostende",
+        "zulte waregem": "waregem",
+        "seraing": "seraing",
+
+        # Netherlands (Eredivisie)
+        "nec nicmegen": "nec",
+        "nec": "nec",
+        "az alkmaar": "az alkmaar",
+        "az": "az alkmaar", # API "AZ" -> CSV "AZ Alkmaar"
+        "fc twente '65": "twente",
+        "fc twente": "twente",
+        "pec zwolle": "zwolle",
+        "psv eindhoven": "psv eindhoven",
+        "psv": "psv eindhoven", # API "PSV" -> CSV "PSV Eindhoven"
+        "sbv excelsior": "excelsior",
+        "feyenoord rotterdam": "feyenoord",
+        "feyenoord": "feyenoord",
+        "heracles almelo": "heracles",
+        "heracles": "heracles",
+        "fortuna sittard": "fortuna sittard",
+        "sparta rotterdam": "sparta rotterdam",
+        "rkc waalwijk": "rkc waalwijk",
+        "sc heerenveen": "heerenveen",
+        "go ahead eagles": "go ahead eagles",
+        "ga eagles": "go ahead eagles",
+        "fc utrecht": "utrecht",
+        "vitesse": "vitesse",
+        "vitesse arnhem": "vitesse",
+        "ajax": "ajax",
+        "afc ajax": "ajax",
+        "almere city fc": "almere city",
+        "fc volendam": "volendam", 
+        "telstar 1963": "telstar",
+        "sbv excelsior": "excelsior",
+        # Germany
+        "bayern": "bayern munich",
+        "bayern munich": "bayern munich",
+        "fc bayern münchen": "bayern munich",
+        "dortmund": "borussia dortmund", 
+        "borussia dortmund": "borussia dortmund",
+        "leverkusen": "bayer leverkusen",
+        "bayer leverkusen": "bayer leverkusen",
+        "bayer 04 leverkusen": "bayer leverkusen",
+        "gladbach": "borussia monchengladbach",
+        "borussia monchengladbach": "borussia monchengladbach",
+        "borussia mönchengladbach": "borussia monchengladbach",
+        "frankfurt": "eintracht frankfurt",
+        "eintracht frankfurt": "eintracht frankfurt",
+        "sv werder bremen": "werder bremen",
+        "tsg 1899 hoffenheim": "hoffenheim",
+        "1. fc union berlin": "union berlin",
+        "1. fsv mainz 05": "mainz",
+        "1. fc heidenheim 1846": "heidenheim",
+        "1. fc köln": "fc koln",
+        "1. fc koln": "fc koln",
+        "vfb stuttgart": "stuttgart",
+        "vfl wolfsburg": "wolfsburg",
+        "vfl bochum": "bochum",
+        "vfl bochum 1848": "bochum",
+        "sc freiburg": "freiburg",
+        "fc augsburg": "augsburg",
+        "rb leipzig": "leipzig",
+        "hamburger sv": "hamburg", # If relevant
+        "fc st. pauli 1910": "st pauli",
+    }
+
     @staticmethod
     def _resolve_alias(name: str) -> str:
         """Resolve common team name aliases."""
-        aliases = {
-            # England (Premier League)
-            "man city": "manchester city",
-            "mancity": "manchester city",
-            "manchester city fc": "manchester city",
-            "manchester city": "manchester city",
-            "man utd": "manchester united",
-            "manutd": "manchester united",
-            "man united": "manchester united",
-            "manchester united fc": "manchester united",
-            "manchester united": "manchester united",
-            "spurs": "tottenham",
-            "tottenham hotspur fc": "tottenham",
-            "tottenham hotspur": "tottenham",
-            "tottenham": "tottenham",
-            "wolves": "wolverhampton",
-            "wolverhampton wanderers fc": "wolverhampton",
-            "wolverhampton wanderers": "wolverhampton",
-            "wolverhampton": "wolverhampton",
-            "nottm forest": "nottingham forest",
-            "nottingham forest fc": "nottingham forest",
-            "nottingham forest": "nottingham forest",
-            "nott'm forest": "nottingham forest",
-            "forest": "nottingham forest",
-            "sheff utd": "sheffield united",
-            "sheffield united": "sheffield united",
-            "sheffield utd": "sheffield united",
-            "newcastle": "newcastle united",
-            "newcastle united fc": "newcastle united",
-            "newcastle united": "newcastle united",
-            "brighton": "brighton",
-            "brighton & hove albion fc": "brighton",
-            "brighton & hove albion": "brighton",
-            "brighton and hove albion": "brighton",
-            "brighton & hove": "brighton",
-            "brighton hove albion": "brighton",
-            "brighton fc": "brighton",
-            "west ham": "west ham united",
-            "west ham united fc": "west ham united",
-            "west ham united": "west ham united",
-            "leicester": "leicester",
-            "leicester city": "leicester",
-            "leicester city fc": "leicester",
-            "leeds": "leeds united",
-            "leeds united fc": "leeds united",
-            "leeds united": "leeds united",
-            "norwich": "norwich",
-            "norwich city": "norwich",
-            "liverpool fc": "liverpool",
-            "liverpool": "liverpool",
-            "arsenal fc": "arsenal",
-            "arsenal": "arsenal",
-            "chelsea fc": "chelsea",
-            "chelsea": "chelsea",
-            "everton fc": "everton",
-            "everton": "everton",
-            "fulham fc": "fulham",
-            "fulham": "fulham",
-            "brentford fc": "brentford",
-            "brentford": "brentford",
-            "burnley fc": "burnley",
-            "burnley": "burnley",
-            "sunderland afc": "sunderland",
-            "sunderland": "sunderland",
-            "afc bournemouth": "bournemouth",
-            "bournemouth": "bournemouth",
-            "afc bournemouth fc": "bournemouth",
-            "crystal palace fc": "crystal palace",
-            "crystal palace": "crystal palace",
-            "aston villa fc": "aston villa",
-            "aston villa": "aston villa",
-            "ipswich town fc": "ipswich",
-            "ipswich town": "ipswich",
-            "ipswich": "ipswich",
-            "manchester city fc": "manchester city",
-            "manchester united fc": "manchester united",
-            "tottenham hotspur fc": "tottenham",
-            "wolverhampton wanderers fc": "wolverhampton",
-            # Spain (La Liga)
-            "alaves": "alaves",
-            "deportivo alaves": "alaves",
-            "ath bilbao": "ath bilbao",
-            "athletic club": "ath bilbao",
-            "athletic club de bilbao": "ath bilbao",
-            "athletic bilbao": "ath bilbao",
-            "atletico madrid": "atletico madrid",
-            "atletico de madrid": "atletico madrid",
-            "atl madrid": "atletico madrid",
-            "ath madrid": "atletico madrid",
-            "club atletico de madrid": "atletico madrid",
-            "club atlético de madrid": "atletico madrid", # UTF-8 catch
-            "barcelona": "barcelona",
-            "fc barcelona": "barcelona",
-            "betis": "betis",
-            "real betis balompié": "betis",
-            "real betis balompie": "betis", # No accent
-            "real betis": "betis",
-            "celta": "celta",
-            "rc celta de vigo": "celta",
-            "celta vigo": "celta",
-            "celta de vigo": "celta",
-            "elche": "elche",
-            "elche cf": "elche",
-            "espanol": "espanol",
-            "rcd espanyol de barcelona": "espanol",
-            "espanyol": "espanol",
-            "getafe": "getafe",
-            "getafe cf": "getafe",
-            "girona": "girona",
-            "girona fc": "girona",
-            "levante": "levante",
-            "levante ud": "levante",
-            "mallorca": "mallorca",
-            "rcd mallorca": "mallorca",
-            "osasuna": "osasuna",
-            "ca osasuna": "osasuna",
-            "club atletico osasuna": "osasuna",
-            "club atlético osasuna": "osasuna", # UTF-8 catch
-            "oviedo": "oviedo",
-            "real oviedo": "oviedo",
-            "real madrid": "real madrid",
-            "real madrid cf": "real madrid",
-            "r madrid": "real madrid",
-            "sevilla": "sevilla",
-            "sevilla fc": "sevilla",
-            "sociedad": "sociedad",
-            "real sociedad de fútbol": "sociedad",
-            "real sociedad de futbol": "sociedad", # No accent
-            "real sociedad": "sociedad",
-            "valencia": "valencia",
-            "valencia cf": "valencia",
-            "vallecano": "vallecano",
-            "rayo vallecano de madrid": "vallecano",
-            "rayo vallecano": "vallecano",
-            "villarreal": "villarreal",
-            "villarreal cf": "villarreal",
-            # Italy
-            "inter": "inter milan",
-            "internazionale": "inter milan",
-            "fc internazionale milano": "inter milan",
-            "milan": "milan",
-            "ac milan": "milan",
-            "cagliari calcio": "cagliari",
-            "como 1907": "como",
-            "udinese calcio": "udinese",
-            "genoa cfc": "genoa", 
-            "us sassuolo calcio": "sassuolo",
-            "parma calcio 1913": "parma",
-            "us lecce": "lecce",
-            "atalanta bc": "atalanta",
-            "ss lazio": "lazio",
-            "ssc napoli": "napoli",
-            "acf fiorentina": "fiorentina",
-            "hellas verona fc": "verona",
-            "hellas verona": "verona",
-            "bologna fc 1909": "bologna",
-            "bologna fc": "bologna",
-            "torino fc": "torino",
-            "us salernitana 1919": "salernitana",
-            "ac monza": "monza",
-            "empoli fc": "empoli",
-            "as roma": "roma",
-            "juventus fc": "juventus",
-            "us cremonese": "cremonese",
-            "ac pisa 1909": "pisa", # Added based on debug output (though Pisa is Serie B usually, might be cup or promotion)
-            # France
-            "racing club de lens": "lens",
-            "rc lens": "lens",
-            "psg": "paris sg",
-            "paris saint germain": "paris sg",
-            "paris saint-germain": "paris sg",
-            "st brestois": "brest",
-            "stade brestois 29": "brest",
-            "stade de reims": "reims",
-            "stade rennais fc": "rennes",
-            "stade rennais": "rennes",
-            "rennais": "rennes",
-            "ogc nice": "nice",
-            "olympique lyonnais": "lyon",
-            "ol": "lyon",
-            "olympique de marseille": "marseille",
-            "om": "marseille",
-            "as monaco": "monaco",
-            "lille osc": "lille",
-            "losc": "lille",
-            "losc lille": "lille",
-            "montpellier hsc": "montpellier",
-            "clermont foot": "clermont",
-            "clermont foot 63": "clermont",
-            "fc nantes": "nantes",
-            "toulouse fc": "toulouse",
-            "le havre ac": "le havre",
-            "fc metz": "metz",
-            "fc lorient": "lorient",
-            "rc strasbourg alsace": "strasbourg",
-
-            # Portugal (Primeira Liga)
-            "sl benfica": "benfica",
-            "sporting cp": "sp lisbon",
-            "sporting clube de portugal": "sp lisbon",
-            "fc porto": "porto",
-            "boavista fc": "boavista",
-            "rio ave fc": "rio ave",
-            "moreirense fc": "moreirense",
-            "sc farense": "farense",
-            "fc arouca": "arouca",
-            "gd estoril praia": "estoril",
-            "cf estrela da amadora": "estrela",
-            "sporting clube de braga": "braga",
-            "sc braga": "braga",
-            "cd santa clara": "santa clara",
-            "gil vicente fc": "gil vicente",
-            "fc famalicão": "famalicao",
-            "famalicao": "famalicao",
-            "casa pia ac": "casa pia",
-            "vitória sc": "guimaraes",
-            "vitoria sc": "guimaraes",
-            "vitoria guimaraes": "guimaraes",
-            "gd chaves": "chaves",
-            "portimonense sc": "portimonense",
-            "fc vizela": "vizela",
-            "avs futebol sad": "avs",
-            "fc alverca": "alverca",
-            "cd nacional": "nacional",
-            "cd tondela": "tondela",
-            "sport lisboa e benfica": "benfica",
-            "sl benfica": "benfica",
-            "sporting clube de braga": "sp braga", # CSV is Sp Braga
-            "sporting braga": "sp braga",
-            "sc braga": "sp braga",
-            "braga": "sp braga",
-            "sporting cp": "sp lisbon", # CSV is Sp Lisbon
-            "sporting clube de portugal": "sp lisbon",
-            "sporting lisboa": "sp lisbon",
-            "sporting lisbon": "sp lisbon",
-            "sporting": "sp lisbon",
-            "vitoria sc": "vitoriaguimaraes",
-            "vitoria guimaraes": "vitoriaguimaraes",
-            "vitória sc": "vitoriaguimaraes",
-            
-            # Belgium (Jupiler Pro League)
-            "club brugge kv": "club brugge",
-            "club brugge": "club brugge",
-            "brugge": "club brugge",
-            "rsc anderlecht": "anderlecht",
-            "anderlecht": "anderlecht",
-            "royal antwerp fc": "antwerp",
-            "antwerp": "antwerp",
-            "krc genk": "genk",
-            "genk": "genk",
-            "kaa gent": "gent",
-            "gent": "gent",
-            "standard de liège": "standard",
-            "standard liege": "standard",
-            "standard": "standard",
-            "union saint-gilloise": "union st.-gilloise",
-            "union sg": "union st.-gilloise",
-            "royale union saint-gilloise": "union st.-gilloise",
-            "rusg": "union st.-gilloise",
-            "st. gilloise": "union st.-gilloise",
-            "kv mechelen": "mechelen",
-            "mechelen": "mechelen",
-            "cercle brugge": "cercle brugge",
-            "cercle": "cercle brugge",
-            "ksv cercle brugge": "cercle brugge",
-            "oh leuven": "leuven",
-            "oud-heverlee leuven": "leuven",
-            "sint-truidense vv": "st truiden",
-            "stvv": "st truiden",
-            "rwd molenbeek": "molenbeek",
-            "rwdm": "molenbeek",
-            "royal charleroi sc": "charleroi",
-            "charleroi": "charleroi",
-            "kvc westerlo": "westerlo",
-            "westerlo": "westerlo",
-            "kas eupen": "eupen",
-            "eupen": "eupen",
-            "kv kortrijk": "kortrijk",
-            "kortrijk": "kortrijk",
-            "beerschot": "beerschot",
-            "kv oostende": "oostende",
-            "zulte waregem": "waregem",
-            "seraing": "seraing",
-
-            # Netherlands (Eredivisie)
-            "nec nicmegen": "nec",
-            "nec": "nec",
-            "az alkmaar": "az alkmaar",
-            "az": "az alkmaar", # API "AZ" -> CSV "AZ Alkmaar"
-            "fc twente '65": "twente",
-            "fc twente": "twente",
-            "pec zwolle": "zwolle",
-            "psv eindhoven": "psv eindhoven",
-            "psv": "psv eindhoven", # API "PSV" -> CSV "PSV Eindhoven"
-            "sbv excelsior": "excelsior",
-            "feyenoord rotterdam": "feyenoord",
-            "feyenoord": "feyenoord",
-            "heracles almelo": "heracles",
-            "heracles": "heracles",
-            "fortuna sittard": "fortuna sittard",
-            "sparta rotterdam": "sparta rotterdam",
-            "rkc waalwijk": "rkc waalwijk",
-            "sc heerenveen": "heerenveen",
-            "go ahead eagles": "go ahead eagles",
-            "ga eagles": "go ahead eagles",
-            "fc utrecht": "utrecht",
-            "vitesse": "vitesse",
-            "vitesse arnhem": "vitesse",
-            "ajax": "ajax",
-            "afc ajax": "ajax",
-            "almere city fc": "almere city",
-            "fc volendam": "volendam", 
-            "telstar 1963": "telstar",
-            "sbv excelsior": "excelsior",
-            # Germany
-            "bayern": "bayern munich",
-            "bayern munich": "bayern munich",
-            "fc bayern münchen": "bayern munich",
-            "dortmund": "borussia dortmund", 
-            "borussia dortmund": "borussia dortmund",
-            "leverkusen": "bayer leverkusen",
-            "bayer leverkusen": "bayer leverkusen",
-            "bayer 04 leverkusen": "bayer leverkusen",
-            "gladbach": "borussia monchengladbach",
-            "borussia monchengladbach": "borussia monchengladbach",
-            "borussia mönchengladbach": "borussia monchengladbach",
-            "frankfurt": "eintracht frankfurt",
-            "eintracht frankfurt": "eintracht frankfurt",
-            "sv werder bremen": "werder bremen",
-            "tsg 1899 hoffenheim": "hoffenheim",
-            "1. fc union berlin": "union berlin",
-            "1. fsv mainz 05": "mainz",
-            "1. fc heidenheim 1846": "heidenheim",
-            "1. fc köln": "fc koln",
-            "1. fc koln": "fc koln",
-            "vfb stuttgart": "stuttgart",
-            "vfl wolfsburg": "wolfsburg",
-            "vfl bochum": "bochum",
-            "vfl bochum 1848": "bochum",
-            "sc freiburg": "freiburg",
-            "fc augsburg": "augsburg",
-            "rb leipzig": "leipzig",
-            "hamburger sv": "hamburg", # If relevant
-            "fc st. pauli 1910": "st pauli",
-        }
+        aliases = StatisticsService._TEAM_ALIASES
         
         # Normalize: Lower, Strip, Remove Accents
-        import unicodedata
         normalized = name.lower().strip()
         nfkd_form = unicodedata.normalize('NFKD', normalized)
         normalized_no_accents = "".join([c for c in nfkd_form if not unicodedata.combining(c)])
@@ -632,6 +635,51 @@ class StatisticsService:
             matches_with_fouls=matches_with_fouls,
         )
 
+    @staticmethod
+    def calculate_team_statistics_for_teams(
+        team_names: List[str],
+        matches: List[Match],
+    ) -> Dict[str, TeamStatistics]:
+        """
+        Calculate statistics for several teams from one match history.
+        
+        Same result as calling calculate_team_statistics per team, but the
+        history is bucketed by normalized team name in a single pass, so each
+        team only walks its own matches instead of the whole history.
+        
+        Args:
+            team_names: Team names to compute (duplicates are computed once)
+            matches: List of historical matches
+            
+        Returns:
+            Dict mapping each team name to its TeamStatistics
+        """
+        normalize = StatisticsService._normalize_name
+        matches_by_team: Dict[str, List[Match]] = {}
+        for match in matches:
+            if not match.is_played:
+                continue
+            home_norm = normalize(match.home_team.name)
+            away_norm = normalize(match.away_team.name)
+            matches_by_team.setdefault(home_norm, []).append(match)
+            if away_norm != home_norm:
+                matches_by_team.setdefault(away_norm, []).append(match)
+        
+        # Freshness is taken over the full history, as calculate_team_statistics does
+        timestamps = [m.data_fetched_at for m in matches if hasattr(m, 'data_fetched_at') and m.data_fetched_at]
+        last_updated = max(timestamps) if timestamps else None
+        
+        stats_by_team: Dict[str, TeamStatistics] = {}
+        for team_name in team_names:
+            if team_name in stats_by_team:
+                continue
+            stats = StatisticsService.calculate_team_statistics(
+                team_name, matches_by_team.get(normalize(team_name), [])
+            )
+            stats.data_updated_at = last_updated
+            stats_by_team[team_name] = stats
+        return stats_by_team
+
     @staticmethod
     def create_empty_stats_dict() -> dict:
         """Create a dictionary for tracking stats incrementally."""
@@ -723,7 +771,7 @@ class StatisticsService:
             recent_form="" # Form is calculated from full history if needed
         )
 
-    def calculate_league_averages(self, matches: List[Match]) -> 'LeagueAverages':
+    def calculate_league_averages(self, matches: List[Match]) -> Optional[LeagueAverages]:
         """
         Calculate league-wide averages from match history.
         
@@ -760,8 +808,6 @@ class StatisticsService:
                 matches_with_cards += 1
         
         # Calculate averages with fallbacks
-        from src.domain.value_objects.value_objects import LeagueAverages
-
         if matches_with_goals == 0:
             return None
             
@@ -31,8 +31,9 @@ class TeamService:
             return
             
         try:
-            with open(cls.DATA_FILE, "r") as f:
-                cls._logos = json.load(f)
+            # Binary read: one read() call and no incremental text decoding
+            with open(cls.DATA_FILE, "rb") as f:
+                cls._logos = json.loads(f.read())
             cls._loaded = True
             logger.info(f"Loaded {len(cls._logos)} team logos.")
         except Exception as e:
@@ -52,8 +53,8 @@ class TeamService:
             return
 
         try:
-            with open(cls.DATA_FILE_SHORT_NAMES, "r") as f:
-                cls._short_names = json.load(f)
+            with open(cls.DATA_FILE_SHORT_NAMES, "rb") as f:
+                cls._short_names = json.loads(f.read())
             cls._short_names_loaded = True
             logger.info(f"Loaded {len(cls._short_names)} team short names.")
         except Exception as e:
@@ -7,6 +7,7 @@ import diskcache
 import json
 import pickle
 from collections import OrderedDict
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,15 @@ class CacheProvider(ABC):
     @abstractmethod
     def clear(self) -> bool:
         pass
+    
+    def get_many(self, keys: list[str]) -> Dict[str, Any]:
+        """Get several keys at once; missing keys are left out of the result."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
 
 
 class DiskCacheProvider(CacheProvider):
@@ -48,6 +58,19 @@ class DiskCacheProvider(CacheProvider):
         except Exception:
             return None
             
+    def get_many(self, keys: list[str]) -> Dict[str, Any]:
+        """Read all keys inside one SQLite transaction instead of one per key."""
+        try:
+            with self.cache.transact():
+                found = {}
+                for key in keys:
+                    value = self.cache.get(key)
+                    if value is not None:
+                        found[key] = value
+                return found
+        except Exception:
+            return {}
+            
     def set(self, key: str, value: Any, ttl: int) -> bool:
         try:
             return self.cache.set(key, value, expire=ttl)
@@ -61,6 +84,24 @@ class DiskCacheProvider(CacheProvider):
         except Exception:
             return False
 
+    def add(self, key: str, value: Any, ttl: int) -> bool:
+        """Set key only if it is absent (atomic across processes sharing the cache dir)."""
+        try:
+            return bool(self.cache.add(key, value, expire=ttl))
+        except Exception as e:
+            logger.error(f"DiskCache add failed for {key}: {e}")
+            return False
+
+    def delete_if_equal(self, key: str, value: Any) -> bool:
+        """Delete key only if it still holds value."""
+        try:
+            with self.cache.transact():
+                if self.cache.get(key) != value:
+                    return False
+                return bool(self.cache.delete(key))
+        except Exception:
+            return False
+
     def clear(self) -> bool:
         try:
             return self.cache.clear()
@@ -110,9 +151,9 @@ class CacheService:
         for provider in self.providers:
             value = provider.get(key)
             if value is not None:
-                self._hits += 1
                 # Populate memory cache for faster subsequent access
                 with self._lock:
+                    self._hits += 1
                     self._memory_cache[key] = value
                     self._memory_cache.move_to_end(key)
                     # Enforce size limit
@@ -120,9 +161,45 @@ class CacheService:
                         self._memory_cache.popitem(last=False)
                 return value
         
-        self._misses += 1
+        with self._lock:
+            self._misses += 1
         return None
     
+    def get_many(self, keys: list[str]) -> Dict[str, Any]:
+        """
+        Get several values at once (Memory -> Disk).
+        Memory is checked under a single lock acquisition and the remaining
+        keys go to each provider as one batch. Missing keys are omitted.
+        """
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory_cache:
+                    self._memory_cache.move_to_end(key)
+                    found[key] = self._memory_cache[key]
+            self._hits += len(found)
+        
+        pending = [key for key in keys if key not in found]
+        for provider in self.providers:
+            if not pending:
+                break
+            provider_found = provider.get_many(pending)
+            if provider_found:
+                # Populate memory cache for faster subsequent access
+                with self._lock:
+                    self._hits += len(provider_found)
+                    for key, value in provider_found.items():
+                        self._memory_cache[key] = value
+                        self._memory_cache.move_to_end(key)
+                        if len(self._memory_cache) > self.MAX_MEMORY_ITEMS:
+                            self._memory_cache.popitem(last=False)
+                found.update(provider_found)
+                pending = [key for key in pending if key not in provider_found]
+        
+        with self._lock:
+            self._misses += len(pending)
+        return found
+    
     def set(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Set a value in all cache layers."""
         # 1. Memory
@@ -138,6 +215,11 @@ class CacheService:
         for provider in self.providers:
             provider.set(key, value, ttl_seconds)
     
+    def memory_snapshot(self, sample_size: int = 10) -> tuple[int, list[str]]:
+        """Return the in-memory item count and up to sample_size keys, without copying every key."""
+        with self._lock:
+            return len(self._memory_cache), list(islice(self._memory_cache, sample_size))
+    
     def invalidate(self, key: str) -> bool:
         """Invalidate a specific cache entry across all layers."""
         with self._lock:
@@ -157,6 +239,21 @@ class CacheService:
         
         logger.info("Cache cleared across all layers")
     
+    def acquire_lock(self, name: str, owner: str, ttl_seconds: int) -> bool:
+        """
+        Take a named lease shared by every process using this cache directory.
+        The lease expires after ttl_seconds so a crashed holder cannot block forever.
+        """
+        return bool(self.disk_provider.add(f"lock:{name}", owner, ttl_seconds))
+    
+    def release_lock(self, name: str, owner: str) -> bool:
+        """Release a lease taken with acquire_lock, only if owner still holds it."""
+        return bool(self.disk_provider.delete_if_equal(f"lock:{name}", owner))
+    
+    def is_locked(self, name: str) -> bool:
+        """Whether any process currently holds the named lease."""
+        return self.disk_provider.get(f"lock:{name}") is not None
+    
     # --- Helper methods ---
     
     def get_live_matches(self, key: str) -> Optional[Any]:
@@ -10,7 +10,7 @@ Data Source: https://www.football-data.co.uk/
 import asyncio
 from datetime import datetime, timezone
 from typing import Optional, Any, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import logging
 import functools
 
@@ -31,6 +31,9 @@ class FootballDataConfig:
     """Configuration for Football-Data.co.uk data source."""
     base_url: str = "https://www.football-data.co.uk"
     timeout: int = 30
+    # The parsed current season is reused for this long (it is only updated a
+    # couple of times a week upstream); past seasons never change and are kept
+    cache_ttl_seconds: int = 3600
 
 
 # Mapping of league codes to Football-Data.co.uk CSV paths
@@ -140,7 +143,8 @@ class FootballDataUKSource:
     def __init__(self, config: Optional[FootballDataConfig] = None):
         """Initialize the data source."""
         self.config = config or FootballDataConfig()
-        self._cache: dict[str, tuple[Any, datetime]] = {}  # Any instead of pd.DataFrame for lazy import
+        # Parsed matches per "{league}_{season}", with the time they were downloaded
+        self._cache: dict[str, tuple[list[Match], datetime]] = {}
     
     def _get_csv_url(self, league_code: str, season: str) -> str:
         """
@@ -175,16 +179,15 @@ class FootballDataUKSource:
         self,
         league_code: str,
         season: str,
-        force_refresh: bool = False,
         client: Optional[httpx.AsyncClient] = None,
     ) -> Optional[tuple[Any, datetime]]:
         """
         Download and parse CSV data for a league.
+        Not cached: get_historical_matches caches the parsed matches instead.
         
         Args:
             league_code: League code
             season: Season code (e.g., "2324")
-            force_refresh: If True, ignore cache and re-download
             client: Optional httpx client to reuse
             
         Returns:
@@ -202,11 +205,6 @@ class FootballDataUKSource:
             else:
                 raise ImportError("Pandas is required for CSV processing but is not installed.")
         
-        cache_key = f"{league_code}_{season}"
-        
-        if not force_refresh and cache_key in self._cache:
-            return self._cache[cache_key]
-        
         url = self._get_csv_url(league_code, season)
         
         try:
@@ -238,7 +236,6 @@ class FootballDataUKSource:
             df = df.dropna(subset=['Date', 'HomeTeam', 'AwayTeam'], how='any')
             
             now = datetime.now(timezone.utc)
-            self._cache[cache_key] = (df, now)
             
             # Diagnostic Log: Check latest date in CSV
             latest_date = "Unknown"
@@ -300,6 +297,21 @@ class FootballDataUKSource:
             logger.warning(f"Missing required columns in data. Available: {df.columns.tolist()}")
             return matches
         
+        # Team is frozen, so a season's ~20 teams can be shared across its ~380 rows
+        # instead of building two Teams (and two logo lookups) per row
+        teams: dict[str, Team] = {}
+        
+        def get_team(name: str) -> Team:
+            team = teams.get(name)
+            if team is None:
+                team = teams[name] = Team(
+                    id=name.lower().replace(" ", "_"),
+                    name=name,
+                    country=league.country,
+                    logo_url=TeamService.get_team_logo(name)
+                )
+            return team
+        
         for idx, row in df.iterrows():
             try:
                 # Parse date
@@ -307,23 +319,9 @@ class FootballDataUKSource:
                 if not match_date:
                     continue
                 
-                # Create teams
-                home_team_name = str(row['HomeTeam'])
-                away_team_name = str(row['AwayTeam'])
-
-                home_team = Team(
-                    id=home_team_name.lower().replace(" ", "_"),
-                    name=home_team_name,
-                    country=league.country,
-                    logo_url=TeamService.get_team_logo(home_team_name)
-                )
-                
-                away_team = Team(
-                    id=away_team_name.lower().replace(" ", "_"),
-                    name=away_team_name,
-                    country=league.country,
-                    logo_url=TeamService.get_team_logo(away_team_name)
-                )
+                # Create teams (one shared instance per name)
+                home_team = get_team(str(row['HomeTeam']))
+                away_team = get_team(str(row['AwayTeam']))
                 
                 # Get goals (handle NaN for unplayed matches)
                 home_goals = int(row['FTHG']) if pd.notna(row.get('FTHG')) else None
@@ -404,7 +402,8 @@ class FootballDataUKSource:
                 matches.append(match)
                 
             except Exception as e:
-                logger.debug(f"Error parsing row {idx}: {e}")
+                # Lazy args: malformed CSVs can hit this for many rows, format only if DEBUG is on
+                logger.debug("Error parsing row %s: %s", idx, e)
                 continue
         
         return matches
@@ -414,6 +413,7 @@ class FootballDataUKSource:
         league_code: str,
         seasons: Optional[list[str]] = None,
         force_refresh: bool = False,
+        since: Optional[datetime] = None,
     ) -> list[Match]:
         """
         Get historical matches for a league.
@@ -422,6 +422,8 @@ class FootballDataUKSource:
             league_code: League code (e.g., "E0")
             seasons: List of season codes or None for current season
             force_refresh: Whether to force re-download of data
+            since: Earliest date the caller needs; when it falls in the current
+                season, the previous season is not downloaded
             
         Returns:
             List of Match entities
@@ -430,15 +432,18 @@ class FootballDataUKSource:
             # Dynamic season calculation with fallback
             current_season = self._get_current_season()
             
-            # Previous season calculation
-            try:
-                # Format is "2425" -> 2024
-                start_year = int(current_season[:2])
-                prev_start = (start_year - 1) % 100
-                prev_season = f"{prev_start:02d}{start_year:02d}"
-                seasons = [current_season, prev_season]
-            except Exception:
-                seasons = [current_season, "2324"]
+            if since is not None and self._get_current_season(since) == current_season:
+                seasons = [current_season]
+            else:
+                # Previous season calculation
+                try:
+                    # Format is "2425" -> 2024
+                    start_year = int(current_season[:2])
+                    prev_start = (start_year - 1) % 100
+                    prev_season = f"{prev_start:02d}{start_year:02d}"
+                    seasons = [current_season, prev_season]
+                except Exception:
+                    seasons = [current_season, "2324"]
                 
             logger.info(f"Targeting seasons for {league_code}: {seasons}")
         
@@ -461,20 +466,40 @@ class FootballDataUKSource:
         )
         
         all_matches = []
+        live_season = self._get_current_season()
+        
+        async def load_season(season: str, client: httpx.AsyncClient) -> Optional[list[Match]]:
+            """Download one season and parse it off the event loop, reusing a fresh cached parse."""
+            cache_key = f"{league_code}_{season}"
+            cached = self._cache.get(cache_key)
+            if cached and not force_refresh:
+                matches, fetched_at = cached
+                age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+                if season != live_season or age < self.config.cache_ttl_seconds:
+                    # Callers enrich matches in place; hand out copies so the cache stays pristine
+                    return [replace(match) for match in matches]
+            
+            result = await self.download_csv(league_code, season, client=client)
+            if result is None:
+                return None
+            df, timestamp = result
+            if df.empty:
+                return []
+            matches = await asyncio.to_thread(self.parse_matches, df, league, timestamp)
+            self._cache[cache_key] = (matches, timestamp)
+            return [replace(match) for match in matches]
         
-        # Use a shared client for all requests to improve performance
+        # Use a shared client for all requests to improve performance.
+        # Each season is downloaded and parsed concurrently with the others.
         async with httpx.AsyncClient() as client:
-            tasks = [self.download_csv(league_code, season, force_refresh=force_refresh, client=client) for season in seasons]
-            results = await asyncio.gather(*tasks)
+            results = await asyncio.gather(*(load_season(season, client) for season in seasons))
 
         has_current_data = False
         
-        for i, result in enumerate(results):
+        for i, matches in enumerate(results):
             season_code = seasons[i]
-            if result is not None:
-                df, timestamp = result
-                if not df.empty:
-                    matches = self.parse_matches(df, league, timestamp)
+            if matches is not None:
+                if matches:
                     all_matches.extend(matches)
                     if i == 0: # Current season
                         has_current_data = True
@@ -8,6 +8,7 @@ Unofficial integration with FotMob API to fetch detailed match statistics
 import logging
 import aiohttp
 import asyncio
+import heapq
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from src.domain.entities.entities import Match, Team, League
@@ -151,8 +152,8 @@ class FotMobSource:
                 # Filter finished matches
                 finished = [m for m in matches_data if m.get("status", {}).get("finished")]
                 
-                # Sort by date desc and take limit
-                recent = sorted(finished, key=lambda x: x.get("status", {}).get("utcTime") or "", reverse=True)[:limit]
+                # Newest `limit` matches by date (partial selection instead of a full sort)
+                recent = heapq.nlargest(limit, finished, key=lambda x: x.get("status", {}).get("utcTime") or "")
                 
                 # 3. Fetch Details for each match in parallel (to get stats)
                 tasks = [self._get_match_details(session, str(m["id"])) for m in recent]
@@ -41,6 +41,10 @@ class LocalGithubDataSource:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.file_path = os.path.join(current_dir, "local_data", "matches_github.csv")
         logger.info(f"Resolved GitHub Dataset Path: {self.file_path}")
+        # Teams and leagues are frozen, so rows share one instance per name
+        # instead of allocating two Teams and a League for every CSV row
+        self._teams: dict[str, Team] = {}
+        self._leagues: dict[str, League] = {}
         
     async def get_finished_matches(
         self,
@@ -114,6 +118,24 @@ class LocalGithubDataSource:
         logger.info(f"GitHub Dataset: loaded {len(matches)} matches")
         return matches
 
+    def _get_team(self, name: str) -> Team:
+        """Get the shared Team for a name, creating it on first use."""
+        team = self._teams.get(name)
+        if team is None:
+            team = self._teams[name] = Team(id=name, name=name)
+        return team
+
+    def _get_league(self, division: str) -> League:
+        """Get the shared League for a division code, creating it on first use."""
+        league = self._leagues.get(division)
+        if league is None:
+            league = self._leagues[division] = League(
+                id=division,
+                name=self.LEAGUE_MAPPING.get(division, division),
+                country="International"
+            )
+        return league
+
     def _parse_row(self, row: dict, match_date: datetime) -> Optional[Match]:
         """Parse CSV row to Match entity."""
         try:
@@ -168,14 +190,9 @@ class LocalGithubDataSource:
             # Simple ID generation
             match_id = f"gh_{division}_{match_date.strftime('%Y%m%d')}_{home_team_name[:3]}_{away_team_name[:3]}"
             
-            home_team = Team(id=home_team_name, name=home_team_name)
-            away_team = Team(id=away_team_name, name=away_team_name)
-            
-            league = League(
-                id=division,
-                name=self.LEAGUE_MAPPING.get(division, division),
-                country="International"
-            )
+            home_team = self._get_team(home_team_name)
+            away_team = self._get_team(away_team_name)
+            league = self._get_league(division)
             
             return Match(
                 id=match_id,
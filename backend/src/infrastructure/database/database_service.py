@@ -1,6 +1,6 @@
 import os
 import logging
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 logger = logging.getLogger(__name__)
@@ -15,6 +15,7 @@ class DatabaseService:
     def __init__(self, db_url: str = None):
         # Priority: db_url param -> DATABASE_URL env -> sqlite fallback
         self.db_url = db_url or os.getenv("DATABASE_URL")
+        self._tables_verified = False
         
         if not self.db_url:
             # Fallback to local sqlite for development if no database is provided
@@ -46,10 +47,16 @@ class DatabaseService:
             raise e
 
     def create_tables(self):
-        """Create all tables defined in Base."""
+        """Create all tables defined in Base (schema is checked at most once per instance)."""
+        if self._tables_verified:
+            return
         try:
-            Base.metadata.create_all(bind=self.engine)
-            logger.info("Database tables created successfully")
+            # One catalog query instead of create_all's per-table existence checks on warm databases
+            existing_tables = set(inspect(self.engine).get_table_names())
+            if not existing_tables.issuperset(Base.metadata.tables):
+                Base.metadata.create_all(bind=self.engine)
+                logger.info("Database tables created successfully")
+            self._tables_verified = True
         except Exception as e:
             logger.error(f"Failed to create database tables: {e}")
             raise e
@@ -1,12 +1,21 @@
 import logging
 import json
+import orjson
 from datetime import datetime
 from typing import List, Optional, Any
 from sqlalchemy import Column, String, JSON, DateTime, Integer
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from src.infrastructure.database.database_service import Base, DatabaseService, get_database_service
 
 logger = logging.getLogger(__name__)
 
+# Dialect-specific INSERTs that support ON CONFLICT upserts
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
 class TrainingResultModel(Base):
     """
     SQLAlchemy model for storing training results.
@@ -60,14 +69,9 @@ class PersistenceRepository:
         Sanitize data for JSON storage, handling datetime objects.
         This forces datetime objects to strings before SQLAlchemy passes them to PostgreSQL.
         """
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, o):
-                if isinstance(o, datetime):
-                    return o.isoformat()
-                return super().default(o)
-                
-        # Dump to string and reload to ensure pure JSON types (dict, list, str, int, float, bool, None)
-        return json.loads(json.dumps(data, cls=DateTimeEncoder))
+        # Dump to bytes and reload to ensure pure JSON types (dict, list, str, int, float, bool, None).
+        # orjson renders datetimes as ISO 8601 natively and runs in C, which matters for league-sized payloads.
+        return orjson.loads(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
 
     def get_cached_response(self, endpoint: str, params: Optional[dict] = None) -> Optional[dict]:
         """
@@ -163,6 +167,57 @@ class PersistenceRepository:
         finally:
             session.close()
 
+    def bulk_save_training_results(self, results: dict[str, dict]) -> bool:
+        """
+        Save or update several training results in a single transaction.
+        'results' maps each key (e.g. "picks:match_123") to its data.
+        """
+        if not results:
+            return True
+            
+        session = self.db_service.get_session()
+        try:
+            now = datetime.utcnow()
+            insert = UPSERT_INSERTS.get(session.get_bind().dialect.name)
+            
+            if insert:
+                # Single INSERT ... ON CONFLICT (key) DO UPDATE statement for the whole batch
+                stmt = insert(TrainingResultModel).values([
+                    {"key": key, "data": self._sanitize_json_data(data), "last_updated": now}
+                    for key, data in results.items()
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[TrainingResultModel.key],
+                    set_={"data": stmt.excluded.data, "last_updated": stmt.excluded.last_updated}
+                )
+                session.execute(stmt)
+            else:
+                # One query for every existing key instead of one SELECT per result
+                existing = {
+                    r.key: r
+                    for r in session.query(TrainingResultModel).filter(TrainingResultModel.key.in_(list(results)))
+                }
+                
+                for key, data in results.items():
+                    sanitized_data = self._sanitize_json_data(data)
+                    
+                    record = existing.get(key)
+                    if record:
+                        record.data = sanitized_data
+                        record.last_updated = now
+                    else:
+                        session.add(TrainingResultModel(key=key, data=sanitized_data, last_updated=now))
+            
+            session.commit()
+            logger.info(f"Bulk saved {len(results)} training results")
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to bulk save training results: {e}")
+            return False
+        finally:
+            session.close()
+
     def get_training_result(self, key: str) -> dict:
         """
         Retrieve a training result by key.
@@ -294,9 +349,20 @@ class PersistenceRepository:
         Each dict in 'predictions_batch' should have: match_id, league_id, data, and optionally ttl_seconds.
         """
         from datetime import timedelta
+        if not predictions_batch:
+            return True
+            
         session = self.db_service.get_session()
         try:
             now = datetime.utcnow()
+            
+            # Load every existing row for the batch in one query instead of one SELECT per prediction
+            match_ids = [p['match_id'] for p in predictions_batch]
+            existing = {
+                r.match_id: r
+                for r in session.query(MatchPredictionModel).filter(MatchPredictionModel.match_id.in_(match_ids))
+            }
+            
             for p in predictions_batch:
                 match_id = p['match_id']
                 league_id = p['league_id']
@@ -308,7 +374,7 @@ class PersistenceRepository:
                 # Sanitize data
                 sanitized_data = self._sanitize_json_data(data)
                 
-                record = session.query(MatchPredictionModel).filter(MatchPredictionModel.match_id == match_id).first()
+                record = existing.get(match_id)
                 if record:
                     record.league_id = league_id
                     record.data = sanitized_data
@@ -323,6 +389,7 @@ class PersistenceRepository:
                         last_updated=now
                     )
                     session.add(record)
+                    existing[match_id] = record
             
             session.commit()
             return True
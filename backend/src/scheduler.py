@@ -1,12 +1,17 @@
 import logging
 import asyncio
 import gc
+import os
+import socket
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from pytz import timezone
 from datetime import datetime
 from typing import Generator
 from src.utils.time_utils import COLOMBIA_TZ, get_today_str
+from src.utils.memory_utils import maybe_collect_garbage
+from src.infrastructure.cache.cache_service import get_cache_service
+from src.core.constants import TRAINING_LOCK_NAME, TRAINING_LOCK_TTL_SECONDS
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -14,6 +19,10 @@ logger = logging.getLogger(__name__)
 class BotScheduler:
     """Manages scheduled tasks with extreme memory efficiency for Render Free Tier."""
     
+    # Cross-process lease so restarts/extra workers and POST /train do not retrain in parallel
+    JOB_LOCK_NAME = TRAINING_LOCK_NAME
+    JOB_LOCK_TTL = TRAINING_LOCK_TTL_SECONDS
+    
     def __init__(self):
         self.scheduler = AsyncIOScheduler(timezone=COLOMBIA_TZ)
         self._job_in_progress = False
@@ -44,6 +53,12 @@ class BotScheduler:
         if self._job_in_progress:
             logger.warning("Job already in progress, skipping scheduled run")
             return
+        
+        cache = get_cache_service()
+        lock_owner = f"{socket.gethostname()}:{os.getpid()}"
+        if not cache.acquire_lock(self.JOB_LOCK_NAME, lock_owner, self.JOB_LOCK_TTL):
+            logger.warning("Job already running in another process, skipping scheduled run")
+            return
             
         try:
             self._job_in_progress = True
@@ -52,7 +67,7 @@ class BotScheduler:
             
             # Dynamic imports to keep initial memory low
             from src.api.dependencies import (
-                get_ml_training_orchestrator, get_cache_service, get_data_sources, 
+                get_ml_training_orchestrator, get_data_sources, 
                 get_prediction_service, get_statistics_service, get_audit_service, 
                 get_persistence_repository
             )
@@ -60,7 +75,6 @@ class BotScheduler:
             from src.infrastructure.data_sources.football_data_uk import LEAGUES_METADATA
             
             orchestrator = get_ml_training_orchestrator()
-            cache = get_cache_service()
             persistence_repo = get_persistence_repository()
             data_sources = get_data_sources()
             prediction_service = get_prediction_service()
@@ -69,7 +83,6 @@ class BotScheduler:
             leagues = list(LEAGUES_METADATA.keys())
             
             # 1. RETRAINING
-            import os
             if os.getenv("DISABLE_ML_TRAINING") == "true":
                  logger.info("Step 1/4: Retraining SKIPPED (DISABLE_ML_TRAINING=true)")
             else:
@@ -134,23 +147,27 @@ class BotScheduler:
                     # Unified Cache Key
                     league_cache_key = f"forecasts:league_{league_id}"
                     
+                    # Serialize once and share between both layers
+                    predictions_data = predictions_dto.model_dump()
+                    
                     # 1. Ephemeral Cache
-                    cache.set(league_cache_key, predictions_dto.dict(), cache.TTL_FORECASTS)
+                    cache.set(league_cache_key, predictions_data, cache.TTL_FORECASTS)
                     
                     # 2. Persistent Storage (PostgreSQL)
                     if persistence_repo:
-                        persistence_repo.save_training_result(league_cache_key, predictions_dto.dict())
+                        persistence_repo.save_training_result(league_cache_key, predictions_data)
                     
                     # Store individual match forecast if needed
                     for match_pred in predictions_dto.predictions:
                         match_key = f"forecasts:match_{match_pred.match.id}"
-                        cache.set(match_key, match_pred.dict(), cache.TTL_FORECASTS)
+                        cache.set(match_key, match_pred.model_dump(), cache.TTL_FORECASTS)
                         # Optional: persist individual matches? (Maybe overkill if league is persisted)
                     
                     del predictions_dto
-                    gc.collect()
+                    maybe_collect_garbage()
                     leagues_processed += 1
-                    await asyncio.sleep(0.5) 
+                    # Yield to API requests between leagues without idling the job
+                    await asyncio.sleep(0)
                 except Exception as e:
                     logger.error(f"Error processing league {league_id}: {str(e)}")
                     gc.collect()
@@ -168,6 +185,7 @@ class BotScheduler:
             gc.collect()
         finally:
             self._job_in_progress = False
+            cache.release_lock(self.JOB_LOCK_NAME, lock_owner)
             gc.collect()
     
     def start(self, run_immediate: bool = False):
@@ -0,0 +1,31 @@
+import gc
+import os
+from typing import Optional
+
+# Default resident memory (MB) above which background stages force a full collection;
+# override with the GC_RSS_THRESHOLD_MB environment variable
+GC_RSS_THRESHOLD_MB = 400
+
+def get_rss_mb() -> Optional[float]:
+    """Get the current resident set size in MB, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def maybe_collect_garbage(threshold_mb: Optional[int] = None) -> bool:
+    """
+    Run a full gc.collect() only when RSS is above threshold_mb.
+    Below it, generational GC is left to do its job instead of stalling the event loop.
+    If RSS cannot be read, collect as before.
+    """
+    if threshold_mb is None:
+        # Read at call time so a value loaded later from .env still applies
+        threshold_mb = int(os.getenv("GC_RSS_THRESHOLD_MB", str(GC_RSS_THRESHOLD_MB)))
+    rss_mb = get_rss_mb()
+    if rss_mb is not None and rss_mb < threshold_mb:
+        return False
+    gc.collect()
+    return True
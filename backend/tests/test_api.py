@@ -31,6 +31,24 @@ class TestHealthEndpoint:
         assert "timestamp" in data
 
 
+class TestReadinessEndpoint:
+    """Tests for readiness endpoint."""
+    
+    def test_ready_when_startup_has_settled(self, client):
+        """Test readiness reports ready once the app is marked ready."""
+        with patch.object(app.state, "ready", True, create=True):
+            response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+    
+    def test_not_ready_while_warming_up(self, client):
+        """Test readiness returns 503 during the startup warmup."""
+        with patch.object(app.state, "ready", False, create=True):
+            response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "warming_up"}
+
+
 class TestRootEndpoint:
     """Tests for root endpoint."""
     
@@ -72,6 +90,7 @@ class TestLeaguesEndpoints:
         """Test getting an invalid league returns 404."""
         response = client.get("/api/v1/leagues/INVALID")
         assert response.status_code == 404
+        assert response.json() == {"detail": "League not found: INVALID"}
 
 
 class TestPredictionsEndpoints:
@@ -128,3 +147,166 @@ class TestErrorHandling:
         """Test 404 on unknown route."""
         response = client.get("/api/v1/unknown")
         assert response.status_code == 404
+    
+    def test_unhandled_error_returns_error_body(self):
+        """Test unhandled exceptions become a 500 in the ErrorResponseDTO shape."""
+        client = TestClient(app, raise_server_exceptions=False)
+        with patch("src.api.routes.leagues.get_cache_service", side_effect=RuntimeError("boom")):
+            response = client.get("/api/v1/leagues")
+        
+        assert response.status_code == 500
+        assert response.json() == {
+            "error": "internal_server_error",
+            "message": "An unexpected error occurred",
+            "details": {"path": "http://testserver/api/v1/leagues"},
+        }
+
+
+class TestTrainingJobs:
+    """Tests for background training sessions."""
+    
+    @pytest.fixture
+    def training_overrides(self):
+        """Replace the learning service and orchestrator with stubs."""
+        from src.api.dependencies import get_learning_service, get_ml_training_orchestrator
+        from src.api.routes import learning
+        from src.application.services.ml_training_orchestrator import TrainingResult
+        
+        orchestrator = MagicMock()
+        orchestrator.CACHE_KEY_RESULT = "ml_training_result_data"
+        
+        async def run_training_pipeline(**kwargs):
+            return TrainingResult(
+                matches_processed=10, correct_predictions=6, accuracy=0.6,
+                total_bets=10, roi=5.0, profit_units=0.5, market_stats={},
+            )
+        
+        orchestrator.run_training_pipeline = MagicMock(side_effect=run_training_pipeline)
+        app.dependency_overrides[get_learning_service] = lambda: MagicMock()
+        app.dependency_overrides[get_ml_training_orchestrator] = lambda: orchestrator
+        learning._TRAINING_JOBS.clear()
+        with patch.object(learning, "get_cache_service"):
+            yield orchestrator
+        app.dependency_overrides.clear()
+        learning._TRAINING_JOBS.clear()
+    
+    def test_train_returns_accepted_job(self, client, training_overrides):
+        """Test POST /train answers 202 and the job completes in the background."""
+        response = client.post("/api/v1/train", json={"league_ids": ["E0"]})
+        
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status_url"] == f"/api/v1/train/jobs/{body['job_id']}"
+        
+        job = client.get(body["status_url"]).json()
+        assert job["status"] == "COMPLETED"
+        training_overrides.run_training_pipeline.assert_called_once()
+    
+    def test_full_queue_is_rejected(self, client, training_overrides):
+        """Test POST /train returns 429 while the queue is full."""
+        from src.api.routes import learning
+        
+        for _ in range(learning.MAX_PENDING_TRAINING_JOBS):
+            learning._register_training_job()
+        
+        response = client.post("/api/v1/train", json={})
+        
+        assert response.status_code == 429
+        training_overrides.run_training_pipeline.assert_not_called()
+    
+    def test_job_waits_for_scheduled_run_lease(self, client, training_overrides):
+        """Test a queued session only trains once the scheduler's lease is free."""
+        from src.api.routes import learning
+        from src.core.constants import TRAINING_LOCK_NAME
+        
+        cache = learning.get_cache_service.return_value
+        cache.acquire_lock.side_effect = [False, True]
+        with patch.object(learning, "TRAINING_LOCK_POLL_SECONDS", 0):
+            response = client.post("/api/v1/train", json={"league_ids": ["E0"]})
+        
+        job = client.get(response.json()["status_url"]).json()
+        assert job["status"] == "COMPLETED"
+        assert cache.acquire_lock.call_count == 2
+        training_overrides.run_training_pipeline.assert_called_once()
+        owner = cache.acquire_lock.call_args.args[1]
+        cache.release_lock.assert_called_once_with(TRAINING_LOCK_NAME, owner)
+    
+    def test_run_now_rejected_while_session_pending(self, client):
+        """Test /train/run-now returns 409 while a POST /train session is queued."""
+        from src.api.routes import learning
+        
+        learning._register_training_job()
+        try:
+            response = client.post("/api/v1/train/run-now")
+        finally:
+            learning._TRAINING_JOBS.clear()
+        
+        assert response.status_code == 409
+    
+    def test_run_now_rejected_while_lease_is_held(self, client):
+        """Test /train/run-now returns 409 while another process holds the training lease."""
+        from src.api.routes import learning
+        from src.core.constants import TRAINING_LOCK_NAME
+        
+        with patch.object(learning, "get_cache_service") as get_cache:
+            get_cache.return_value.is_locked.return_value = True
+            response = client.post("/api/v1/train/run-now")
+        
+        assert response.status_code == 409
+        get_cache.return_value.is_locked.assert_called_once_with(TRAINING_LOCK_NAME)
+    
+    def test_running_job_reports_pipeline_progress(self, client):
+        """Test polling a running job returns the orchestrator's latest step."""
+        from src.api.dependencies import get_cache_service
+        from src.api.routes import learning
+
+        job = learning._register_training_job()
+        job.status = "IN_PROGRESS"
+        cache = MagicMock()
+        cache.get.return_value = "Analizando partidos día por día..."
+        app.dependency_overrides[get_cache_service] = lambda: cache
+        try:
+            response = client.get(f"/api/v1/train/jobs/{job.job_id}")
+        finally:
+            app.dependency_overrides.clear()
+            learning._TRAINING_JOBS.clear()
+
+        assert response.json()["message"] == "Analizando partidos día por día..."
+        cache.get.assert_called_once_with(learning.TRAINING_PROGRESS_KEY)
+
+    def test_unknown_job_returns_404(self, client):
+        """Test polling an unknown job id returns 404."""
+        response = client.get("/api/v1/train/jobs/missing")
+        assert response.status_code == 404
+
+
+class TestBackgroundTasks:
+    """Tests for lifespan background task tracking."""
+    
+    async def test_task_is_tracked_until_done(self):
+        """Test spawned tasks stay referenced on app.state until they finish."""
+        import asyncio
+        from src.api.main import spawn_background_task
+        
+        release = asyncio.Event()
+        with patch.object(app.state, "bg_tasks", set(), create=True):
+            task = spawn_background_task(app, release.wait())
+            assert task in app.state.bg_tasks
+            
+            release.set()
+            await task
+            await asyncio.sleep(0)
+            
+            assert app.state.bg_tasks == set()
+
+
+class TestDependencies:
+    """Tests for dependency factories."""
+    
+    def test_data_sources_container_is_reused(self):
+        """Test get_data_sources returns one shared container of singleton sources."""
+        from src.api.dependencies import get_data_sources, get_football_data_uk
+        
+        data_sources = get_data_sources()
+        assert get_data_sources() is data_sources
+        assert data_sources.football_data_uk is get_football_data_uk()
@@ -0,0 +1,100 @@
+"""
+Unit Tests for AuditService
+
+Tests league coverage detection over the cached training match history.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+from src.core.constants import DEFAULT_LEAGUES
+from src.domain.services.audit_service import AuditService
+
+
+def _history_entry(league_id: str, match_date: str) -> dict:
+    return {
+        "match_id": f"{league_id}_20250101_home_away",
+        "match_date": match_date,
+        "picks": [{"market_label": "1X2", "probability": 0.6, "confidence": 0.7, "result": "WIN"}],
+    }
+
+
+@pytest.fixture
+def orchestrator():
+    """Orchestrator stub exposing only what the audit needs."""
+    stub = MagicMock()
+    stub.CACHE_KEY_RESULT = "ml_training_result_data"
+    return stub
+
+
+async def _run_audit(orchestrator, match_history):
+    cache = MagicMock()
+    cache.get.return_value = {"match_history": match_history}
+    with patch("src.domain.services.audit_service.get_cache_service", return_value=cache):
+        return await AuditService(orchestrator).audit_and_fix(fix_missing=False)
+
+
+class TestAuditCoverage:
+    """Tests for the per-league freshness check."""
+
+    async def test_recent_matches_mark_league_as_covered(self, orchestrator):
+        """Naive, offset and 'Z' suffixed ISO dates all count as recent."""
+        recent = datetime.now() - timedelta(days=2)
+        history = [
+            _history_entry(DEFAULT_LEAGUES[0], recent.isoformat()),
+            _history_entry(DEFAULT_LEAGUES[1], recent.isoformat() + "-05:00"),
+            _history_entry(DEFAULT_LEAGUES[2], recent.strftime("%Y-%m-%dT%H:%M:%SZ")),
+        ]
+
+        report = await _run_audit(orchestrator, history)
+
+        for league_id in DEFAULT_LEAGUES[:3]:
+            assert league_id not in report["missing_leagues"]
+
+    async def test_malformed_entries_are_skipped(self, orchestrator):
+        """Entries without an id or date do not break the coverage scan."""
+        recent = datetime.now().isoformat()
+        history = [
+            {"match_date": recent},
+            {"match_id": f"{DEFAULT_LEAGUES[0]}_20250101_home_away"},
+            _history_entry(DEFAULT_LEAGUES[1], recent),
+        ]
+
+        report = await _run_audit(orchestrator, history)
+
+        assert DEFAULT_LEAGUES[0] in report["missing_leagues"]
+        assert DEFAULT_LEAGUES[1] not in report["missing_leagues"]
+
+    async def test_stale_matches_mark_league_as_missing(self, orchestrator):
+        """Matches older than 30 days do not count towards freshness."""
+        stale = datetime.now() - timedelta(days=45)
+        history = [_history_entry(DEFAULT_LEAGUES[0], stale.isoformat())]
+
+        report = await _run_audit(orchestrator, history)
+
+        assert DEFAULT_LEAGUES[0] in report["missing_leagues"]
+        assert report["status"] == "repairing"
+
+
+class TestAuditIntegrity:
+    """Tests for the sampled pick integrity check."""
+
+    async def test_complete_picks_report_no_issues(self, orchestrator):
+        """Picks carrying every required field are not flagged."""
+        recent = datetime.now().isoformat()
+        history = [_history_entry(league_id, recent) for league_id in DEFAULT_LEAGUES]
+
+        report = await _run_audit(orchestrator, history)
+
+        assert report["integrity_issues"] == 0
+        assert report["status"] == "healthy"
+
+    async def test_incomplete_picks_are_flagged(self, orchestrator):
+        """Picks missing required fields degrade the report."""
+        entry = _history_entry(DEFAULT_LEAGUES[0], datetime.now().isoformat())
+        entry["picks"] = [{"market_label": "1X2"}]
+
+        report = await _run_audit(orchestrator, [entry])
+
+        assert report["integrity_issues"] > 0
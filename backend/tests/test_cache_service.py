@@ -0,0 +1,84 @@
+"""
+Unit Tests for CacheService
+
+Tests batched lookups and the cross-process leases kept in the disk cache.
+"""
+
+import pytest
+
+from src.infrastructure.cache.cache_service import CacheService
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Cache service writing its disk layer under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return CacheService()
+
+
+class TestLocks:
+    """Tests for acquire_lock / release_lock / is_locked."""
+
+    def test_second_owner_cannot_acquire_held_lock(self, cache):
+        """A held lease is not granted to another owner."""
+        assert cache.acquire_lock("job", "host:1", ttl_seconds=60) is True
+        assert cache.acquire_lock("job", "host:2", ttl_seconds=60) is False
+
+    def test_release_frees_the_lock(self, cache):
+        """Once released, the lease can be taken again."""
+        cache.acquire_lock("job", "host:1", ttl_seconds=60)
+
+        assert cache.release_lock("job", "host:1") is True
+        assert cache.acquire_lock("job", "host:2", ttl_seconds=60) is True
+
+    def test_only_the_owner_can_release(self, cache):
+        """Releasing with a different owner leaves the lease in place."""
+        cache.acquire_lock("job", "host:1", ttl_seconds=60)
+
+        assert cache.release_lock("job", "host:2") is False
+        assert cache.acquire_lock("job", "host:2", ttl_seconds=60) is False
+
+    def test_lock_is_shared_across_instances(self, cache):
+        """Another process's cache service on the same directory sees the lease."""
+        other = CacheService()
+
+        cache.acquire_lock("job", "host:1", ttl_seconds=60)
+
+        assert other.acquire_lock("job", "host:2", ttl_seconds=60) is False
+
+    def test_is_locked_reflects_lease(self, cache):
+        """is_locked reports a held lease without taking it."""
+        assert cache.is_locked("job") is False
+
+        cache.acquire_lock("job", "host:1", ttl_seconds=60)
+        assert cache.is_locked("job") is True
+
+        cache.release_lock("job", "host:1")
+        assert cache.is_locked("job") is False
+
+
+class TestGetMany:
+    """Tests for batched lookups."""
+
+    def test_returns_only_present_keys(self, cache):
+        """Hits from memory are returned and missing keys are omitted."""
+        cache.set("a", 1, ttl_seconds=60)
+        cache.set("b", {"x": 2}, ttl_seconds=60)
+
+        assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"x": 2}}
+
+    def test_reads_disk_layer_and_promotes_to_memory(self, cache):
+        """Keys only on disk are fetched in the batch and cached in memory."""
+        cache.disk_provider.set("disk_only", "value", 60)
+
+        assert cache.get_many(["disk_only"]) == {"disk_only": "value"}
+        assert "disk_only" in cache._memory_cache
+
+    def test_counts_hits_and_misses(self, cache):
+        """Each requested key counts as exactly one hit or miss."""
+        cache.set("a", 1, ttl_seconds=60)
+        cache.disk_provider.set("b", 2, 60)
+
+        cache.get_many(["a", "b", "c"])
+
+        assert (cache._hits, cache._misses) == (2, 1)
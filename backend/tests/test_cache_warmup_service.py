@@ -0,0 +1,86 @@
+"""
+Unit Tests for CacheWarmupService
+
+Tests the single-flight guard and the concurrent priority warmup.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+from src.domain.services.cache_warmup_service import CacheWarmupService
+
+
+@pytest.fixture
+def use_case():
+    """Predictions use case stub that takes a moment to finish."""
+    stub = MagicMock()
+
+    async def execute(league_id, limit=20):
+        await asyncio.sleep(0.01)
+
+    stub.execute = MagicMock(side_effect=execute)
+    return stub
+
+
+def _warmup_service(use_case) -> CacheWarmupService:
+    with patch("src.domain.services.cache_warmup_service.GetPredictionsUseCase", return_value=use_case):
+        return CacheWarmupService(
+            data_sources=MagicMock(),
+            prediction_service=MagicMock(),
+            statistics_service=MagicMock(),
+        )
+
+
+class TestSingleFlightWarmup:
+    """Tests for the per-league single-flight guard."""
+
+    async def test_concurrent_warmups_share_one_execution(self, use_case):
+        """Two services warming the same league at once run it only once."""
+        first, second = _warmup_service(use_case), _warmup_service(use_case)
+
+        await asyncio.gather(first._warm_up_league("E0"), second._warm_up_league("E0"))
+
+        use_case.execute.assert_called_once_with("E0", limit=30)
+
+    async def test_sequential_warmups_run_again(self, use_case):
+        """Once a warmup finishes, the next one executes normally."""
+        service = _warmup_service(use_case)
+
+        await service._warm_up_league("E0")
+        await service._warm_up_league("E0")
+
+        assert use_case.execute.call_count == 2
+
+    async def test_different_leagues_run_independently(self, use_case):
+        """The guard is keyed per league."""
+        service = _warmup_service(use_case)
+
+        await asyncio.gather(service._warm_up_league("E0"), service._warm_up_league("SP1"))
+
+        assert use_case.execute.call_count == 2
+
+
+class TestPriorityWarmup:
+    """Tests for the concurrent priority league warmup."""
+
+    async def test_warms_every_league(self, use_case):
+        """Each priority league is executed once."""
+        service = _warmup_service(use_case)
+
+        await service.warm_up_priority_leagues(["E0", "SP1", "D1"])
+
+        assert sorted(call.args[0] for call in use_case.execute.call_args_list) == ["D1", "E0", "SP1"]
+
+    async def test_failing_league_does_not_stop_the_others(self, use_case):
+        """An error in one league is logged and the rest still warm up."""
+        async def execute(league_id, limit=20):
+            if league_id == "SP1":
+                raise RuntimeError("provider down")
+
+        use_case.execute.side_effect = execute
+        service = _warmup_service(use_case)
+
+        await service.warm_up_priority_leagues(["E0", "SP1", "D1"])
+
+        assert use_case.execute.call_count == 3
@@ -0,0 +1,101 @@
+"""
+Unit Tests for FootballDataUKSource
+
+Tests the cache of parsed seasons in get_historical_matches.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.entities import Match, Team, League
+from src.infrastructure.data_sources.football_data_uk import FootballDataUKSource, FootballDataConfig
+
+
+def make_match() -> Match:
+    """Create a parsed CSV match."""
+    return Match(
+        id="E0_1",
+        home_team=Team(id="arsenal", name="Arsenal"),
+        away_team=Team(id="chelsea", name="Chelsea"),
+        league=League(id="E0", name="Premier League", country="England"),
+        match_date=datetime(2024, 9, 1, tzinfo=timezone.utc),
+        home_goals=2,
+        away_goals=1,
+    )
+
+
+@pytest.fixture
+def source():
+    """Source whose download and parse steps are stubbed out."""
+    source = FootballDataUKSource(FootballDataConfig(cache_ttl_seconds=3600))
+    frame = SimpleNamespace(empty=False)
+    source.download_csv = AsyncMock(
+        side_effect=lambda league, season, client=None: (frame, datetime.now(timezone.utc))
+    )
+    source.parse_matches = MagicMock(side_effect=lambda df, league, ts: [make_match()])
+    return source
+
+
+class TestSeasonCache:
+    """Tests for reusing parsed seasons across calls."""
+
+    async def test_second_call_reuses_parsed_seasons(self, source):
+        """A fresh cached season is neither downloaded nor parsed again."""
+        await source.get_historical_matches("E0", seasons=["2425", "2324"])
+        matches = await source.get_historical_matches("E0", seasons=["2425", "2324"])
+
+        assert len(matches) == 2
+        assert source.download_csv.await_count == 2
+        assert source.parse_matches.call_count == 2
+
+    async def test_force_refresh_bypasses_cache(self, source):
+        """force_refresh downloads the season again."""
+        await source.get_historical_matches("E0", seasons=["2425"])
+        await source.get_historical_matches("E0", seasons=["2425"], force_refresh=True)
+
+        assert source.download_csv.await_count == 2
+
+    async def test_expired_current_season_is_downloaded_again(self, source):
+        """Current-season entries older than the TTL are refreshed."""
+        season = source._get_current_season()
+        await source.get_historical_matches("E0", seasons=[season])
+        matches, _ = source._cache[f"E0_{season}"]
+        source._cache[f"E0_{season}"] = (matches, datetime.now(timezone.utc) - timedelta(hours=2))
+
+        await source.get_historical_matches("E0", seasons=[season])
+
+        assert source.download_csv.await_count == 2
+
+    async def test_past_season_does_not_expire(self, source):
+        """Finished seasons are kept past the TTL."""
+        await source.get_historical_matches("E0", seasons=["2324"])
+        matches, _ = source._cache["E0_2324"]
+        source._cache["E0_2324"] = (matches, datetime.now(timezone.utc) - timedelta(days=2))
+
+        await source.get_historical_matches("E0", seasons=["2324"])
+
+        assert source.download_csv.await_count == 1
+
+    async def test_callers_cannot_grow_the_cache(self, source):
+        """The returned list is a copy of the cached one."""
+        first = await source.get_historical_matches("E0", seasons=["2425"])
+        first.append(make_match())
+
+        second = await source.get_historical_matches("E0", seasons=["2425"])
+
+        assert len(second) == 1
+
+    async def test_enriching_a_match_leaves_cache_untouched(self, source):
+        """Matches are handed out as copies, so in-place enrichment does not leak."""
+        first = await source.get_historical_matches("E0", seasons=["2425"])
+        first[0].home_corners = 7
+        first[0].data_fetched_at = datetime.now(timezone.utc)
+
+        cached, _ = source._cache["E0_2425"]
+        second = await source.get_historical_matches("E0", seasons=["2425"])
+
+        assert cached[0].home_corners is None
+        assert cached[0].data_fetched_at is None
+        assert second[0].home_corners is None
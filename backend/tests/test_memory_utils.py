@@ -0,0 +1,50 @@
+"""
+Unit Tests for memory_utils
+
+Tests the RSS-gated garbage collection helper.
+"""
+
+from unittest.mock import patch
+
+from src.utils import memory_utils
+
+
+class TestMaybeCollectGarbage:
+    """Tests for maybe_collect_garbage."""
+
+    def test_skips_collection_below_threshold(self):
+        """No full collection while RSS is under the threshold."""
+        with patch.object(memory_utils, "get_rss_mb", return_value=100.0), \
+             patch.object(memory_utils.gc, "collect") as collect:
+            assert memory_utils.maybe_collect_garbage(threshold_mb=400) is False
+
+        collect.assert_not_called()
+
+    def test_collects_above_threshold(self):
+        """A full collection runs once RSS reaches the threshold."""
+        with patch.object(memory_utils, "get_rss_mb", return_value=450.0), \
+             patch.object(memory_utils.gc, "collect") as collect:
+            assert memory_utils.maybe_collect_garbage(threshold_mb=400) is True
+
+        collect.assert_called_once()
+
+    def test_collects_when_rss_is_unknown(self):
+        """Platforms without /proc keep the previous unconditional behaviour."""
+        with patch.object(memory_utils, "get_rss_mb", return_value=None), \
+             patch.object(memory_utils.gc, "collect") as collect:
+            assert memory_utils.maybe_collect_garbage(threshold_mb=400) is True
+
+        collect.assert_called_once()
+
+    def test_threshold_env_is_read_at_call_time(self):
+        """A GC_RSS_THRESHOLD_MB set after import (e.g. from .env) is honoured."""
+        with patch.dict(memory_utils.os.environ, {"GC_RSS_THRESHOLD_MB": "500"}), \
+             patch.object(memory_utils, "get_rss_mb", return_value=450.0), \
+             patch.object(memory_utils.gc, "collect") as collect:
+            assert memory_utils.maybe_collect_garbage() is False
+
+        collect.assert_not_called()
+
+    def test_reads_current_rss(self):
+        """RSS is reported as a positive number on Linux."""
+        assert memory_utils.get_rss_mb() > 0
@@ -0,0 +1,121 @@
+"""
+Unit Tests for PersistenceRepository
+
+Exercises the repository against a temporary SQLite database.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from sqlalchemy import inspect
+
+from src.infrastructure.database.database_service import DatabaseService
+from src.infrastructure.repositories.persistence_repository import PersistenceRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository bound to a throwaway SQLite file."""
+    db_service = DatabaseService(f"sqlite:///{tmp_path / 'test.db'}")
+    repository = PersistenceRepository(db_service=db_service)
+    repository.create_tables()
+    return repository
+
+
+class TestCreateTables:
+    """Tests for schema creation on startup."""
+
+    def test_second_call_skips_schema_check(self, repo):
+        """Once verified, create_tables does not touch the database again."""
+        with patch("src.infrastructure.database.database_service.inspect") as inspect_mock:
+            repo.create_tables()
+
+        inspect_mock.assert_not_called()
+
+    def test_missing_tables_are_created(self, tmp_path):
+        """A fresh database gets every mapped table."""
+        db_service = DatabaseService(f"sqlite:///{tmp_path / 'fresh.db'}")
+
+        db_service.create_tables()
+
+        assert set(inspect(db_service.engine).get_table_names()) >= {
+            "training_results", "match_predictions", "api_response_cache"
+        }
+
+
+class TestBulkSavePredictions:
+    """Tests for batched match prediction writes."""
+
+    def test_inserts_and_updates_in_one_batch(self, repo):
+        """New rows are inserted and existing rows are updated in place."""
+        repo.save_match_prediction("m1", "E0", {"value": 1})
+
+        saved = repo.bulk_save_predictions([
+            {"match_id": "m1", "league_id": "E0", "data": {"value": 2}},
+            {"match_id": "m2", "league_id": "E0", "data": {"kickoff": datetime(2025, 1, 1, 15, 0)}},
+        ])
+
+        assert saved is True
+        assert repo.get_match_prediction("m1") == {"value": 2}
+        assert repo.get_match_prediction("m2") == {"kickoff": "2025-01-01T15:00:00"}
+        assert len(repo.get_league_predictions("E0")) == 2
+
+    def test_duplicate_ids_in_batch_keep_last_value(self, repo):
+        """Repeated match ids within a batch do not violate the primary key."""
+        saved = repo.bulk_save_predictions([
+            {"match_id": "m1", "league_id": "E0", "data": {"value": 1}},
+            {"match_id": "m1", "league_id": "E0", "data": {"value": 3}},
+        ])
+
+        assert saved is True
+        assert repo.get_match_prediction("m1") == {"value": 3}
+
+    def test_empty_batch_is_a_no_op(self, repo):
+        """An empty batch succeeds without touching the database."""
+        assert repo.bulk_save_predictions([]) is True
+        assert repo.get_all_active_predictions() == []
+
+
+class TestBulkSaveTrainingResults:
+    """Tests for batched training result writes."""
+
+    def test_upserts_all_keys(self, repo):
+        """Existing keys are overwritten and new keys are created."""
+        repo.save_training_result("picks:match_1", {"picks": []})
+
+        saved = repo.bulk_save_training_results({
+            "picks:match_1": {"picks": ["home"]},
+            "picks:match_2": {"picks": ["away"]},
+        })
+
+        assert saved is True
+        assert repo.get_training_result("picks:match_1") == {"picks": ["home"]}
+        assert repo.get_training_result("picks:match_2") == {"picks": ["away"]}
+
+    def test_empty_mapping_is_a_no_op(self, repo):
+        """An empty mapping succeeds without writing anything."""
+        assert repo.bulk_save_training_results({}) is True
+
+    def test_overwrite_refreshes_last_updated(self, repo):
+        """Upserted rows get a new timestamp along with the new data."""
+        repo.bulk_save_training_results({"latest_daily": {"run": 1}})
+        first_update = repo.get_last_updated("latest_daily")
+
+        repo.bulk_save_training_results({"latest_daily": {"run": 2}})
+
+        assert repo.get_training_result("latest_daily") == {"run": 2}
+        assert repo.get_last_updated("latest_daily") > first_update
+
+
+class TestSanitizeJsonData:
+    """Tests for JSON normalization before writes."""
+
+    def test_converts_datetimes_and_non_string_keys(self, repo):
+        """Datetimes become ISO strings and keys become strings, as with the json module."""
+        data = {"kickoff": datetime(2025, 1, 1, 15, 0, 30, 250), 1: (0.5, None)}
+
+        assert repo._sanitize_json_data(data) == {
+            "kickoff": "2025-01-01T15:00:30.000250",
+            "1": [0.5, None],
+        }
@@ -1,5 +1,7 @@
+import os
 import pytest
 from datetime import datetime
+from unittest.mock import MagicMock
 from src.domain.services.picks_service import PicksService
 from src.domain.entities.entities import Match, Team, League, TeamStatistics
 from src.domain.value_objects.value_objects import LeagueAverages
@@ -199,3 +201,45 @@ def test_picks_are_sorted_by_probability(picks_service, sample_match):
     # Check if the list is sorted by probability descending
     probabilities = [p.probability for p in suggested_picks]
     assert probabilities == sorted(probabilities, reverse=True), "Picks are not sorted by probability descending."
+
+
+class TestMLModelCache:
+    """Tests for the process-wide ML model cache."""
+
+    @pytest.fixture
+    def fake_joblib(self, monkeypatch):
+        import src.domain.services.picks_service as picks_module
+
+        loader = MagicMock()
+        loader.load.side_effect = lambda path: object()
+        monkeypatch.setattr(picks_module, "joblib", loader, raising=False)
+        monkeypatch.setattr(picks_module, "ML_AVAILABLE", True)
+        monkeypatch.setattr(picks_module, "_ML_MODEL_CACHE", {})
+        return loader
+
+    def test_model_is_loaded_once_per_file_version(self, fake_joblib, tmp_path):
+        """Instances share the loaded model until the file changes."""
+        model_file = tmp_path / "model.joblib"
+        model_file.write_bytes(b"v1")
+        service = PicksService()
+        fake_joblib.load.reset_mock()
+
+        first = service._load_ml_model_safely(str(model_file))
+        second = service._load_ml_model_safely(str(model_file))
+
+        assert first is second
+        assert fake_joblib.load.call_count == 1
+
+        os.utime(model_file, (0, 0))
+        third = service._load_ml_model_safely(str(model_file))
+
+        assert third is not first
+        assert fake_joblib.load.call_count == 2
+
+    def test_missing_file_returns_none(self, fake_joblib, tmp_path):
+        """A missing model file is not an error."""
+        service = PicksService()
+        fake_joblib.load.reset_mock()
+
+        assert service._load_ml_model_safely(str(tmp_path / "missing.joblib")) is None
+        fake_joblib.load.assert_not_called()
@@ -165,7 +165,30 @@ class TestPredictionService:
         
         # With 1.4 expected total goals, under 2.5 should be more likely
         assert under > over
-    
+
+    def test_score_grid_probabilities_match_full_grid(self, service):
+        """Test prefix-sum probabilities against a brute-force score grid."""
+        home_probs = service._get_poisson_distribution(1.7, 10)
+        away_probs = service._get_poisson_distribution(0.9, 10)
+        grid = [
+            (h, a, home_probs[h] * away_probs[a])
+            for h in range(11) for a in range(11)
+        ]
+
+        total = sum(p for _, _, p in grid)
+        home_win, draw, away_win = service.calculate_outcome_probabilities(1.7, 0.9)
+        assert home_win == pytest.approx(sum(p for h, a, p in grid if h > a) / total)
+        assert draw == pytest.approx(sum(p for h, a, p in grid if h == a) / total)
+        assert away_win == pytest.approx(sum(p for h, a, p in grid if h < a) / total)
+
+        for threshold in (0.5, 2.5, 4.5):
+            _, under = service.calculate_over_under_probability(1.7, 0.9, threshold=threshold)
+            assert under == pytest.approx(sum(p for h, a, p in grid if h + a <= threshold))
+
+        line, home_spread, _ = service.calculate_handicap_probabilities(1.7, 0.9)
+        expected = sum(p for h, a, p in grid if h + line > a)
+        assert home_spread == pytest.approx(round(expected, 4))
+
     def test_adjust_with_odds(self, service):
         """Test odds adjustment."""
         from src.domain.value_objects.value_objects import Odds
@@ -0,0 +1,61 @@
+"""
+Unit Tests for StatisticsService
+
+Tests batched team statistics against the per-team calculation.
+"""
+
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from src.domain.entities.entities import Team, League, Match
+from src.domain.services.statistics_service import StatisticsService
+
+
+LEAGUE = League(id="E0", name="Premier League", country="England")
+
+
+def _match(index: int, home: str, away: str, home_goals=None, away_goals=None) -> Match:
+    return Match(
+        id=f"m{index}",
+        home_team=Team(id=home.lower(), name=home),
+        away_team=Team(id=away.lower(), name=away),
+        league=LEAGUE,
+        match_date=datetime(2025, 1, 1) + timedelta(days=index),
+        home_goals=home_goals,
+        away_goals=away_goals,
+        status="FT" if home_goals is not None else "NS",
+        home_corners=5 if home_goals is not None else None,
+        away_corners=3 if home_goals is not None else None,
+    )
+
+
+HISTORY = [
+    _match(0, "Arsenal", "Chelsea", 2, 1),
+    _match(1, "Liverpool", "Arsenal", 0, 0),
+    _match(2, "Chelsea", "Liverpool", 1, 3),
+    _match(3, "Arsenal", "Everton", 4, 0),
+    _match(4, "Everton", "Chelsea"),
+]
+
+
+class TestTeamStatisticsForTeams:
+    """Tests for calculate_team_statistics_for_teams."""
+
+    def test_matches_per_team_calculation(self):
+        """Each team's stats equal those from calculate_team_statistics."""
+        teams = ["Arsenal", "Chelsea", "Liverpool", "Everton", "Unknown"]
+
+        batched = StatisticsService.calculate_team_statistics_for_teams(teams, HISTORY)
+
+        for team in teams:
+            expected = StatisticsService.calculate_team_statistics(team, HISTORY)
+            assert asdict(batched[team]) == asdict(expected)
+
+    def test_duplicate_names_are_computed_once(self):
+        """Repeated team names map to a single entry."""
+        batched = StatisticsService.calculate_team_statistics_for_teams(
+            ["Arsenal", "Chelsea", "Arsenal"], HISTORY
+        )
+
+        assert list(batched) == ["Arsenal", "Chelsea"]
+        assert batched["Arsenal"].matches_played == 3
@@ -0,0 +1,78 @@
+"""
+Unit Tests for TrainingDataService
+
+Tests the concurrent per-league CSV fetch.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from src.application.services.training_data_service import TrainingDataService
+
+
+def _match(league_id: str, days_ago: int) -> SimpleNamespace:
+    return SimpleNamespace(league_id=league_id, match_date=datetime.now() - timedelta(days=days_ago))
+
+
+class FakeFootballDataUK:
+    """CSV source stub that records how many leagues download at once."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.active = 0
+        self.peak = 0
+        self.since = []
+
+    async def get_historical_matches(self, league_id, seasons=None, force_refresh=False, since=None):
+        self.since.append(since)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if league_id in self.failing:
+            raise RuntimeError("download failed")
+        return [_match(league_id, 1)]
+
+
+async def _fetch(csv_source, leagues, **kwargs):
+    enrichment = MagicMock()
+    enrichment.merge_matches.side_effect = lambda base, extra: list(base) + list(extra)
+    service = TrainingDataService(SimpleNamespace(football_data_uk=csv_source), enrichment)
+
+    github = MagicMock()
+    github.return_value.get_finished_matches.side_effect = lambda **kwargs: asyncio.sleep(0, result=[])
+    with patch("src.infrastructure.data_sources.github_dataset.LocalGithubDataSource", github), \
+         patch("src.infrastructure.data_sources.espn.ESPNSource", side_effect=RuntimeError("offline")):
+        return await service.fetch_comprehensive_training_data(leagues, **kwargs)
+
+
+class TestCsvFetch:
+    """Tests for the per-league CSV download stage."""
+
+    async def test_fetches_leagues_concurrently_within_limit(self):
+        """Leagues download in parallel, never more than the configured bound."""
+        csv_source = FakeFootballDataUK()
+        leagues = [f"L{i}" for i in range(10)]
+
+        matches = await _fetch(csv_source, leagues)
+
+        assert sorted(m.league_id for m in matches) == sorted(leagues)
+        assert 1 < csv_source.peak <= TrainingDataService.MAX_CONCURRENT_LEAGUE_FETCHES
+
+    async def test_failing_league_is_skipped(self):
+        """A league whose download fails does not drop the others."""
+        csv_source = FakeFootballDataUK(failing={"SP1"})
+
+        matches = await _fetch(csv_source, ["E0", "SP1", "D1"])
+
+        assert sorted(m.league_id for m in matches) == ["D1", "E0"]
+
+    async def test_window_start_is_passed_to_the_source(self):
+        """The CSV source is told the window start so it can skip old seasons."""
+        csv_source = FakeFootballDataUK()
+
+        await _fetch(csv_source, ["E0"], start_date="2025-09-01")
+
+        assert [(d.year, d.month, d.day) for d in csv_source.since] == [(2025, 9, 1)]